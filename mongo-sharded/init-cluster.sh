@@ -0,0 +1,40 @@
+#!/usr/bin/env bash
+# Inicia los replica sets, registra los shards y shardea las colecciones por usuario.
+set -euo pipefail
+
+DB="${MONGODB_DB_NAME:-interview_ready}"
+
+wait_for() {
+  until mongosh --quiet --host "$1" --eval 'db.adminCommand({ping: 1}).ok' >/dev/null 2>&1; do sleep 1; done
+}
+
+initiate() {
+  # $1 host:port, $2 replica set, $3 "true" si es config server
+  wait_for "$1"
+  mongosh --quiet --host "$1" --eval "
+    try { rs.status() } catch (e) {
+      rs.initiate({_id: '$2', configsvr: $3, members: [{_id: 0, host: '$1'}]})
+    }"
+}
+
+initiate configsvr:27019 cfg true
+initiate shard1:27018 shard1 false
+initiate shard2:27018 shard2 false
+
+wait_for mongos:27017
+mongosh --quiet --host mongos:27017 --eval "
+  const shards = db.adminCommand({listShards: 1}).shards.map(s => s._id);
+  if (!shards.includes('shard1')) sh.addShard('shard1/shard1:27018');
+  if (!shards.includes('shard2')) sh.addShard('shard2/shard2:27018');
+
+  sh.enableSharding('$DB');
+  // Entrevistas (y su archivo): hashed para repartir usuarios nuevos entre shards
+  sh.shardCollection('$DB.interview_ready', {userId: 'hashed'});
+  sh.shardCollection('$DB.interview_ready_archive', {userId: 'hashed'});
+  // Colecciones con índice único por usuario: la shard key por rangos debe ser prefijo del índice único
+  sh.shardCollection('$DB.user_interview_stats', {userId: 1});
+  sh.shardCollection('$DB.llm_usage', {userId: 1, day: 1});
+  sh.shardCollection('$DB.precomputed_question_sets', {user_id: 'hashed'});
+  // idempotency_records, rate_limit_buckets y single_flight_leases son pequeñas (TTL) y se quedan sin shardear
+  sh.status();
+"
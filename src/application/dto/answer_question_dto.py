@@ -0,0 +1,15 @@
+from pydantic import BaseModel, field_validator
+
+from infrastructure.config.app_config import config
+
+
+class AnswerQuestionDTO(BaseModel):
+    user_id: str
+    user_response: str
+    @field_validator("user_response")
+    def validate_user_response(cls, v):
+        # Las respuestas vacías sí se aceptan: el feedback (o el pre-clasificador) las trata como EMPTY
+        v = v.strip()
+        if len(v) > config.answer_max_chars:
+            raise ValueError(f"user_response no puede superar {config.answer_max_chars} caracteres")
+        return v
@@ -8,6 +8,8 @@ class CreateInterviewReadyDTO(BaseModel):
      user_specialization: str
      type:str
      question_number: QuestionCount
+     # Adaptativo: question_number pasa a ser el máximo y la entrevista puede terminar antes
+     adaptive: bool = False
      @field_validator('user_seniority')
      def validate_seniority(cls, v):
         allowed_seniorities = ['junior', 'mid', 'senior', 'lead', 'principal']
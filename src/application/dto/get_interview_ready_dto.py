@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import List
+from pydantic import BaseModel,field_validator
+from typing import List,Optional
 
 
 
@@ -21,3 +21,21 @@ class GetInterviewReadyDto(BaseModel):
     limit: int
     skip: int
 
+
+
+class GetBulkInterviewReadyRequestDto(BaseModel):
+    user_ids: List[str]
+    limit_per_user: Optional[int] = None
+    @field_validator("user_ids")
+    def validate_user_ids(cls, v):
+        unique_ids = list(dict.fromkeys(user_id for user_id in v if user_id))
+        if not unique_ids:
+            raise ValueError("user_ids debe contener al menos un usuario")
+        return unique_ids
+class UserInterviewHistoryDto(BaseModel):
+    user_id: str
+    interviews: List[InterviewReadyDto]
+    total: int
+class GetBulkInterviewReadyDto(BaseModel):
+    users: List[UserInterviewHistoryDto]
+    limit_per_user: int
@@ -0,0 +1,16 @@
+from pydantic import BaseModel
+from typing import Dict, List
+
+
+class CompetencyAverageDto(BaseModel):
+    name: str
+    average_score: float
+    count: int
+class GetUserInterviewStatsDto(BaseModel):
+    user_id: str
+    total_points: int
+    interviews_completed: int
+    average_overall_score: float
+    interviews_by_type: Dict[str, int]
+    competencies: List[CompetencyAverageDto]
+    updated_at: str
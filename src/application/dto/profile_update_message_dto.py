@@ -0,0 +1,15 @@
+from pydantic import AliasChoices, BaseModel, Field, field_validator
+
+
+class ProfileUpdateMessageDto(BaseModel):
+    """Mensaje de la cola profile_updates; acepta los nombres de campo del servicio de perfiles y los de esta API."""
+    user_id: str = Field(validation_alias=AliasChoices("user_id", "userId"))
+    user_seniority: str = Field(validation_alias=AliasChoices("user_seniority", "seniority"))
+    user_specialization: str = Field(validation_alias=AliasChoices("user_specialization", "specialization"))
+
+    @field_validator('user_seniority')
+    def validate_seniority(cls, v):
+        allowed_seniorities = ['junior', 'mid', 'senior', 'lead', 'principal']
+        if v.lower() not in allowed_seniorities:
+            raise ValueError(f"Seniority debe ser uno de: {allowed_seniorities}")
+        return v.lower()
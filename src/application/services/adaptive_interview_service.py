@@ -0,0 +1,121 @@
+import logging
+import math
+from typing import List
+
+from application.services.question_batch_generator import QuestionBatchGenerator
+from domain.entities.interview_ready import AdaptiveState, InterviewReady, Question
+from infrastructure.external_services.interview_prompts import DIFFICULTY_TIERS, difficulty_counts
+
+logger = logging.getLogger(__name__)
+
+CONTINUE = "continue"
+NEXT_TIER = "next_tier"
+STOP = "stop"
+
+
+def wilson_half_width(successes: int, total: int, z: float = 1.96) -> float:
+    """Mitad del intervalo de Wilson para la proporción de respuestas buenas."""
+    if total == 0:
+        return 1.0
+    p = successes / total
+    denominator = 1 + z * z / total
+    return z * math.sqrt(p * (1 - p) / total + z * z / (4 * total * total)) / denominator
+
+
+class AdaptiveInterviewService:
+    """Entrevista adaptativa: recorre los tramos easy → medium → hard pidiendo preguntas
+    por lotes a medida que hacen falta y usa las señales good_question para:
+
+    - saltar el resto de un tramo cuando todas sus respuestas son buenas,
+    - terminar si todas las respuestas del tramo son malas (los tramos más difíciles no aportan),
+      siempre que ya se hayan hecho al menos min_questions preguntas,
+    - terminar cuando la proporción de respuestas buenas ya está acotada con confianza.
+
+    question_number sigue siendo el máximo; nunca se hacen más preguntas que en el modo normal.
+    """
+
+    def __init__(self, batch_generator: QuestionBatchGenerator, batch_size: int = 3, min_questions: int = 5,
+                 min_per_tier: int = 2, confidence_margin: float = 0.2):
+        self.batch_generator = batch_generator
+        self.batch_size = batch_size
+        self.min_questions = min_questions
+        self.min_per_tier = min_per_tier
+        self.confidence_margin = confidence_margin
+
+    def start(self, question_number: int) -> AdaptiveState:
+        state = AdaptiveState(tier_sizes=list(difficulty_counts(question_number)))
+        self._skip_empty_tiers(state)
+        return state
+
+    def record_answer(self, state: AdaptiveState, good: bool) -> str:
+        state.answers.append(good)
+        state.tier_answers.append(good)
+
+        answered = len(state.answers)
+        if answered >= self.min_questions and \
+                wilson_half_width(sum(state.answers), answered) <= self.confidence_margin:
+            state.stop_reason = "confident"
+            return STOP
+
+        in_tier = len(state.tier_answers)
+        if answered >= self.min_questions and in_tier >= self.min_per_tier and not any(state.tier_answers):
+            state.stop_reason = "struggling"
+            return STOP
+        mastered = in_tier >= self.min_per_tier and all(state.tier_answers)
+        if not mastered and in_tier < state.tier_sizes[state.tier]:
+            return CONTINUE
+
+        state.tier += 1
+        state.tier_generated = 0
+        state.tier_answers = []
+        self._skip_empty_tiers(state)
+        if state.tier >= len(state.tier_sizes):
+            state.stop_reason = "completed"
+            return STOP
+        return NEXT_TIER
+
+    async def next_batch(self, interview: InterviewReady, user_id: str) -> List[Question]:
+        """Genera el siguiente lote del tramo actual y lo añade a interview.questions"""
+        state = interview.adaptive_state
+        remaining = state.tier_sizes[state.tier] - state.tier_generated
+        count = min(self.batch_size, remaining)
+        if count <= 0:
+            return []
+        questions = await self.batch_generator.generate(
+            seniority=interview.user_seniority,
+            specialization=interview.user_specialization,
+            interview_type=interview.type,
+            difficulties=[DIFFICULTY_TIERS[state.tier]] * count,
+            start_id=max((q.id for q in interview.questions), default=0) + 1,
+            avoid=[q.question for q in interview.questions],
+            user_id=user_id
+        )
+        state.tier_generated += len(questions)
+        interview.questions.extend(questions)
+        return questions
+
+    async def advance(self, interview: InterviewReady, good: bool, user_id: str) -> None:
+        """Registra la respuesta a la pregunta actual y deja lista la siguiente (o ninguna si termina)"""
+        state = interview.adaptive_state
+        action = self.record_answer(state, good)
+        if action != CONTINUE:
+            # Las preguntas del tramo que ya no se van a hacer no cuentan para el feedback
+            interview.questions = [q for q in interview.questions if q.answer is not None]
+        if action == STOP:
+            logger.info("Adaptive interview stopped", extra={
+                "interview_id": str(interview.id), "reason": state.stop_reason, "answered": len(state.answers)
+            })
+            return
+
+        pending = [q for q in interview.questions if q.answer is None]
+        if not pending:
+            try:
+                await self.next_batch(interview, user_id)
+            except ValueError as e:
+                # Mejor cerrar con lo respondido que dejar la entrevista sin siguiente pregunta
+                logger.warning("Could not generate next adaptive batch for %s: %s", interview.id, e)
+                state.stop_reason = "generation_failed"
+
+    def _skip_empty_tiers(self, state: AdaptiveState) -> None:
+        while state.tier < len(state.tier_sizes) and state.tier_sizes[state.tier] == 0:
+            state.tier += 1
@@ -0,0 +1,174 @@
+import logging
+import re
+import zlib
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel
+
+from domain.services.scoring_engine import ANSWER_SCORES
+from infrastructure.external_services.embedding_service import EmbeddingService, HashingEmbeddingService
+from infrastructure.observability.metrics import MetricsRegistry, metrics as default_metrics
+
+logger = logging.getLogger(__name__)
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+# Palabras funcionales frecuentes; bastan para distinguir inglés de español en respuestas cortas
+STOPWORDS = {
+    "en": {"the", "and", "to", "of", "a", "in", "is", "it", "that", "was", "for", "on", "with", "my", "we",
+           "i", "have", "this", "but", "not", "they", "be", "at", "so", "our"},
+    "es": {"el", "la", "de", "que", "y", "en", "los", "las", "un", "una", "por", "con", "para", "es", "mi",
+           "lo", "se", "no", "pero", "como", "nosotros", "fue", "del", "al", "cuando", "porque"},
+}
+
+DONT_KNOW_PHRASES = {
+    "i don't know", "i dont know", "idk", "no idea", "not sure", "i have no idea", "pass", "skip", "n/a",
+    "no sé", "no se", "no lo sé", "no lo se", "ni idea", "paso", "no tengo idea",
+}
+
+# Plantillas por idioma y categoría; mismo tono que pide el prompt de generate_feedback
+FEEDBACK_TEMPLATES = {
+    "en": {
+        "empty": [
+            "Take your time to think of a specific example. Describe the situation, the task you owned, "
+            "the actions you took and the result you achieved.",
+        ],
+        "dont_know": [
+            "It's fine not to have an exact example. Think of a similar situation from a project, a course or "
+            "a team you worked with, and walk through what happened, what you did and what you learned.",
+            "Not knowing is a starting point. Pick the closest experience you have and explain the situation, "
+            "your actions and the outcome; interviewers value honest, structured reasoning.",
+        ],
+        "minimal": [
+            "You're on the right track, but this needs more detail. Use the STAR structure: set the situation, "
+            "explain your task, describe the actions you took and share a measurable result.",
+            "Try to expand this into a complete story. Give context, explain your specific role, and close with "
+            "the impact your actions had.",
+        ],
+        "off_topic": [
+            "This question is looking for a specific example related to what was asked. Re-read the question "
+            "and share a situation where you faced it, what you did and the result.",
+        ],
+    },
+    "es": {
+        "empty": [
+            "Tómate tu tiempo para pensar en un ejemplo concreto. Describe la situación, la tarea que tenías, "
+            "las acciones que tomaste y el resultado que lograste.",
+        ],
+        "dont_know": [
+            "Está bien no tener un ejemplo exacto. Piensa en una situación parecida de un proyecto, un curso o "
+            "un equipo en el que estuviste, y cuenta qué pasó, qué hiciste y qué aprendiste.",
+            "No saber es un punto de partida. Elige la experiencia más cercana que tengas y explica la situación, "
+            "tus acciones y el resultado; se valora un razonamiento honesto y estructurado.",
+        ],
+        "minimal": [
+            "Vas por buen camino, pero falta detalle. Usa la estructura STAR: plantea la situación, explica tu "
+            "tarea, describe las acciones que tomaste y comparte un resultado medible.",
+            "Intenta convertir esto en una historia completa: da contexto, explica tu rol concreto y cierra con "
+            "el impacto de tus acciones.",
+        ],
+        "off_topic": [
+            "La pregunta busca un ejemplo concreto sobre lo que se plantea. Vuelve a leerla y comparte una "
+            "situación en la que lo viviste, qué hiciste y qué resultado obtuviste.",
+        ],
+    },
+}
+
+MODES = ("off", "shadow", "decide")
+
+
+def detect_language(text: str) -> Optional[str]:
+    tokens = _WORD_RE.findall(text.lower())
+    scores = {language: sum(token in words for token in tokens) for language, words in STOPWORDS.items()}
+    language, score = max(scores.items(), key=lambda item: item[1])
+    return language if score > 0 else None
+
+
+class PrescreenVerdict(BaseModel):
+    category: str
+    language: str
+    feedback: str
+    decided: bool
+
+    def response(self) -> Dict[str, Any]:
+        """Misma forma que la respuesta JSON de generate_feedback"""
+        return {"feedback": self.feedback, "good_question": False, "score": ANSWER_SCORES["poor"]}
+
+
+class AnswerPrescreener:
+    """Clasificador local que resuelve sin LLM las respuestas claramente vacías o mínimas.
+
+    Solo marca casos evidentes (vacía, "no sé", ≤ min_words palabras, sin relación con la
+    pregunta); todo lo demás sigue yendo al LLM. Por tipo de entrevista el modo es:
+    off (no clasifica), shadow (clasifica y mide, pero decide el LLM) o decide.
+    """
+
+    def __init__(self, modes: Dict[str, str], default_mode: str = "decide", min_words: int = 10,
+                 offtopic_threshold: float = 0.02, offtopic_max_words: int = 60,
+                 embedding_service: Optional[EmbeddingService] = None,
+                 metrics: Optional[MetricsRegistry] = None):
+        self.modes = modes
+        self.default_mode = default_mode
+        self.min_words = min_words
+        self.offtopic_threshold = offtopic_threshold
+        self.offtopic_max_words = offtopic_max_words
+        # Siempre local: el objetivo es no salir a la red
+        self.embedding_service = embedding_service or HashingEmbeddingService()
+        self.metrics = metrics or default_metrics
+
+    def mode_for(self, interview_type: str) -> str:
+        mode = self.modes.get(interview_type, self.default_mode)
+        return mode if mode in MODES else "off"
+
+    async def screen(self, question: str, answer: str, interview_type: str,
+                     question_id: int = 0) -> Optional[PrescreenVerdict]:
+        mode = self.mode_for(interview_type)
+        if mode == "off":
+            return None
+        self.metrics.increment("prescreen_screened", interview_type=interview_type)
+
+        category = await self._classify(question, answer)
+        if category is None:
+            return None
+        language = detect_language(answer) or detect_language(question) or "en"
+        templates = FEEDBACK_TEMPLATES.get(language, FEEDBACK_TEMPLATES["en"])[category]
+        verdict = PrescreenVerdict(
+            category=category,
+            language=language,
+            # Variar la plantilla por pregunta, pero de forma estable en reintentos
+            feedback=templates[zlib.crc32(f"{question_id}:{answer}".encode("utf-8")) % len(templates)],
+            decided=mode == "decide" and self._can_decide(category)
+        )
+        self.metrics.increment("prescreen_hits", interview_type=interview_type, category=category,
+                               mode="decide" if verdict.decided else "shadow")
+        logger.debug("Prescreen hit", extra={"category": category, "mode": mode, "interview_type": interview_type})
+        return verdict
+
+    def _can_decide(self, category: str) -> bool:
+        # El hashing trick no mide el tema: una respuesta válida con otras palabras da similitud ~0
+        return category != "off_topic" or not isinstance(self.embedding_service, HashingEmbeddingService)
+
+    def record_shadow(self, verdict: PrescreenVerdict, llm_response: Optional[Dict[str, Any]],
+                      interview_type: str) -> None:
+        """En modo shadow, compara con lo que dijo el LLM para medir la precisión antes de activarlo"""
+        if llm_response is None:
+            return
+        agree = llm_response.get("good_question") is False
+        self.metrics.increment("prescreen_shadow", interview_type=interview_type, category=verdict.category,
+                               agree=str(agree).lower())
+
+    async def _classify(self, question: str, answer: str) -> Optional[str]:
+        normalized = " ".join(answer.lower().replace("’", "'").split()).strip(" .!?¡¿")
+        words = len(_WORD_RE.findall(normalized))
+        if words == 0:
+            return "empty"
+        if normalized in DONT_KNOW_PHRASES:
+            return "dont_know"
+        if words <= self.min_words:
+            return "minimal"
+        if self.offtopic_threshold > 0 and words <= self.offtopic_max_words \
+                and detect_language(answer) == detect_language(question):
+            vectors = await self.embedding_service.embed([question, answer])
+            if float(vectors[0] @ vectors[1]) < self.offtopic_threshold:
+                return "off_topic"
+        return None
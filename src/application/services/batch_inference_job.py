@@ -0,0 +1,118 @@
+import logging
+import os
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from infrastructure.database.batch_result_writer import BatchResultWriter, WriteBack, parse_result
+from infrastructure.external_services.batch_llm import BatchExecutor, BatchRequest, BatchResult
+
+logger = logging.getLogger(__name__)
+
+
+class BatchJobLine(BatchRequest):
+    """Una línea del fichero de trabajo (JSONL)"""
+    write_back: Optional[WriteBack] = None
+
+
+class BatchCheckpoint(BaseModel):
+    job_path: str
+    chunks_done: int = 0
+    # Lote ya enviado al proveedor y aún sin recoger: al reanudar se espera a ese en vez de reenviarlo
+    pending_handle: Optional[str] = None
+    succeeded: int = 0
+    failed: int = 0
+    written: int = 0
+    prompt_tokens: int = 0
+    output_tokens: int = 0
+
+
+class BatchInferenceJob:
+    """Procesa un fichero de prompts por trozos, con checkpoint después de cada uno.
+
+    Por cada trozo: envía al executor, espera los resultados, los anexa al fichero de
+    salida, aplica el write-back con bulk writes y avanza el checkpoint. Si el proceso
+    muere se reanuda desde el último trozo completo (el write-back es un $set, repetirlo
+    es inocuo).
+    """
+
+    def __init__(self, executor: BatchExecutor, writer: Optional[BatchResultWriter], checkpoint_path: str,
+                 output_path: str, chunk_size: int = 500):
+        self.executor = executor
+        self.writer = writer
+        self.checkpoint_path = checkpoint_path
+        self.output_path = output_path
+        self.chunk_size = chunk_size
+
+    @staticmethod
+    def read_job(job_path: str) -> List[BatchJobLine]:
+        with open(job_path, encoding="utf-8") as job:
+            return [BatchJobLine.model_validate_json(line) for line in job if line.strip()]
+
+    async def run(self, job_path: str) -> BatchCheckpoint:
+        lines = self.read_job(job_path)
+        checkpoint = self._load_checkpoint(job_path)
+        chunks = [lines[i:i + self.chunk_size] for i in range(0, len(lines), self.chunk_size)]
+        if checkpoint.chunks_done:
+            logger.info("Resuming %s at chunk %d/%d", job_path, checkpoint.chunks_done + 1, len(chunks))
+
+        for index in range(checkpoint.chunks_done, len(chunks)):
+            chunk = chunks[index]
+            requests = [BatchRequest(custom_id=l.custom_id, operation=l.operation, prompt=l.prompt) for l in chunk]
+            if checkpoint.pending_handle is None:
+                checkpoint.pending_handle = await self.executor.submit(requests)
+                self._save_checkpoint(checkpoint)
+            results = await self.executor.collect(checkpoint.pending_handle, requests)
+            self._append_output(results)
+            checkpoint.written += await self._write_back(chunk, results, checkpoint)
+            checkpoint.chunks_done = index + 1
+            checkpoint.pending_handle = None
+            self._save_checkpoint(checkpoint)
+            logger.info("Batch chunk %d/%d done: %d ok, %d failed so far", index + 1, len(chunks),
+                        checkpoint.succeeded, checkpoint.failed)
+        return checkpoint
+
+    async def _write_back(self, chunk: List[BatchJobLine], results: List[BatchResult],
+                          checkpoint: BatchCheckpoint) -> int:
+        by_id: Dict[str, BatchJobLine] = {line.custom_id: line for line in chunk}
+        items: List[Tuple[WriteBack, object]] = []
+        for result in results:
+            checkpoint.prompt_tokens += result.prompt_tokens
+            checkpoint.output_tokens += result.output_tokens
+            line = by_id.get(result.custom_id)
+            value = None
+            if result.error is None and line is not None:
+                try:
+                    value = parse_result(result.text, line.write_back.parser) if line.write_back else result.text
+                except Exception as e:
+                    logger.warning("Unparseable result for %s: %s", result.custom_id, e)
+            if value is None:
+                checkpoint.failed += 1
+                continue
+            checkpoint.succeeded += 1
+            if line.write_back is not None:
+                items.append((line.write_back, value))
+        if not items or self.writer is None:
+            return 0
+        return await self.writer.write(items)
+
+    def _append_output(self, results: List[BatchResult]) -> None:
+        with open(self.output_path, "a", encoding="utf-8") as output:
+            for result in results:
+                output.write(result.model_dump_json() + "\n")
+
+    def _load_checkpoint(self, job_path: str) -> BatchCheckpoint:
+        if os.path.exists(self.checkpoint_path):
+            with open(self.checkpoint_path, encoding="utf-8") as f:
+                checkpoint = BatchCheckpoint.model_validate_json(f.read())
+            if checkpoint.job_path == job_path:
+                return checkpoint
+            logger.warning("Checkpoint %s belongs to %s; starting over", self.checkpoint_path, checkpoint.job_path)
+        return BatchCheckpoint(job_path=job_path)
+
+    def _save_checkpoint(self, checkpoint: BatchCheckpoint) -> None:
+        # Escritura atómica: un checkpoint a medias no debe impedir reanudar
+        tmp_path = f"{self.checkpoint_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(checkpoint.model_dump_json())
+        os.replace(tmp_path, self.checkpoint_path)
@@ -0,0 +1,15 @@
+import hashlib
+from datetime import datetime, timezone
+
+
+def _normalize(part) -> str:
+    if isinstance(part, datetime):
+        # Mongo guarda milisegundos y devuelve fechas naive en UTC
+        return str(int(part.replace(tzinfo=part.tzinfo or timezone.utc).timestamp() * 1000))
+    return str(part)
+
+
+def weak_etag(*parts) -> str:
+    """ETag débil (W/): la respuesta puede ir comprimida, así que no identifica bytes exactos"""
+    digest = hashlib.sha1("|".join(_normalize(part) for part in parts).encode("utf-8")).hexdigest()[:20]
+    return f'W/"{digest}"'
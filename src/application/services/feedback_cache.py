@@ -0,0 +1,151 @@
+import asyncio
+import hashlib
+import logging
+import random
+import re
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+from pydantic import BaseModel
+
+from infrastructure.external_services.embedding_service import EmbeddingService, HashingEmbeddingService
+from infrastructure.external_services.interview_prompts import parse_score
+from infrastructure.observability.metrics import MetricsRegistry, metrics as default_metrics
+from infrastructure.similarity.vector_index import LRUVectorIndex
+
+logger = logging.getLogger(__name__)
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def normalize_answer(answer: str) -> str:
+    """Minúsculas, comillas rectas y espacios colapsados; sin puntuación final"""
+    return " ".join(answer.lower().replace("’", "'").split()).strip(" .!?¡¿")
+
+
+def _digest(*parts: str) -> str:
+    return hashlib.sha1("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+class CacheHit(BaseModel):
+    response: Dict[str, Any]
+    tier: str
+    similarity: float = 1.0
+
+
+class FeedbackCache:
+    """Caché en memoria del feedback por respuesta (generate_feedback).
+
+    La clave es el texto de la pregunta (con tipo, seniority y especialización, que también
+    van en el prompt) más un hash de la respuesta normalizada. El tier semántico, opcional,
+    busca la respuesta más parecida a la misma pregunta en un índice LRU de embeddings y
+    solo la sirve por encima de `similarity_threshold`. Una fracción `sample_rate` de los
+    aciertos se vuelve a evaluar con el LLM en segundo plano para medir la calidad.
+    """
+
+    def __init__(self, max_entries: int = 20000, semantic: bool = False, semantic_max_entries: int = 5000,
+                 similarity_threshold: float = 0.95, semantic_min_words: int = 8, sample_rate: float = 0.0,
+                 embedding_service: Optional[EmbeddingService] = None,
+                 metrics: Optional[MetricsRegistry] = None):
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+        self.semantic_min_words = semantic_min_words
+        self.sample_rate = sample_rate
+        self.metrics = metrics or default_metrics
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.embedding_service = None
+        self._index: Optional[LRUVectorIndex] = None
+        if semantic:
+            self.embedding_service = embedding_service or HashingEmbeddingService()
+            self._index = LRUVectorIndex(self.embedding_service.dimension, semantic_max_entries)
+        self._sampling: Set[asyncio.Task] = set()
+
+    async def lookup(self, question: str, answer: str, interview_type: str, seniority: str,
+                     specialization: str) -> Optional[CacheHit]:
+        scope = _digest(question, interview_type, seniority, specialization)
+        normalized = normalize_answer(answer)
+        key = _digest(scope, normalized)
+        self.metrics.increment("feedback_cache_lookups", interview_type=interview_type)
+
+        response = self._entries.get(key)
+        if response is not None:
+            self._entries.move_to_end(key)
+            return self._hit(CacheHit(response=response, tier="exact"), interview_type)
+
+        if self._index is not None and self._semantic_eligible(normalized):
+            vector = (await self.embedding_service.embed([normalized]))[0]
+            nearest = self._index.search(vector, self._group(scope))
+            if nearest is not None:
+                nearest_key, similarity = nearest
+                response = self._entries.get(nearest_key)
+                if response is None:
+                    self._index.remove(nearest_key)
+                elif similarity >= self.similarity_threshold:
+                    self._entries.move_to_end(nearest_key)
+                    return self._hit(CacheHit(response=response, tier="semantic", similarity=similarity),
+                                     interview_type)
+                else:
+                    self.metrics.increment("feedback_cache_semantic_rejected", interview_type=interview_type)
+
+        self.metrics.increment("feedback_cache_misses", interview_type=interview_type)
+        return None
+
+    async def store(self, question: str, answer: str, interview_type: str, seniority: str, specialization: str,
+                    response: Optional[Dict[str, Any]]) -> None:
+        # Solo respuestas válidas: un fallo del LLM no debe repetirse a otros usuarios
+        if not isinstance(response, dict) or not response.get("feedback"):
+            return
+        scope = _digest(question, interview_type, seniority, specialization)
+        normalized = normalize_answer(answer)
+        key = _digest(scope, normalized)
+        self._entries[key] = dict(response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            if self._index is not None:
+                self._index.remove(evicted)
+            self.metrics.increment("feedback_cache_evictions", tier="exact")
+        if self._index is not None and self._semantic_eligible(normalized):
+            vector = (await self.embedding_service.embed([normalized]))[0]
+            if self._index.add(key, vector, self._group(scope)) is not None:
+                self.metrics.increment("feedback_cache_evictions", tier="semantic")
+
+    def sample(self, hit: CacheHit, evaluate: Callable[[], Awaitable[Optional[Dict[str, Any]]]],
+               interview_type: str) -> None:
+        """Con probabilidad sample_rate, compara el acierto con una evaluación nueva del LLM (en segundo plano)"""
+        if self.sample_rate <= 0 or random.random() >= self.sample_rate:
+            return
+        task = asyncio.create_task(self._compare(hit, evaluate, interview_type))
+        self._sampling.add(task)
+        task.add_done_callback(self._sampling.discard)
+
+    async def _compare(self, hit: CacheHit, evaluate: Callable[[], Awaitable[Optional[Dict[str, Any]]]],
+                       interview_type: str) -> None:
+        try:
+            fresh = await evaluate()
+        except Exception as e:
+            logger.warning("Feedback cache quality sample failed: %s", e)
+            return
+        if not isinstance(fresh, dict):
+            return
+        cached_score, fresh_score = parse_score(hit.response.get("score")), parse_score(fresh.get("score"))
+        delta = abs(cached_score - fresh_score) if cached_score is not None and fresh_score is not None else None
+        agree = hit.response.get("good_question") == fresh.get("good_question") and (delta is None or delta <= 10)
+        self.metrics.increment("feedback_cache_sampled", tier=hit.tier, interview_type=interview_type,
+                               agree=str(agree).lower())
+        if delta is not None:
+            # Suma de diferencias de nota; dividida entre feedback_cache_sampled da la media
+            self.metrics.increment("feedback_cache_sample_score_delta", delta, tier=hit.tier)
+
+    def _hit(self, hit: CacheHit, interview_type: str) -> CacheHit:
+        self.metrics.increment("feedback_cache_hits", tier=hit.tier, interview_type=interview_type)
+        logger.debug("Feedback cache hit", extra={"tier": hit.tier, "similarity": round(hit.similarity, 3)})
+        return hit
+
+    def _semantic_eligible(self, normalized: str) -> bool:
+        # En respuestas cortas una palabra cambia el sentido ("I do" / "I don't"); esas solo por el tier exacto
+        return len(_WORD_RE.findall(normalized)) >= self.semantic_min_words
+
+    @staticmethod
+    def _group(scope: str) -> int:
+        return int(scope[:15], 16)
@@ -0,0 +1,55 @@
+import hashlib
+import json
+import logging
+from typing import Any, Awaitable, Callable, Optional, Type, TypeVar
+
+from pydantic import BaseModel
+
+from domain.repositories.idempotency_record_repository import IdempotencyRecordRepository
+
+logger = logging.getLogger(__name__)
+
+M = TypeVar("M", bound=BaseModel)
+
+
+class IdempotencyKeyInUseError(Exception):
+    """Otra petición con la misma Idempotency-Key todavía se está procesando."""
+
+
+class IdempotencyKeyMismatchError(Exception):
+    """La Idempotency-Key ya se usó con un cuerpo de petición distinto."""
+
+
+class IdempotencyService:
+    def __init__(self, idempotency_record_repository: IdempotencyRecordRepository, ttl_seconds: int = 86400):
+        self.idempotency_record_repository = idempotency_record_repository
+        self.ttl_seconds = ttl_seconds
+
+    async def run(self, scope: str, idempotency_key: Optional[str], request: Any,
+                  fn: Callable[[], Awaitable[M]], result_model: Type[M]) -> M:
+        """Ejecuta fn una sola vez por (scope, key); los reintentos reciben la respuesta guardada"""
+        if not idempotency_key:
+            return await fn()
+
+        key = f"{scope}:{idempotency_key}"
+        request_hash = hashlib.sha256(
+            json.dumps(request, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+        ).hexdigest()
+
+        existing = await self.idempotency_record_repository.claim(key, request_hash, self.ttl_seconds)
+        if existing is not None:
+            if existing["request_hash"] != request_hash:
+                raise IdempotencyKeyMismatchError("Idempotency-Key was already used with a different request")
+            if existing["status"] != "completed":
+                raise IdempotencyKeyInUseError("A request with this Idempotency-Key is still being processed")
+            logger.info("Replaying stored response for %s", key)
+            return result_model.model_validate(existing["response"])
+
+        try:
+            result = await fn()
+        except BaseException:
+            # Si falló, el cliente debe poder reintentar con la misma llave
+            await self.idempotency_record_repository.release(key)
+            raise
+        await self.idempotency_record_repository.complete(key, result.model_dump(mode="json"))
+        return result
@@ -0,0 +1,69 @@
+import asyncio
+import logging
+import os
+import socket
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+from domain.repositories.interview_ready_repository import InterviewReadyRepository
+from domain.repositories.single_flight_lease_repository import SingleFlightLeaseRepository
+
+logger = logging.getLogger(__name__)
+
+SWEEPER_LEASE_KEY = "interview_sweeper"
+
+
+class InterviewSweeper:
+    """Expira entrevistas abandonadas y archiva las completadas antiguas.
+
+    Corre en cada worker de la API, pero en cada intervalo solo barre el que toma el
+    lease en Mongo; el resto se salta la pasada.
+    """
+
+    def __init__(self, interview_ready_repository: InterviewReadyRepository,
+                 lease_repository: SingleFlightLeaseRepository, idle_minutes: int = 1440,
+                 archive_after_days: int = 180, batch_size: int = 500, interval_seconds: int = 900):
+        self.interview_ready_repository = interview_ready_repository
+        self.lease_repository = lease_repository
+        self.idle_minutes = idle_minutes
+        self.archive_after_days = archive_after_days
+        self.batch_size = batch_size
+        self.interval_seconds = interval_seconds
+        self.owner = f"{socket.gethostname()}:{os.getpid()}"
+        self._task: Optional[asyncio.Task] = None
+
+    async def run_once(self) -> Dict[str, int]:
+        now = datetime.now(timezone.utc)
+        expired = archived = 0
+        if self.idle_minutes > 0:
+            expired = await self.interview_ready_repository.expire_stale(now - timedelta(minutes=self.idle_minutes))
+        if self.archive_after_days > 0:
+            archived = await self.interview_ready_repository.archive_completed(
+                now - timedelta(days=self.archive_after_days), batch_size=self.batch_size
+            )
+        result = {"expired": expired, "archived": archived}
+        logger.info("Interview sweep finished: %s", result)
+        return result
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _loop(self) -> None:
+        try:
+            await self.interview_ready_repository.ensure_archive_indexes()
+        except Exception as e:
+            logger.error("Could not create archive indexes: %s", e)
+        while True:
+            try:
+                # El lease vence al final del intervalo; no se libera para que nadie repita la pasada antes
+                if await self.lease_repository.acquire(SWEEPER_LEASE_KEY, self.owner, self.interval_seconds):
+                    await self.run_once()
+            except Exception as e:
+                logger.error("Interview sweep failed: %s", e)
+            await asyncio.sleep(self.interval_seconds)
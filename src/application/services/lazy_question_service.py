@@ -0,0 +1,109 @@
+import asyncio
+import logging
+import time
+from typing import List, Set
+
+from application.services.question_batch_generator import QuestionBatchGenerator
+from domain.entities.interview_ready import InterviewReady, Question
+from domain.repositories.interview_ready_repository import InterviewReadyRepository
+from infrastructure.external_services.interview_prompts import difficulty_plan
+
+logger = logging.getLogger(__name__)
+
+# Referencias fuertes a las tareas en curso (el event loop solo guarda referencias débiles)
+_background_tasks: Set[asyncio.Task] = set()
+
+
+class LazyQuestionService:
+    """Genera el set de preguntas por lotes: el primero en la petición de creación y el
+    resto en segundo plano mientras el usuario responde.
+
+    El hueco i del set siempre recibe la dificultad difficulty_plan(question_number)[i - 1],
+    así que la distribución del prompt completo se mantiene sea cual sea el lote que lo genere.
+    """
+
+    def __init__(self, interview_ready_repository: InterviewReadyRepository, batch_generator: QuestionBatchGenerator,
+                 first_batch_size: int = 3, batch_size: int = 5, wait_seconds: float = 10.0,
+                 poll_interval: float = 0.25):
+        self.interview_ready_repository = interview_ready_repository
+        self.batch_generator = batch_generator
+        self.first_batch_size = first_batch_size
+        self.batch_size = batch_size
+        self.wait_seconds = wait_seconds
+        self.poll_interval = poll_interval
+
+    async def first_batch(self, interview: InterviewReady, user_id: str) -> List[Question]:
+        count = min(self.first_batch_size, interview.question_number)
+        questions = await self._generate(interview, 1, count, user_id)
+        interview.questions = questions
+        interview.questions_pending = interview.question_number - len(questions)
+        return questions
+
+    def schedule(self, interview: InterviewReady, user_id: str) -> None:
+        if interview.questions_pending <= 0:
+            return
+        task = asyncio.create_task(self._generate_remaining(interview, user_id))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+    async def ensure_next(self, interview: InterviewReady, user_id: str) -> None:
+        """Garantiza que haya una pregunta después de la última cargada en `interview`"""
+        last_id = interview.questions[-1].id
+        deadline = time.monotonic() + self.wait_seconds
+        while time.monotonic() < deadline:
+            if await self._merge_latest(interview, last_id):
+                return
+            await asyncio.sleep(self.poll_interval)
+
+        # La tarea en segundo plano no llegó a tiempo (o murió con el proceso): generar aquí
+        logger.warning("Generating pending questions inline", extra={"interview_id": str(interview.id)})
+        count = min(self.batch_size, interview.question_number - last_id)
+        if count <= 0:
+            interview.questions_pending = 0
+            return
+        questions = await self._generate(interview, last_id + 1, count, user_id)
+        if await self.interview_ready_repository.append_questions(interview.id, questions,
+                                                                  interview.questions_pending, interview.userId):
+            interview.questions.extend(questions)
+            interview.questions_pending -= len(questions)
+        else:
+            await self._merge_latest(interview, last_id)
+
+    async def _generate_remaining(self, interview: InterviewReady, user_id: str) -> None:
+        next_id = interview.question_number - interview.questions_pending + 1
+        try:
+            while next_id <= interview.question_number:
+                count = min(self.batch_size, interview.question_number - next_id + 1)
+                questions = await self._generate(interview, next_id, count, user_id)
+                if not await self.interview_ready_repository.append_questions(interview.id, questions,
+                                                                              interview.questions_pending,
+                                                                              interview.userId):
+                    # Una petición ya generó este lote en línea; ella se encarga del resto
+                    return
+                interview.questions.extend(questions)
+                interview.questions_pending -= len(questions)
+                # Si el modelo devolvió menos preguntas, el siguiente lote empieza por el primer hueco vacío
+                next_id += len(questions)
+            logger.info("Background question generation finished", extra={"interview_id": str(interview.id)})
+        except Exception as e:
+            # Las peticiones de respuesta generan en línea lo que falte
+            logger.error("Background question generation failed for %s: %s", interview.id, e)
+
+    async def _generate(self, interview: InterviewReady, start_id: int, count: int, user_id: str) -> List[Question]:
+        plan = difficulty_plan(interview.question_number)
+        return await self.batch_generator.generate(
+            seniority=interview.user_seniority,
+            specialization=interview.user_specialization,
+            interview_type=interview.type,
+            difficulties=plan[start_id - 1:start_id - 1 + count],
+            start_id=start_id,
+            avoid=[q.question for q in interview.questions],
+            user_id=user_id
+        )
+
+    async def _merge_latest(self, interview: InterviewReady, last_id: int) -> bool:
+        latest = await self.interview_ready_repository.find_by_id(str(interview.id), interview.userId)
+        arrived = [q for q in latest.questions if q.id > last_id]
+        interview.questions.extend(arrived)
+        interview.questions_pending = latest.questions_pending
+        return bool(arrived)
@@ -0,0 +1,63 @@
+import logging
+from typing import List, Optional
+
+from domain.entities.interview_ready import Question
+from infrastructure.external_services.interview_llm import InterviewLLM
+from infrastructure.external_services.interview_prompts import INTERVIEW_TYPES
+
+logger = logging.getLogger(__name__)
+
+
+class QuestionBatchGenerator:
+    """Genera preguntas por lotes para huecos concretos (id, competencia, dificultad).
+
+    Usa la misma operación que la deduplicación: cada hueco ya fija la dificultad,
+    así que la distribución del plan se respeta aunque el set se genere en partes.
+    """
+
+    def __init__(self, interview_llm: InterviewLLM):
+        self.interview_llm = interview_llm
+
+    @staticmethod
+    def slots(interview_type: str, difficulties: List[str], start_id: int) -> List[dict]:
+        competencies = INTERVIEW_TYPES.get(interview_type, INTERVIEW_TYPES["behavioral"])["examples"].split(", ")
+        return [{
+            "id": start_id + i,
+            "competency": competencies[(start_id + i - 1) % len(competencies)],
+            "difficulty": difficulty,
+        } for i, difficulty in enumerate(difficulties)]
+
+    async def generate(self, seniority: str, specialization: str, interview_type: str, difficulties: List[str],
+                       start_id: int, avoid: List[str], user_id: Optional[str] = None) -> List[Question]:
+        if not difficulties:
+            return []
+        slots = self.slots(interview_type, difficulties, start_id)
+        generated = await self.interview_llm.generate_replacement_questions(
+            seniority=seniority,
+            specialization=specialization,
+            slots=slots,
+            avoid=avoid,
+            interview_type=interview_type,
+            user_id=user_id
+        )
+        if not generated:
+            raise ValueError("Failed to generate interview questions")
+
+        by_id = {q.get("id"): q for q in generated}
+        questions = []
+        for slot in slots:
+            data = by_id.get(slot["id"])
+            if not data or not data.get("question"):
+                # Se corta aquí para que los ids sigan siendo consecutivos; el resto queda pendiente
+                logger.warning("Missing generated question for slot %s", slot["id"])
+                break
+            # El hueco manda: el modelo no puede cambiar id ni dificultad
+            questions.append(Question(
+                id=slot["id"],
+                question=data["question"],
+                competency=data.get("competency") or slot["competency"],
+                difficulty=slot["difficulty"]
+            ))
+        if not questions:
+            raise ValueError("Failed to generate interview questions")
+        return questions
@@ -0,0 +1,119 @@
+import logging
+import re
+from collections import Counter
+from typing import Iterable, List, Set
+
+from domain.entities.interview_ready import Question
+from domain.repositories.interview_ready_repository import InterviewReadyRepository
+from infrastructure.external_services.embedding_service import EmbeddingService
+from infrastructure.external_services.interview_llm import InterviewLLM
+from infrastructure.similarity.vector_index import VectorIndex
+
+logger = logging.getLogger(__name__)
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def template_words(texts: List[str], min_share: float = 0.5) -> Set[str]:
+    """Palabras presentes en al menos `min_share` de los textos: la plantilla común (STAR) y no el tema"""
+    if len(texts) < 3:
+        return set()
+    frequency = Counter(word for text in texts for word in set(_WORD_RE.findall(text.lower())))
+    return {word for word, count in frequency.items() if count >= max(2, min_share * len(texts))}
+
+
+def strip_template(texts: Iterable[str], words: Set[str]) -> List[str]:
+    stripped = []
+    for text in texts:
+        remaining = " ".join(word for word in _WORD_RE.findall(text.lower()) if word not in words)
+        # Si no queda nada (p.ej. pregunta repetida solo con la plantilla) se compara el texto completo
+        stripped.append(remaining or text)
+    return stripped
+
+
+class QuestionDeduplicator:
+    """Detecta preguntas casi duplicadas (dentro del set y contra el historial reciente del usuario)
+    y regenera únicamente esas, en lugar de pedir otra vez el set completo.
+
+    Todas las preguntas siguen la misma plantilla STAR; antes de calcular el embedding se
+    quitan las palabras comunes a la mayoría de ellas para comparar solo el tema.
+    """
+
+    def __init__(self, interview_ready_repository: InterviewReadyRepository, interview_llm: InterviewLLM,
+                 embedding_service: EmbeddingService, threshold: float = 0.9,
+                 history_interviews: int = 5, max_rounds: int = 1):
+        self.interview_ready_repository = interview_ready_repository
+        self.interview_llm = interview_llm
+        self.embedding_service = embedding_service
+        self.threshold = threshold
+        self.history_interviews = history_interviews
+        self.max_rounds = max_rounds
+
+    async def deduplicate(self, questions: List[Question], user_id: str, seniority: str,
+                          specialization: str, interview_type: str) -> List[Question]:
+        history = await self.interview_ready_repository.find_recent_questions(user_id, self.history_interviews)
+        template = template_words(history + [q.question for q in questions])
+        index = VectorIndex(self.embedding_service.dimension,
+                            await self.embedding_service.embed(strip_template(history, template)))
+        texts = list(history)
+
+        vectors = await self.embedding_service.embed(strip_template([q.question for q in questions], template))
+        duplicates = {}
+        for position, question in enumerate(questions):
+            match = self._match(index, texts, vectors[position])
+            if match is not None:
+                duplicates[position] = match
+            else:
+                index.add(vectors[position])
+                texts.append(question.question)
+
+        rounds = 0
+        while duplicates and rounds < self.max_rounds:
+            rounds += 1
+            logger.info("Regenerating %s near-duplicate questions for user %s (round %s)", len(duplicates), user_id, rounds)
+            replacements = await self.interview_llm.generate_replacement_questions(
+                seniority=seniority,
+                specialization=specialization,
+                interview_type=interview_type,
+                slots=[{
+                    "id": questions[position].id,
+                    "competency": questions[position].competency,
+                    "difficulty": questions[position].difficulty
+                } for position in duplicates],
+                avoid=[q.question for q in questions] + list(set(duplicates.values())),
+                user_id=user_id
+            )
+            if not replacements:
+                break
+            by_id = {r.get("id"): r for r in replacements if r.get("question")}
+            candidates = [(position, by_id[questions[position].id]) for position in duplicates if questions[position].id in by_id]
+            if not candidates:
+                break
+            candidate_vectors = await self.embedding_service.embed(
+                strip_template([r["question"] for _, r in candidates], template)
+            )
+            for (position, replacement), vector in zip(candidates, candidate_vectors):
+                match = self._match(index, texts, vector)
+                if match is not None:
+                    duplicates[position] = match
+                    continue
+                questions[position] = Question(
+                    id=questions[position].id,
+                    question=replacement["question"],
+                    competency=questions[position].competency,
+                    difficulty=questions[position].difficulty
+                )
+                index.add(vector)
+                texts.append(replacement["question"])
+                del duplicates[position]
+
+        if duplicates:
+            # Mejor conservar la pregunta repetida que entregar un set incompleto
+            logger.warning("Keeping %s near-duplicate questions for user %s", len(duplicates), user_id)
+        return questions
+
+    def _match(self, index: VectorIndex, texts: List[str], vector):
+        hits = index.search(vector, k=1)
+        if hits and hits[0][1] >= self.threshold:
+            return texts[hits[0][0]]
+        return None
@@ -1,9 +1,9 @@
 from domain.repositories.interview_ready_repository import InterviewReadyRepository
 
-from infrastructure.external_services.gemini_service import GeminiService
+from infrastructure.external_services.interview_llm import InterviewLLM
 
 
 class BaseInterviewReadyUseCase:
-    def __init__(self, interview_ready_repository: InterviewReadyRepository, gemini_service: GeminiService):
+    def __init__(self, interview_ready_repository: InterviewReadyRepository, interview_llm: InterviewLLM):
         self.interview_ready_repository = interview_ready_repository
-        self.gemini_service = gemini_service
\ No newline at end of file
+        self.interview_llm = interview_llm
\ No newline at end of file
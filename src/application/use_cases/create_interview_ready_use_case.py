@@ -1,42 +1,82 @@
 
+import logging
 from domain.entities.interview_ready import InterviewReady,Question
 
 
 from application.dto.create_interview_ready_dto import CreateInterviewReadyDTO
 from application.dto.create_interview_response_dto import CreateInterviewResponseDTO
 from application.use_cases.base_interview_ready_use_case import BaseInterviewReadyUseCase
+from application.services.question_deduplicator import QuestionDeduplicator
+from application.services.adaptive_interview_service import AdaptiveInterviewService
+from application.services.lazy_question_service import LazyQuestionService
+from domain.repositories.precomputed_question_set_repository import PrecomputedQuestionSetRepository
+from infrastructure.external_services.interview_llm import LLMBudgetExceededError
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+async def generate_question_set(interview_llm, num_questions: int, seniority: str, specialization: str,
+                                user_id: str) -> List[Question]:
+    """Set completo de preguntas en una sola llamada al LLM (creación directa y precálculo por perfil)"""
+    questions_data = await interview_llm.generate_questions(
+        num_questions=num_questions,
+        seniority=seniority,
+        specialization=specialization,
+        user_id=user_id
+    )
+
+    
+    questions = []
+    for i, q_data in enumerate(questions_data['questions']):
+        try:
+            # Asegúrate de que todos los campos requeridos estén presentes
+            question_dict = {
+                'id': q_data.get('id', i + 1),
+                'question': q_data.get('question', ''),
+                'competency': q_data.get('competency', ''),
+                'difficulty': q_data.get('difficulty', 'medium')
+            }
+            question = Question(**question_dict)
+            questions.append(question)
+        except Exception as qe:
+            logger.warning("Error creating question %d: %s", i, qe)
+            continue
+    return questions
 
 
 class CreateInterviewReadyUseCase(BaseInterviewReadyUseCase):
-  
+    def __init__(self, interview_ready_repository, interview_llm,
+                 question_deduplicator: Optional[QuestionDeduplicator] = None,
+                 adaptive_interview_service: Optional[AdaptiveInterviewService] = None,
+                 lazy_question_service: Optional[LazyQuestionService] = None,
+                 lazy_min_count: int = 10,
+                 precomputed_question_set_repository: Optional[PrecomputedQuestionSetRepository] = None):
+        self.question_deduplicator = question_deduplicator
+        self.adaptive_interview_service = adaptive_interview_service
+        self.lazy_question_service = lazy_question_service
+        self.lazy_min_count = lazy_min_count
+        self.precomputed_question_set_repository = precomputed_question_set_repository
+        super().__init__(interview_ready_repository, interview_llm)
 
     async def execute(self, dto: CreateInterviewReadyDTO) ->CreateInterviewResponseDTO:
      try:
+        if dto.adaptive:
+            return await self._create_adaptive(dto)
 
+        questions = await self._claim_precomputed(dto)
+        if questions is None:
+            if self.lazy_question_service is not None and dto.question_number.value >= self.lazy_min_count:
+                return await self._create_lazy(dto)
+            questions = await generate_question_set(
+                self.interview_llm,
+                num_questions=dto.question_number.value,
+                seniority=dto.user_seniority,
+                specialization=dto.user_specialization,
+                user_id=dto.user_id
+            )
 
-        questions_data = await self.gemini_service.generate_questions(
-            num_questions=dto.question_number.value,
-            seniority=dto.user_seniority,
-            specialization=dto.user_specialization
-        )
-
-        
-        questions = []
-        for i, q_data in enumerate(questions_data['questions']):
-            try:
-                # Asegúrate de que todos los campos requeridos estén presentes
-                question_dict = {
-                    'id': q_data.get('id', i + 1),
-                    'question': q_data.get('question', ''),
-                    'competency': q_data.get('competency', ''),
-                    'difficulty': q_data.get('difficulty', 'medium')
-                }
-                question = Question(**question_dict)
-                questions.append(question)
-            except Exception as qe:
-                print(f"Error creating question {i}: {qe}")
-                continue
-
+        questions = await self._deduplicate(questions, dto)
 
         
         interview_ready = InterviewReady(
@@ -48,14 +88,92 @@ class CreateInterviewReadyUseCase(BaseInterviewReadyUseCase):
             question_number=dto.question_number.value,
             type=dto.type,
         )
-        print(f"Creating InterviewReady with userId: {interview_ready.userId}, question_number: {interview_ready.question_number}")
+        return await self._save(interview_ready)
+     except LLMBudgetExceededError:
+        raise
+     except Exception as e:
+        logger.error("Error occurred while creating InterviewReady: %s", e)
+        raise ValueError(f"Failed to create interview ready: {str(e)}")
+
+    async def _create_adaptive(self, dto: CreateInterviewReadyDTO) -> CreateInterviewResponseDTO:
+        """Solo se genera el primer lote del tramo más fácil; el resto se pide al responder"""
+        if self.adaptive_interview_service is None:
+            raise ValueError("Adaptive interviews are not enabled")
+        interview_ready = InterviewReady(
+            userId=dto.user_id,
+            user_seniority=dto.user_seniority,
+            user_specialization=dto.user_specialization,
+            questions=[],
+            question_number=dto.question_number.value,
+            type=dto.type,
+            adaptive=True,
+            adaptive_state=self.adaptive_interview_service.start(dto.question_number.value),
+        )
+        await self.adaptive_interview_service.next_batch(interview_ready, dto.user_id)
+        interview_ready.questions = await self._deduplicate(interview_ready.questions, dto)
+        interview_ready.actual_question = interview_ready.questions[0]
+        return await self._save(interview_ready)
+
+    async def _create_lazy(self, dto: CreateInterviewReadyDTO) -> CreateInterviewResponseDTO:
+        """Genera el primer lote y deja el resto del set generándose en segundo plano"""
+        interview_ready = InterviewReady(
+            userId=dto.user_id,
+            user_seniority=dto.user_seniority,
+            user_specialization=dto.user_specialization,
+            questions=[],
+            question_number=dto.question_number.value,
+            type=dto.type,
+        )
+        await self.lazy_question_service.first_batch(interview_ready, dto.user_id)
+        interview_ready.questions = await self._deduplicate(interview_ready.questions, dto)
+        interview_ready.actual_question = interview_ready.questions[0]
+        response = await self._save(interview_ready)
+        self.lazy_question_service.schedule(interview_ready, dto.user_id)
+        return response
+
+    async def _claim_precomputed(self, dto: CreateInterviewReadyDTO) -> Optional[List[Question]]:
+        """Preguntas de un set precalculado al actualizar el perfil, si hay uno que encaje"""
+        if self.precomputed_question_set_repository is None:
+            return None
+        try:
+            claimed = await self.precomputed_question_set_repository.claim(
+                user_id=dto.user_id,
+                seniority=dto.user_seniority,
+                specialization=dto.user_specialization,
+                interview_type=dto.type,
+                question_number=dto.question_number.value
+            )
+        except Exception as ce:
+            logger.warning("Precomputed question set lookup failed: %s", ce)
+            return None
+        if claimed is None or not claimed.questions:
+            return None
+        logger.info("Claimed precomputed question set", extra={"user_id": dto.user_id, "type": dto.type})
+        return claimed.questions
+
+    async def _deduplicate(self, questions: List[Question], dto: CreateInterviewReadyDTO) -> List[Question]:
+        if not self.question_deduplicator or not questions:
+            return questions
+        try:
+            return await self.question_deduplicator.deduplicate(
+                questions,
+                user_id=dto.user_id,
+                seniority=dto.user_seniority,
+                specialization=dto.user_specialization,
+                interview_type=dto.type
+            )
+        except Exception as de:
+            logger.warning("Question deduplication skipped: %s", de)
+            return questions
+
+    async def _save(self, interview_ready: InterviewReady) -> CreateInterviewResponseDTO:
+        logger.debug("Creating InterviewReady with userId: %s, question_number: %d", interview_ready.userId, interview_ready.question_number)
 
         
         res=await self.interview_ready_repository.create(interview_ready)
-        print(res.actual_question)
         if not res:
             raise ValueError("Failed to create InterviewReady in the repository")
-        print(f"InterviewReady created successfully with ID: {res.id}")
+        logger.info("InterviewReady created", extra={"interview_id": str(res.id), "user_id": res.userId})
 
         return CreateInterviewResponseDTO(
             id=str(res.id),
@@ -68,6 +186,3 @@ class CreateInterviewReadyUseCase(BaseInterviewReadyUseCase):
             type=res.type,
             actual_question=1
         )
-     except Exception as e:
-        print(f"Error occurred while creating InterviewReady: {e}")
-        raise ValueError(f"Failed to create interview ready: {str(e)}")
@@ -0,0 +1,86 @@
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+from domain.repositories.interview_ready_repository import InterviewReadyRepository
+from infrastructure.export.interview_export_writer import InterviewExportWriter
+
+
+class ExportInterviewsUseCase():
+    """Exporta interview_ready aplanado a una fila por pregunta, con memoria acotada al lote."""
+    def __init__(self, interview_ready_repository: InterviewReadyRepository, writer: InterviewExportWriter):
+        self.interview_ready_repository = interview_ready_repository
+        self.writer = writer
+
+    async def execute(self, init_from: Optional[datetime] = None, init_to: Optional[datetime] = None,
+                      interview_type: Optional[str] = None, status: Optional[str] = None,
+                      after_id: Optional[Any] = None, batch_size: int = 1000,
+                      on_checkpoint: Optional[Callable[[str], None]] = None) -> Dict[str, int]:
+        rows: List[Dict[str, Any]] = []
+        interviews = exported_rows = 0
+        last_id = None
+
+        try:
+            async for interview in self.interview_ready_repository.iter_for_export(
+                init_from=init_from,
+                init_to=init_to,
+                interview_type=interview_type,
+                status=status,
+                after_id=after_id,
+                batch_size=batch_size
+            ):
+                rows.extend(self.flatten(interview))
+                last_id = interview["_id"]
+                interviews += 1
+                # Se corta por entrevistas completas para que el checkpoint nunca parta una
+                if interviews % batch_size == 0:
+                    exported_rows += self._flush(rows, last_id, on_checkpoint)
+                    rows = []
+
+            if last_id is not None:
+                exported_rows += self._flush(rows, last_id, on_checkpoint)
+        finally:
+            # También si el cursor falla a mitad: lo ya escrito queda cerrado y el checkpoint permite retomar
+            self.writer.close()
+        return {"interviews": interviews, "rows": exported_rows}
+
+    def _flush(self, rows: List[Dict[str, Any]], last_id: Any,
+               on_checkpoint: Optional[Callable[[str], None]]) -> int:
+        self.writer.write_rows(rows)
+        if on_checkpoint:
+            on_checkpoint(str(last_id))
+        return len(rows)
+
+    @staticmethod
+    def flatten(interview: Dict[str, Any]) -> List[Dict[str, Any]]:
+        feedback = interview.get("feedback") or {}
+        competency_scores = {
+            item.get("name"): item.get("score")
+            for item in feedback.get("competency_breakdown", [])
+        }
+        base = {
+            "interview_id": str(interview["_id"]),
+            "user_id": interview.get("userId"),
+            "type": interview.get("type"),
+            "status": interview.get("status"),
+            "user_seniority": interview.get("user_seniority"),
+            "user_specialization": interview.get("user_specialization"),
+            "init_at": interview.get("init_at"),
+            "end_at": interview.get("end_at"),
+            "points_earned": interview.get("points_earned", 0),
+            "overall_score": feedback.get("overall_score"),
+            "summary_feedback": feedback.get("summary_feedback"),
+        }
+        questions = interview.get("questions") or []
+        if not questions:
+            return [{**base, "question_id": None, "question": None, "competency": None,
+                     "difficulty": None, "answer": None, "question_feedback": None,
+                     "competency_score": None}]
+        return [{
+            **base,
+            "question_id": question.get("id"),
+            "question": question.get("question"),
+            "competency": question.get("competency"),
+            "difficulty": question.get("difficulty"),
+            "answer": question.get("answer"),
+            "question_feedback": question.get("feedback"),
+            "competency_score": competency_scores.get(question.get("competency")),
+        } for question in questions]
@@ -1,19 +1,39 @@
+import logging
 from application.use_cases.base_interview_ready_use_case import BaseInterviewReadyUseCase
 from application.dto.get_interview_ready_feedback_dto import GetInterviewReadyFeedBackDto
+from domain.repositories.user_interview_stats_repository import UserInterviewStatsRepository
 from infrastructure.messaging.rabbitmq_producer import RabbitMQProducer
+from infrastructure.external_services.interview_llm import LLMBudgetExceededError
+from infrastructure.concurrency.single_flight import SingleFlight, single_flight_key
+from infrastructure.observability.tracing import traced
+from domain.services.scoring_engine import ScoringEngine
 from datetime import datetime
+from typing import Optional
+
+logger = logging.getLogger(__name__)
 class GenerateInterviewFeedbackUseCase(BaseInterviewReadyUseCase):
-    def __init__(self, interview_ready_repository, gemini_service,rabbitmq_producer:RabbitMQProducer):
+    def __init__(self, interview_ready_repository, interview_llm,rabbitmq_producer:RabbitMQProducer,
+                 user_interview_stats_repository: Optional[UserInterviewStatsRepository] = None,
+                 single_flight: Optional[SingleFlight] = None,
+                 scoring_engine: Optional[ScoringEngine] = None):
         self.rabbitmq_producer = rabbitmq_producer
-        super().__init__(interview_ready_repository, gemini_service)
+        self.scoring_engine = scoring_engine
+        self.single_flight = single_flight
+        self.user_interview_stats_repository = user_interview_stats_repository
+        super().__init__(interview_ready_repository, interview_llm)
 
+    @traced("generate_interview_feedback")
     async def execute(self, interview_id: str,user_id: str)->GetInterviewReadyFeedBackDto :
         try:
-            print(f"Generating feedback for interview ID: {interview_id}")
+            logger.debug("Generating feedback for interview ID: %s", interview_id)
 
-            interview = await self.interview_ready_repository.find_by_id(interview_id)
+            interview = await self.interview_ready_repository.find_by_id(interview_id, user_id)
+            if not interview:
+                raise ValueError("Interview not found")
             if interview.status=="in_progress":
                 raise ValueError("Interview is still in progress, cannot generate feedback")
+            if interview.status=="expired":
+                raise ValueError("Interview expired without being completed, cannot generate feedback")
             if interview.feedback is not None:
                 await self.rabbitmq_producer.publish_message(
                  message={
@@ -43,40 +63,86 @@ class GenerateInterviewFeedbackUseCase(BaseInterviewReadyUseCase):
             
             
             
-            feedback = await self.gemini_service.generate_complete_feedback(
+            if self.single_flight is not None:
+                # Los reintentos del cliente mientras se genera esperan el mismo resultado
+                return await self.single_flight.run(
+                    single_flight_key("generate_complete_feedback", interview_id),
+                    lambda: self._generate(interview, interview_id, user_id),
+                    GetInterviewReadyFeedBackDto
+                )
+            return await self._generate(interview, interview_id, user_id)
+
+        except LLMBudgetExceededError:
+            raise
+        except Exception as e:
+            logger.error("Error occurred while generating interview feedback: %s", e)
+            raise ValueError(f"Failed to generate interview feedback: {str(e)}")
+
+    async def _record_stats(self, interview) -> None:
+        if self.user_interview_stats_repository is None:
+            return
+        try:
+            # Solo la primera petición que guarda el feedback suma al rollup
+            if await self.interview_ready_repository.mark_stats_recorded(interview.id, interview.userId):
+                await self.user_interview_stats_repository.record_feedback(
+                    user_id=interview.userId,
+                    interview_type=interview.type,
+                    feedback=interview.feedback
+                )
+        except Exception as e:
+            # El backfill reconstruye el rollup; no se pierde el feedback por esto
+            logger.error("Error updating user interview stats for %s: %s", interview.id, e)
+
+    async def _build_feedback(self, interview, user_id: str):
+        if self.scoring_engine is None or not self.scoring_engine.is_scorable(interview.questions):
+            # Entrevistas respondidas sin nota por respuesta: el LLM puntúa todo el set
+            return await self.interview_llm.generate_complete_feedback(
                 questions=interview.questions,
                 seniority=interview.user_seniority,
                 specialization=interview.user_specialization,
-                interview_type=interview.type
+                interview_type=interview.type,
+                user_id=user_id
             )
-            interview.feedback=feedback
-            interview.points_earned=feedback.points_earned
-            updated_interview=await self.interview_ready_repository.update(interview)
-            if not updated_interview:
-                raise ValueError("Failed to update interview with feedback")
-            print(f"Feedback generated successfully for interview ID: {interview_id}")
-            print(f"Generated feedback: {feedback}")
-            await self.rabbitmq_producer.publish_message(
-                 message={
-                    "event": "Interview Ready Finished",
-                    "type": "Interview Ready",
-                    "created_at": str(datetime.utcnow()),
-                    "points_earned": 10,
-                     "user_id": user_id,
+        score = self.scoring_engine.score(interview.questions)
+        summary = await self.interview_llm.generate_summary_feedback(
+            questions=[q for q in interview.questions if q.answer is not None],
+            seniority=interview.user_seniority,
+            specialization=interview.user_specialization,
+            interview_type=interview.type,
+            overall_score=score.overall_score,
+            competency_breakdown=[c.model_dump() for c in score.competency_breakdown],
+            focus_questions=score.focus_questions,
+            user_id=user_id
+        )
+        return score.to_feedback(summary or "")
+
+    async def _generate(self, interview, interview_id: str, user_id: str) -> GetInterviewReadyFeedBackDto:
+        feedback = await self._build_feedback(interview, user_id)
+        if feedback is None:
+            raise ValueError("Failed to generate interview feedback")
+        interview.feedback=feedback
+        interview.points_earned=feedback.points_earned
+        updated_interview=await self.interview_ready_repository.update(interview)
+        if not updated_interview:
+            raise ValueError("Failed to update interview with feedback")
+        await self._record_stats(updated_interview)
+        logger.info("Feedback generated", extra={"interview_id": interview_id, "overall_score": feedback.overall_score})
+        logger.debug("Generated feedback: %s", feedback, extra={"verbose": True})
+        await self.rabbitmq_producer.publish_message(
+            message={
+                "event": "Interview Ready Finished",
+                "type": "Interview Ready",
+                "created_at": str(datetime.utcnow()),
+                "points_earned": 10,
+                "user_id": user_id,
             },
             queue_name="any",
             priority=5
-
         )
-            return GetInterviewReadyFeedBackDto(
-                interview_id=interview_id,
-                user_id=user_id,
-                points_earned=updated_interview.points_earned,
-                feedback=updated_interview.feedback,
-                init_at=str(interview.init_at),
-                finish_at=str(interview.end_at))
-        
-        
-        except Exception as e:
-            print(f"Error occurred while generating interview feedback: {e}")
-            raise ValueError(f"Failed to generate interview feedback: {str(e)}")
+        return GetInterviewReadyFeedBackDto(
+            interview_id=interview_id,
+            user_id=user_id,
+            points_earned=updated_interview.points_earned,
+            feedback=updated_interview.feedback,
+            init_at=str(interview.init_at),
+            finish_at=str(interview.end_at))
@@ -0,0 +1,73 @@
+import logging
+from typing import AsyncIterator, Dict
+from domain.repositories.interview_ready_repository import InterviewReadyRepository
+from application.dto.get_interview_ready_dto import (
+    GetBulkInterviewReadyDto,
+    GetBulkInterviewReadyRequestDto,
+    InterviewReadyDto,
+    UserInterviewHistoryDto,
+)
+from infrastructure.config.app_config import config
+
+logger = logging.getLogger(__name__)
+
+
+class GetBulkInterviewReadyUseCase():
+    def __init__(self, interview_ready_repository: InterviewReadyRepository):
+        self.interview_ready_repository = interview_ready_repository
+
+    def resolve_limit(self, dto: GetBulkInterviewReadyRequestDto) -> int:
+        if len(dto.user_ids) > config.bulk_history_max_users:
+            raise ValueError(f"No se pueden consultar más de {config.bulk_history_max_users} usuarios a la vez")
+        limit = dto.limit_per_user or config.bulk_history_limit_per_user
+        if limit < 1:
+            raise ValueError("limit_per_user debe ser mayor que 0")
+        return limit
+
+    async def stream(self, dto: GetBulkInterviewReadyRequestDto) -> AsyncIterator[UserInterviewHistoryDto]:
+        """Genera el historial usuario por usuario a medida que llega del cursor"""
+        limit = self.resolve_limit(dto)
+        pending = set(dto.user_ids)
+        async for group in self.interview_ready_repository.iter_all_by_user_ids(
+            user_ids=dto.user_ids,
+            limit_per_user=limit
+        ):
+            pending.discard(group["user_id"])
+            yield self._to_dto(group)
+        # Usuarios sin entrevistas completadas no aparecen en la agregación
+        for user_id in dto.user_ids:
+            if user_id in pending:
+                yield UserInterviewHistoryDto(user_id=user_id, interviews=[], total=0)
+
+    async def execute(self, dto: GetBulkInterviewReadyRequestDto) -> GetBulkInterviewReadyDto:
+        try:
+            limit = self.resolve_limit(dto)
+            users = [user async for user in self.stream(dto)]
+            order = {user_id: i for i, user_id in enumerate(dto.user_ids)}
+            users.sort(key=lambda user: order[user.user_id])
+            return GetBulkInterviewReadyDto(users=users, limit_per_user=limit)
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error("Error in GetBulkInterviewReadyUseCase: %s", e)
+            raise Exception("Failed to execute GetBulkInterviewReadyUseCase") from e
+
+    @staticmethod
+    def _to_dto(group: Dict) -> UserInterviewHistoryDto:
+        return UserInterviewHistoryDto(
+            user_id=group["user_id"],
+            total=group["total"],
+            interviews=[InterviewReadyDto(
+                user_id=interview_data["userId"],
+                user_seniority=interview_data["user_seniority"],
+                user_specialization=interview_data["user_specialization"],
+                init_at=str(interview_data["init_at"]),
+                end_at=str(interview_data["end_at"]),
+                status=interview_data["status"],
+                questions_number=interview_data["question_number"],
+                type=interview_data["type"] if "type" in interview_data else "",
+                points_earned=interview_data["points_earned"],
+                updated_at=str(interview_data["updated_at"]) if "updated_at" in interview_data else "",
+                id=interview_data["id"]
+            ) for interview_data in group["interviews"]]
+        )
@@ -1,21 +1,36 @@
+import logging
+from datetime import datetime
+from typing import Optional
 from domain.repositories.interview_ready_repository import InterviewReadyRepository
 from domain.entities.interview_ready import InterviewReady
+from application.services.etag import weak_etag
+
+logger = logging.getLogger(__name__)
 
 
 class GetInterviewReadyByIdUseCase:
     def __init__(self, interview_ready_repository: InterviewReadyRepository):
         self.interview_ready_repository = interview_ready_repository
 
+    async def etag(self, user_id: str, interview_id: str) -> Optional[str]:
+        """ETag actual de la entrevista (lookup barato por _id); None si no existe o no es del usuario"""
+        current = await self.interview_ready_repository.find_version(interview_id, user_id)
+        if not current or current.get("userId") != user_id:
+            return None
+        return self.etag_for(current.get("version", 0), current.get("updated_at"))
+
+    @staticmethod
+    def etag_for(version: int, updated_at: Optional[datetime]) -> str:
+        return weak_etag(version, updated_at)
+
     async def execute(self, user_id: str, interview_id: str) -> InterviewReady:
         try:
-            interview = await self.interview_ready_repository.find_by_id(interview_id)
-            if interview.userId != user_id:
-                raise ValueError("You are not authorized to access this interview")
-            
-
+            interview = await self.interview_ready_repository.find_by_id(interview_id, user_id)
             if not interview:
                 raise ValueError("Interview not found for the given ID")
+            if interview.userId != user_id:
+                raise ValueError("You are not authorized to access this interview")
             return interview
         except Exception as e:
-            print(f"Error in GetInterviewReadyByIdUseCase: {e}")
+            logger.error("Error in GetInterviewReadyByIdUseCase: %s", e)
             raise Exception("Failed to execute GetInterviewReadyByIdUseCase") from e
\ No newline at end of file
@@ -1,17 +1,31 @@
+import logging
 from domain.repositories.interview_ready_repository import InterviewReadyRepository
 from application.dto.get_interview_ready_dto import GetInterviewReadyDto,InterviewReadyDto
+from application.services.etag import weak_etag
+
+logger = logging.getLogger(__name__)
 
 class GetInterviewReadyUseCase():
     def __init__(self, interview_ready_repository: InterviewReadyRepository):
         self.interview_ready_repository = interview_ready_repository
-    async def execute(self, user_id: str,limit: int = 100, skip: int = 0) -> GetInterviewReadyDto:
+    async def etag(self, user_id: str, limit: int = 100, skip: int = 0, include_archive: bool = False) -> str:
+        """ETag del historial sin cargarlo: cambia si se añade, borra o modifica alguna entrevista"""
+        summary = await self.interview_ready_repository.find_history_version(
+            user_id=user_id, include_archive=include_archive
+        )
+        return weak_etag(user_id, summary["total"], summary["version"], summary["updated_at"], limit, skip,
+                         include_archive)
+
+    async def execute(self, user_id: str,limit: int = 100, skip: int = 0,
+                      include_archive: bool = False) -> GetInterviewReadyDto:
       try:
           interview = await self.interview_ready_repository.find_all_by_user_id(
               user_id=user_id,
               limit=limit, 
-              skip=skip 
+              skip=skip,
+              include_archive=include_archive
           )
-          print(f"Found {interview} interviews for user ID: {user_id}")
+          logger.debug("Found %d interviews for user ID: %s", len(interview), user_id)
           interview_ready_dto = [InterviewReadyDto(
               user_id=interview_data["userId"],
               user_seniority=interview_data["user_seniority"],
@@ -37,5 +51,5 @@ class GetInterviewReadyUseCase():
               raise ValueError("Interview not found for the given user ID")
           return get_interview_ready_dto
       except Exception as e:
-          print(f"Error in GetInterviewReadyUseCase: {e}")
+          logger.error("Error in GetInterviewReadyUseCase: %s", e)
           raise Exception("Failed to execute GetInterviewReadyUseCase")
@@ -0,0 +1,42 @@
+import logging
+from domain.repositories.user_interview_stats_repository import UserInterviewStatsRepository
+from application.dto.get_user_interview_stats_dto import CompetencyAverageDto, GetUserInterviewStatsDto
+
+logger = logging.getLogger(__name__)
+
+
+class GetUserInterviewStatsUseCase():
+    def __init__(self, user_interview_stats_repository: UserInterviewStatsRepository):
+        self.user_interview_stats_repository = user_interview_stats_repository
+
+    async def execute(self, user_id: str) -> GetUserInterviewStatsDto:
+        try:
+            stats = await self.user_interview_stats_repository.find_by_user_id(user_id)
+            if not stats:
+                return GetUserInterviewStatsDto(
+                    user_id=user_id,
+                    total_points=0,
+                    interviews_completed=0,
+                    average_overall_score=0.0,
+                    interviews_by_type={},
+                    competencies=[],
+                    updated_at=""
+                )
+            competencies = [CompetencyAverageDto(
+                name=competency.name,
+                average_score=round(competency.score_sum / competency.count, 2) if competency.count else 0.0,
+                count=competency.count
+            ) for competency in stats.competencies.values()]
+            competencies.sort(key=lambda competency: competency.name)
+            return GetUserInterviewStatsDto(
+                user_id=user_id,
+                total_points=stats.total_points,
+                interviews_completed=stats.interviews_completed,
+                average_overall_score=round(stats.overall_score_sum / stats.interviews_completed, 2) if stats.interviews_completed else 0.0,
+                interviews_by_type=stats.interviews_by_type,
+                competencies=competencies,
+                updated_at=str(stats.updated_at) if stats.updated_at else ""
+            )
+        except Exception as e:
+            logger.error("Error in GetUserInterviewStatsUseCase: %s", e)
+            raise Exception("Failed to execute GetUserInterviewStatsUseCase") from e
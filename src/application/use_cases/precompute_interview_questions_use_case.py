@@ -0,0 +1,71 @@
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+
+from application.dto.profile_update_message_dto import ProfileUpdateMessageDto
+from application.use_cases.create_interview_ready_use_case import generate_question_set
+from domain.entities.precomputed_question_set import PrecomputedQuestionSet
+from domain.repositories.precomputed_question_set_repository import PrecomputedQuestionSetRepository
+
+logger = logging.getLogger(__name__)
+
+
+class PrecomputeInterviewQuestionsUseCase:
+    """Genera por adelantado los sets de preguntas del nuevo perfil de un usuario.
+
+    targets son las combinaciones (type, question_number) a precalcular, en orden de
+    prioridad; nunca se guardan más de max_pending sets sin reclamar por usuario.
+    """
+
+    def __init__(self, precomputed_question_set_repository: PrecomputedQuestionSetRepository, interview_llm,
+                 targets: List[Dict], max_pending: int = 3, ttl_hours: int = 72):
+        self.precomputed_question_set_repository = precomputed_question_set_repository
+        self.interview_llm = interview_llm
+        self.targets = targets
+        self.max_pending = max_pending
+        self.ttl_hours = ttl_hours
+
+    async def execute(self, profile: ProfileUpdateMessageDto) -> int:
+        """Devuelve cuántos sets se generaron"""
+        repository = self.precomputed_question_set_repository
+        dropped = await repository.delete_other_profiles(
+            profile.user_id, profile.user_seniority, profile.user_specialization
+        )
+        if dropped:
+            logger.info("Dropped %d precomputed sets of a previous profile", dropped, extra={"user_id": profile.user_id})
+
+        generated = 0
+        for target in self.targets:
+            if await repository.count_pending(profile.user_id) >= self.max_pending:
+                logger.debug("Precompute cap reached for user %s", profile.user_id)
+                break
+            interview_type, question_number = target["type"], int(target["question_number"])
+            # Mensajes repetidos (redelivery, varios cambios seguidos) no generan sets duplicados
+            if await repository.has_set(profile.user_id, profile.user_seniority, profile.user_specialization,
+                                        interview_type, question_number):
+                continue
+            questions = await generate_question_set(
+                self.interview_llm,
+                num_questions=question_number,
+                seniority=profile.user_seniority,
+                specialization=profile.user_specialization,
+                user_id=profile.user_id
+            )
+            if not questions:
+                logger.warning("Empty question set generated for user %s", profile.user_id)
+                continue
+            await repository.create(PrecomputedQuestionSet(
+                user_id=profile.user_id,
+                user_seniority=profile.user_seniority,
+                user_specialization=profile.user_specialization,
+                type=interview_type,
+                question_number=question_number,
+                questions=questions,
+                expires_at=datetime.now(timezone.utc) + timedelta(hours=self.ttl_hours)
+            ))
+            generated += 1
+
+        # Dos mensajes del mismo usuario procesados a la vez pueden pasarse del límite
+        await repository.trim_pending(profile.user_id, self.max_pending)
+        logger.info("Precomputed %d question sets", generated, extra={"user_id": profile.user_id})
+        return generated
@@ -0,0 +1,61 @@
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from domain.entities.interview_ready import FeedBack
+from domain.repositories.interview_ready_repository import InterviewReadyRepository
+from domain.repositories.user_interview_stats_repository import UserInterviewStatsRepository
+
+logger = logging.getLogger(__name__)
+
+
+class RebuildUserInterviewStatsUseCase():
+    """Reconstruye user_interview_stats desde el historial, usuario por usuario y en lotes."""
+    def __init__(self, interview_ready_repository: InterviewReadyRepository,
+                 user_interview_stats_repository: UserInterviewStatsRepository):
+        self.interview_ready_repository = interview_ready_repository
+        self.user_interview_stats_repository = user_interview_stats_repository
+
+    async def execute(self, batch_size: int = 500) -> Dict[str, int]:
+        pending: List[Dict[str, Any]] = []
+        current: Optional[Dict[str, Any]] = None
+        users = interviews = skipped = 0
+
+        # El cursor viene ordenado por userId: cada usuario se acumula una sola vez
+        async for interview in self.interview_ready_repository.iter_completed_feedback(batch_size):
+            try:
+                feedback = FeedBack(**interview["feedback"])
+            except Exception as e:
+                logger.warning("Skipping interview %s with invalid feedback: %s", interview.get('_id'), e)
+                skipped += 1
+                continue
+
+            if current is None or current["userId"] != interview["userId"]:
+                if current is not None:
+                    pending.append(current)
+                    users += 1
+                current = self._empty(interview["userId"])
+                if len(pending) >= batch_size:
+                    await self.user_interview_stats_repository.replace_many(pending)
+                    pending = []
+
+            inc, fields = self.user_interview_stats_repository.increments(interview.get("type", ""), feedback)
+            self.user_interview_stats_repository.apply_increments(current, inc, fields)
+            interviews += 1
+
+        if current is not None:
+            pending.append(current)
+            users += 1
+        await self.user_interview_stats_repository.replace_many(pending)
+        return {"users": users, "interviews": interviews, "skipped": skipped}
+
+    @staticmethod
+    def _empty(user_id: str) -> Dict[str, Any]:
+        return {
+            "userId": user_id,
+            "total_points": 0,
+            "interviews_completed": 0,
+            "overall_score_sum": 0,
+            "interviews_by_type": {},
+            "competencies": {},
+            "updated_at": datetime.now(timezone.utc),
+        }
@@ -0,0 +1,200 @@
+import asyncio
+import json
+import logging
+import os
+import time
+from concurrent.futures import Executor
+from typing import Any, Dict, List, Optional, Tuple
+
+from bson import ObjectId
+from pydantic import BaseModel
+
+from domain.entities.interview_ready import Question
+from domain.repositories.interview_ready_repository import InterviewReadyRepository
+from domain.services.scoring_engine import InterviewScore, ScoringEngine
+from infrastructure.config.app_config import config
+from infrastructure.external_services.interview_llm import InterviewLLM
+from infrastructure.external_services.interview_prompts import (
+    build_complete_feedback_prompt,
+    build_summary_feedback_prompt,
+    parse_json_response,
+    to_feedback,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def parse_feedback_result(text: Optional[str],
+                          score: Optional[Dict[str, Any]] = None) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Parsea y valida la respuesta del LLM; corre en el process pool, así que devuelve tipos simples.
+
+    Con `score` (InterviewScore calculado localmente) la respuesta es solo el resumen.
+    """
+    data = parse_json_response(text)
+    if data is None:
+        return None, "invalid JSON"
+    if score is not None:
+        summary = data.get("summary_feedback")
+        if not summary:
+            return None, "missing summary_feedback"
+        return InterviewScore(**score).to_feedback(summary).model_dump(), None
+    try:
+        feedback = to_feedback(data)
+    except (KeyError, TypeError, ValueError) as e:
+        return None, f"invalid feedback: {e}"
+    if not 0 <= feedback.overall_score <= 100:
+        return None, f"overall_score out of range: {feedback.overall_score}"
+    if not feedback.competency_breakdown:
+        return None, "empty competency_breakdown"
+    if any(not 0 <= item.score <= 100 for item in feedback.competency_breakdown):
+        return None, "competency score out of range"
+    if feedback.points_earned < 0:
+        return None, f"negative points_earned: {feedback.points_earned}"
+    return feedback.model_dump(), None
+
+
+class RescoreReport(BaseModel):
+    scanned: int = 0
+    rescored: int = 0
+    # Puntuadas con ScoringEngine (el LLM solo redacta el resumen)
+    scored_locally: int = 0
+    failed: int = 0
+    written: int = 0
+    # Entrevistas que cambiaron entre la lectura y la escritura; se quedan como estaban
+    skipped_changed: int = 0
+    prompt_tokens: int = 0
+    output_tokens: int = 0
+    elapsed_seconds: float = 0.0
+    interviews_per_second: float = 0.0
+
+
+class RescoreInterviewsUseCase:
+    """Recalcula el feedback de entrevistas completadas por el mismo camino que GenerateInterviewFeedbackUseCase.
+
+    Con notas por respuesta, la puntuación sale de ScoringEngine y el LLM solo redacta el
+    resumen; sin ellas, el LLM puntúa todo el set con generate_complete_feedback.
+
+    Recorre las entrevistas con un cursor en orden de _id y, por lotes: lanza hasta
+    `concurrency` llamadas al LLM a la vez, parsea y valida en `parse_executor` (un
+    process pool) y escribe el lote con un bulk_write sin orden. Tras cada lote se guarda
+    el último _id en el checkpoint. En dry-run no escribe nada y solo informa del ritmo.
+    """
+
+    def __init__(self, interview_ready_repository: InterviewReadyRepository, interview_llm: InterviewLLM,
+                 parse_executor: Executor, concurrency: int = 8, batch_size: int = 200,
+                 checkpoint_path: Optional[str] = None, dry_run: bool = False,
+                 scoring_engine: Optional[ScoringEngine] = None):
+        self.interview_ready_repository = interview_ready_repository
+        self.scoring_engine = scoring_engine
+        self.interview_llm = interview_llm
+        self.parse_executor = parse_executor
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.checkpoint_path = checkpoint_path
+        self.dry_run = dry_run
+
+    async def execute(self, completed_before=None, interview_type: Optional[str] = None,
+                      limit: Optional[int] = None) -> RescoreReport:
+        report = RescoreReport()
+        after_id = self._load_checkpoint()
+        if after_id is not None:
+            logger.info("Resuming rescoring after %s", after_id)
+        started = time.perf_counter()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        batch: List[Dict[str, Any]] = []
+
+        async for interview in self.interview_ready_repository.iter_for_rescoring(
+                after_id=after_id, completed_before=completed_before, interview_type=interview_type,
+                batch_size=self.batch_size):
+            batch.append(interview)
+            report.scanned += 1
+            if len(batch) >= self.batch_size or (limit and report.scanned >= limit):
+                await self._process_batch(batch, semaphore, report)
+                batch = []
+                self._log_progress(report, started)
+            if limit and report.scanned >= limit:
+                break
+        if batch:
+            await self._process_batch(batch, semaphore, report)
+
+        report.elapsed_seconds = round(time.perf_counter() - started, 2)
+        report.interviews_per_second = round(report.scanned / report.elapsed_seconds, 2) if report.elapsed_seconds else 0.0
+        return report
+
+    async def _process_batch(self, batch: List[Dict[str, Any]], semaphore: asyncio.Semaphore,
+                             report: RescoreReport) -> None:
+        results = await asyncio.gather(*(self._rescore(interview, semaphore, report) for interview in batch))
+        updates = [update for update in results if update is not None]
+        report.rescored += len(updates)
+        report.failed += len(batch) - len(updates)
+        if updates and not self.dry_run:
+            matched, modified = await self.interview_ready_repository.bulk_update_feedback(updates)
+            report.written += modified
+            report.skipped_changed += len(updates) - matched
+        if not self.dry_run:
+            self._save_checkpoint(batch[-1]["_id"])
+
+    async def _rescore(self, interview: Dict[str, Any], semaphore: asyncio.Semaphore,
+                       report: RescoreReport) -> Optional[Dict[str, Any]]:
+        questions = [Question(**q) for q in interview.get("questions", [])]
+        interview_type = interview.get("type", "behavioral")
+        score = None
+        if self.scoring_engine is not None and self.scoring_engine.is_scorable(questions):
+            score = self.scoring_engine.score(questions)
+        if score is None:
+            operation = "generate_complete_feedback"
+            prompt = build_complete_feedback_prompt(
+                questions, interview["user_seniority"], interview["user_specialization"], interview_type
+            )
+        else:
+            operation = "generate_summary_feedback"
+            prompt = build_summary_feedback_prompt(
+                [q for q in questions if q.answer is not None],
+                interview["user_seniority"],
+                interview["user_specialization"],
+                interview_type,
+                score.overall_score,
+                [c.model_dump() for c in score.competency_breakdown],
+                score.focus_questions
+            )
+        async with semaphore:
+            try:
+                completion = await self.interview_llm.complete(
+                    prompt, operation, config.llm_max_output_tokens.get(operation)
+                )
+            except Exception as e:
+                logger.warning("Rescoring call failed for %s: %s", interview["_id"], e)
+                return None
+        report.prompt_tokens += completion.prompt_tokens
+        report.output_tokens += completion.output_tokens
+        loop = asyncio.get_running_loop()
+        feedback, error = await loop.run_in_executor(
+            self.parse_executor, parse_feedback_result, completion.text, score.model_dump() if score else None
+        )
+        if feedback is None:
+            logger.warning("Rescoring result rejected for %s: %s", interview["_id"], error)
+            return None
+        if score is not None:
+            report.scored_locally += 1
+        # Sin version (entrevistas anteriores al campo) el guard exige que siga sin tenerlo
+        return {"_id": interview["_id"], "userId": interview["userId"], "version": interview.get("version"),
+                "feedback": feedback}
+
+    def _log_progress(self, report: RescoreReport, started: float) -> None:
+        elapsed = time.perf_counter() - started
+        logger.info("Rescored %d/%d (%d failed, %d written) at %.1f interviews/s", report.rescored, report.scanned,
+                    report.failed, report.written, report.scanned / elapsed if elapsed else 0.0)
+
+    def _load_checkpoint(self) -> Optional[ObjectId]:
+        if self.dry_run or not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return None
+        with open(self.checkpoint_path, encoding="utf-8") as f:
+            return ObjectId(json.load(f)["after_id"])
+
+    def _save_checkpoint(self, after_id: Any) -> None:
+        if not self.checkpoint_path:
+            return
+        tmp_path = f"{self.checkpoint_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"after_id": str(after_id)}, f)
+        os.replace(tmp_path, self.checkpoint_path)
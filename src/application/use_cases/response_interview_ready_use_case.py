@@ -1,15 +1,44 @@
 
+import logging
 from application.dto.create_interview_response_dto import CreateInterviewResponseDTO
 from application.use_cases.base_interview_ready_use_case import BaseInterviewReadyUseCase
+from infrastructure.external_services.interview_llm import LLMBudgetExceededError
+from infrastructure.concurrency.single_flight import SingleFlight, single_flight_key
+from infrastructure.observability.tracing import traced
+from infrastructure.external_services.interview_prompts import parse_score
+from infrastructure.session.active_session_store import SessionOwnedElsewhereError
+from application.services.adaptive_interview_service import AdaptiveInterviewService
+from application.services.lazy_question_service import LazyQuestionService
+from application.services.answer_prescreener import AnswerPrescreener
+from application.services.feedback_cache import FeedbackCache
 from datetime import datetime, timezone
+from typing import Optional
+
+logger = logging.getLogger(__name__)
 class ResponseInterviewReadyUseCase(BaseInterviewReadyUseCase):
+    def __init__(self, interview_ready_repository, interview_llm,
+                 single_flight: Optional[SingleFlight] = None,
+                 adaptive_interview_service: Optional[AdaptiveInterviewService] = None,
+                 lazy_question_service: Optional[LazyQuestionService] = None,
+                 answer_prescreener: Optional[AnswerPrescreener] = None,
+                 feedback_cache: Optional[FeedbackCache] = None):
+        self.single_flight = single_flight
+        self.feedback_cache = feedback_cache
+        self.answer_prescreener = answer_prescreener
+        self.adaptive_interview_service = adaptive_interview_service
+        self.lazy_question_service = lazy_question_service
+        super().__init__(interview_ready_repository, interview_llm)
+
+    @traced("answer_question")
     async def execute(self, id: str, user_response: str, user_id: str) -> CreateInterviewResponseDTO:
         try:
-            print(f"Executing ResponseInterviewReadyUseCase with id: {id}, user_response: {user_response}, user_id: {user_id}")
+            logger.debug("Executing ResponseInterviewReadyUseCase with id: %s, user_response: %d chars, user_id: %s", id, len(user_response), user_id)
             
-            interview = await self.interview_ready_repository.find_by_id(id)
+            interview = await self.interview_ready_repository.find_by_id(id, user_id)
             
             # Validaciones básicas
+            if interview is None:
+                raise ValueError("Interview not found")
             if interview.status != "in_progress":
                 raise ValueError("Interview is not in progress")
             
@@ -20,95 +49,159 @@ class ResponseInterviewReadyUseCase(BaseInterviewReadyUseCase):
             if interview.actual_question is None:
                 raise ValueError("No current question available")
             
-            print(f"Processing response for question ID: {interview.actual_question.id}, User Response: {user_response}")
-            
-           
-            interview.actual_question.answer = user_response
-            
+            logger.debug("Processing response for question ID: %s", interview.actual_question.id)
+
+            if self.single_flight is not None:
+                # Reintentos idénticos del cliente esperan la misma ejecución en curso
+                key = single_flight_key("answer_question", id, interview.actual_question.id, user_response)
+                return await self.single_flight.run(
+                    key,
+                    lambda: self._answer(interview, user_response, user_id),
+                    CreateInterviewResponseDTO
+                )
+            return await self._answer(interview, user_response, user_id)
             
-            gemini_response = await self.gemini_service.generate_feedback(
+        except (LLMBudgetExceededError, SessionOwnedElsewhereError):
+            raise
+        except Exception as e:
+            logger.exception("Error in execute method: %s", e)
+            raise ValueError(f"An error occurred while executing the use case: {str(e)}")
+
+    async def _evaluate(self, interview, user_response: str, user_id: str) -> dict:
+        verdict = None
+        if self.answer_prescreener is not None:
+            verdict = await self.answer_prescreener.screen(
                 question=interview.actual_question.question,
-                user_response=user_response,
-                seniority=interview.user_seniority,
-                specialization=interview.user_specialization,
-                interview_type=interview.type
+                answer=user_response,
+                interview_type=interview.type,
+                question_id=interview.actual_question.id
             )
-            
-            feedback = gemini_response.get('feedback', '')
-            good_question=gemini_response.get("good_question",False)
-            interview.actual_question.feedback = feedback
-            
-            for q in interview.questions:
-                if q.id == interview.actual_question.id:
-                    q.answer = user_response
-                    q.feedback = feedback
-                    break
-            interview.previus_question = interview.actual_question
-            
+            if verdict is not None and verdict.decided:
+                # Respuesta vacía o mínima evidente: feedback de plantilla sin llamar al LLM
+                return verdict.response()
 
-            
-            if True :
+        cache_context = dict(
+            question=interview.actual_question.question,
+            answer=user_response,
+            interview_type=interview.type,
+            seniority=interview.user_seniority,
+            specialization=interview.user_specialization
+        )
+        if self.feedback_cache is not None:
+            hit = await self.feedback_cache.lookup(**cache_context)
+            if hit is not None:
+                # La muestra de calidad no se carga al presupuesto del usuario
+                self.feedback_cache.sample(
+                    hit, lambda: self._generate_feedback(interview, user_response, None), interview.type
+                )
+                return dict(hit.response)
+
+        gemini_response = await self._generate_feedback(interview, user_response, user_id)
+        if verdict is not None:
+            self.answer_prescreener.record_shadow(verdict, gemini_response, interview.type)
+        if self.feedback_cache is not None:
+            await self.feedback_cache.store(**cache_context, response=gemini_response)
+        return gemini_response
+
+    async def _generate_feedback(self, interview, user_response: str, user_id: Optional[str]):
+        return await self.interview_llm.generate_feedback(
+            question=interview.actual_question.question,
+            user_response=user_response,
+            seniority=interview.user_seniority,
+            specialization=interview.user_specialization,
+            interview_type=interview.type,
+            user_id=user_id
+        )
+
+    async def _answer(self, interview, user_response: str, user_id: str) -> CreateInterviewResponseDTO:
+        interview.actual_question.answer = user_response
+        
+        gemini_response = await self._evaluate(interview, user_response, user_id)
+        
+        feedback = gemini_response.get('feedback', '')
+        good_question=gemini_response.get("good_question",False)
+        score = parse_score(gemini_response.get("score"))
+        interview.actual_question.feedback = feedback
+        interview.actual_question.score = score
+        
+        for q in interview.questions:
+            if q.id == interview.actual_question.id:
+                q.answer = user_response
+                q.feedback = feedback
+                q.score = score
+                break
+        interview.previus_question = interview.actual_question
+
+        if interview.adaptive and self.adaptive_interview_service is not None:
+            # Recorta tramos o genera el siguiente lote según good_question
+            await self.adaptive_interview_service.advance(interview, good_question, user_id)
+        elif interview.questions_pending > 0 and self.lazy_question_service is not None \
+                and interview.questions[-1].id == interview.actual_question.id:
+            # Última pregunta cargada: esperar (o generar) el siguiente lote
+            await self.lazy_question_service.ensure_next(interview, user_id)
+        
+
+        
+        if True :
 
-                
-            
-            
-                current_question_id = interview.actual_question.id
-                next_question_found = False
-            
-                for i, question in enumerate(interview.questions):
-                    if question.id == current_question_id:
-                    # Verificar si hay una siguiente pregunta
-                        if i + 1 < len(interview.questions):
-                            interview.actual_question = interview.questions[i + 1]
-                            next_question_found = True
-                            print(f"Moving to next question: {interview.actual_question.id}")
-                        break
-            
-            # Si no hay más preguntas, completar la entrevista
-                if not next_question_found:
-                    interview.status = "completed"
-                    interview.end_at = datetime.now(timezone.utc)
-                # IMPORTANTE: Mantener actual_question con la última pregunta
-                # NO asignar None aquí
-                    print("Interview completed")
-            else:
-                interview.actual_question=interview.actual_question
             
-            # Actualizar en la base de datos
+        
+        
+            current_question_id = interview.actual_question.id
+            next_question_found = False
+        
+            for i, question in enumerate(interview.questions):
+                if question.id == current_question_id:
+                # Verificar si hay una siguiente pregunta
+                    if i + 1 < len(interview.questions):
+                        interview.actual_question = interview.questions[i + 1]
+                        next_question_found = True
+                        logger.debug("Moving to next question: %s", interview.actual_question.id)
+                    break
+        
+        # Si no hay más preguntas, completar la entrevista
+            if not next_question_found:
+                interview.status = "completed"
+                interview.end_at = datetime.now(timezone.utc)
+            # IMPORTANTE: Mantener actual_question con la última pregunta
+            # NO asignar None aquí
+                logger.info("Interview completed", extra={"interview_id": str(interview.id)})
+        else:
+            interview.actual_question=interview.actual_question
+        
+        # Actualizar en la base de datos
+        if interview.questions_pending > 0:
+            # El set sigue creciendo en segundo plano: no reescribir `questions`
+            updated_interview = await self.interview_ready_repository.save_answer(interview, interview.previus_question.id)
+        else:
             updated_interview = await self.interview_ready_repository.update(interview)
-            print(f"InterviewReady updated successfully with ID: {updated_interview.id}")
-            
-            # Construir respuesta según el estado
-            if updated_interview.status == "completed":
-                return CreateInterviewResponseDTO(
-                    id=str(updated_interview.id),
-                    user_id=updated_interview.userId,
-                    current_question=updated_interview.previus_question,
-                    type=updated_interview.type,
-                    next_question=None,  # No hay siguiente pregunta
-                    init_at=str(updated_interview.init_at),
-                    status=updated_interview.status,
-                    question_number=updated_interview.question_number,
-                    actual_question=updated_interview.previus_question.id,
-                    feedback=updated_interview.previus_question.feedback,
-                    message="Interview completed successfully"
-                )
-            else:
-                return CreateInterviewResponseDTO(
-                    id=str(updated_interview.id),
-                    user_id=updated_interview.userId,
-                    type=updated_interview.type,
-                    current_question=updated_interview.previus_question,
-                    next_question=updated_interview.actual_question,
-                    init_at=str(updated_interview.init_at),
-                    status=updated_interview.status,
-                    question_number=updated_interview.question_number,
-                    actual_question=updated_interview.actual_question.id,
-                    feedback=updated_interview.previus_question.feedback
-                )
-            
-        except Exception as e:
-            import traceback
-            print(f"Error in execute method: {e}")
-            print(f"Full traceback: {traceback.format_exc()}")
-            raise ValueError(f"An error occurred while executing the use case: {str(e)}")
\ No newline at end of file
+        logger.debug("InterviewReady updated successfully with ID: %s", updated_interview.id)
+        
+        # Construir respuesta según el estado
+        if updated_interview.status == "completed":
+            return CreateInterviewResponseDTO(
+                id=str(updated_interview.id),
+                user_id=updated_interview.userId,
+                current_question=updated_interview.previus_question,
+                type=updated_interview.type,
+                next_question=None,  # No hay siguiente pregunta
+                init_at=str(updated_interview.init_at),
+                status=updated_interview.status,
+                question_number=updated_interview.question_number,
+                actual_question=updated_interview.previus_question.id,
+                feedback=updated_interview.previus_question.feedback,
+                message="Interview completed successfully"
+            )
+        else:
+            return CreateInterviewResponseDTO(
+                id=str(updated_interview.id),
+                user_id=updated_interview.userId,
+                type=updated_interview.type,
+                current_question=updated_interview.previus_question,
+                next_question=updated_interview.actual_question,
+                init_at=str(updated_interview.init_at),
+                status=updated_interview.status,
+                question_number=updated_interview.question_number,
+                actual_question=updated_interview.actual_question.id,
+                feedback=updated_interview.previus_question.feedback
+            )
@@ -0,0 +1,23 @@
+from beanie import Document
+from pydantic import Field
+from pymongo import ASCENDING, IndexModel
+from typing import Any, Dict, Optional
+from datetime import datetime, timezone
+
+
+class IdempotencyRecord(Document):
+    """Respuesta guardada de una petición con Idempotency-Key, para devolverla en los reintentos."""
+    key: str
+    request_hash: str
+    status: str = "processing"
+    response: Optional[Dict[str, Any]] = None
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    # Mongo borra el registro al llegar a esta fecha (índice TTL)
+    expires_at: datetime
+
+    class Settings:
+        collection = "idempotency_records"
+        indexes = [
+            IndexModel([("key", ASCENDING)], unique=True),
+            IndexModel([("expires_at", ASCENDING)], expireAfterSeconds=0)
+        ]
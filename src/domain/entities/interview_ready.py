@@ -1,9 +1,14 @@
 from beanie import Document
+from pymongo import ASCENDING, DESCENDING, IndexModel
 from pydantic import BaseModel,Field
 from typing import List, Optional
 from datetime import datetime,timezone
 
 
+# in_progress → completed, o expired si se abandona (InterviewSweeper)
+INTERVIEW_STATUSES = ("in_progress", "completed", "expired")
+
+
 class CompetencyBreakdown(BaseModel):
     name: str
     score: int
@@ -20,10 +25,22 @@ class Question(BaseModel):
     question: str
     answer: Optional[str] = None
     feedback: Optional[str] = None
+    # Nota 0-100 de la respuesta (rúbrica de domain.services.scoring_engine)
+    score: Optional[int] = None
     competency: str
     difficulty: str
 
 
+class AdaptiveState(BaseModel):
+    """Progreso de una entrevista adaptativa: tramos de dificultad y señales good_question."""
+    tier_sizes: List[int]
+    tier: int = 0
+    tier_generated: int = 0
+    tier_answers: List[bool] = Field(default_factory=list)
+    answers: List[bool] = Field(default_factory=list)
+    stop_reason: Optional[str] = None
+
+
 class InterviewReady(Document):
     userId:str
     type: str
@@ -40,9 +57,27 @@ class InterviewReady(Document):
     points_earned: int = 0
     feedback: Optional[FeedBack] = None
     updated_at: Optional[datetime] = None
+    # Se incrementa en cada escritura; junto con updated_at forma el ETag
+    version: int = 0
+    stats_recorded: bool = False
+    # En modo adaptativo question_number es el máximo; las preguntas se generan por tramos
+    adaptive: bool = False
+    adaptive_state: Optional[AdaptiveState] = None
+    # Generación incremental: preguntas que aún se están generando en segundo plano
+    questions_pending: int = 0
+    # Worker que tiene la sesión activa en memoria (write-behind) y hasta cuándo
+    session_owner: Optional[str] = None
+    session_lease_until: Optional[datetime] = None
     
     class Settings:
         collection = "interview_ready"
+        indexes = [
+            IndexModel([("userId", ASCENDING), ("status", ASCENDING), ("init_at", DESCENDING)]),
+            # Cubre el cálculo del ETag del historial sin leer los documentos
+            IndexModel([("userId", ASCENDING), ("status", ASCENDING), ("updated_at", DESCENDING), ("version", ASCENDING)]),
+            # Barrido de entrevistas abandonadas y archivado de las antiguas
+            IndexModel([("status", ASCENDING), ("updated_at", ASCENDING)])
+        ]
    
         
     
@@ -0,0 +1,30 @@
+from beanie import Document
+from pydantic import BaseModel, Field
+from pymongo import ASCENDING, IndexModel
+from typing import Dict, Optional
+from datetime import datetime, timezone
+
+
+class OperationUsage(BaseModel):
+    calls: int = 0
+    prompt_tokens: int = 0
+    output_tokens: int = 0
+    cached_tokens: int = 0
+
+
+class LLMUsage(Document):
+    """Consumo de tokens de un usuario en un día (UTC), total y por operación."""
+    userId: str
+    day: str
+    calls: int = 0
+    prompt_tokens: int = 0
+    output_tokens: int = 0
+    cached_tokens: int = 0
+    operations: Dict[str, OperationUsage] = Field(default_factory=dict)
+    updated_at: Optional[datetime] = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+    class Settings:
+        collection = "llm_usage"
+        indexes = [
+            IndexModel([("userId", ASCENDING), ("day", ASCENDING)], unique=True)
+        ]
@@ -0,0 +1,28 @@
+from beanie import Document
+from pydantic import Field
+from pymongo import ASCENDING, IndexModel
+from typing import List
+from datetime import datetime, timezone
+
+from domain.entities.interview_ready import Question
+
+
+class PrecomputedQuestionSet(Document):
+    """Set de preguntas generado al cambiar el perfil, listo para que el siguiente POST /questions/generate lo reclame."""
+    user_id: str
+    user_seniority: str
+    user_specialization: str
+    type: str
+    question_number: int
+    questions: List[Question]
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    # Mongo borra el set si nadie lo reclama antes de esta fecha (índice TTL)
+    expires_at: datetime
+
+    class Settings:
+        collection = "precomputed_question_sets"
+        indexes = [
+            IndexModel([("user_id", ASCENDING), ("user_seniority", ASCENDING), ("user_specialization", ASCENDING),
+                        ("type", ASCENDING), ("question_number", ASCENDING), ("created_at", ASCENDING)]),
+            IndexModel([("expires_at", ASCENDING)], expireAfterSeconds=0)
+        ]
@@ -0,0 +1,20 @@
+from beanie import Document
+from pymongo import ASCENDING, IndexModel
+from datetime import datetime
+
+
+class RateLimitBucket(Document):
+    """Token bucket compartido entre workers (rate_limit_backend = mongo)."""
+    key: str
+    tokens: float
+    updated_at: datetime
+    allowed: bool = True
+    # Buckets sin uso se borran solos (índice TTL); al reaparecer empiezan llenos
+    purge_at: datetime
+
+    class Settings:
+        collection = "rate_limit_buckets"
+        indexes = [
+            IndexModel([("key", ASCENDING)], unique=True),
+            IndexModel([("purge_at", ASCENDING)], expireAfterSeconds=0)
+        ]
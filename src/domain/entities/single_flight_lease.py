@@ -0,0 +1,23 @@
+from beanie import Document
+from pymongo import ASCENDING, IndexModel
+from typing import Any, Dict, Optional
+from datetime import datetime
+
+
+class SingleFlightLease(Document):
+    """Marca que un worker está ejecutando una operación; al terminar guarda el resultado
+    para que las peticiones idénticas de otros workers lo reutilicen."""
+    key: str
+    owner: str
+    expires_at: datetime
+    done: bool = False
+    result: Optional[Dict[str, Any]] = None
+    # Mongo borra el documento al llegar a esta fecha (índice TTL)
+    purge_at: datetime
+
+    class Settings:
+        collection = "single_flight_leases"
+        indexes = [
+            IndexModel([("key", ASCENDING)], unique=True),
+            IndexModel([("purge_at", ASCENDING)], expireAfterSeconds=0)
+        ]
@@ -0,0 +1,34 @@
+from beanie import Document
+from pydantic import BaseModel, Field
+from pymongo import ASCENDING, IndexModel
+from typing import Dict, Optional
+from datetime import datetime, timezone
+
+
+class CompetencyStats(BaseModel):
+    name: str
+    score_sum: int = 0
+    count: int = 0
+
+
+class UserInterviewStats(Document):
+    """Rollup por usuario que se actualiza con $inc cada vez que se guarda un feedback."""
+    userId: str
+    total_points: int = 0
+    interviews_completed: int = 0
+    overall_score_sum: int = 0
+    interviews_by_type: Dict[str, int] = Field(default_factory=dict)
+    # Las llaves son el nombre de la competencia normalizado (ver competency_key)
+    competencies: Dict[str, CompetencyStats] = Field(default_factory=dict)
+    updated_at: Optional[datetime] = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+    class Settings:
+        collection = "user_interview_stats"
+        indexes = [
+            IndexModel([("userId", ASCENDING)], unique=True)
+        ]
+
+
+def competency_key(name: str) -> str:
+    """Mongo no admite '.' ni '$' al inicio en llaves de subdocumentos."""
+    return name.strip().lower().replace(".", "_").replace("$", "_") or "unknown"
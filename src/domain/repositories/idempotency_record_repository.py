@@ -0,0 +1,40 @@
+from typing import Any, Dict, Optional
+from datetime import datetime, timedelta, timezone
+from pymongo.errors import DuplicateKeyError
+from domain.entities.idempotency_record import IdempotencyRecord
+from domain.repositories.base_repository import BaseRepository
+
+
+class IdempotencyRecordRepository(BaseRepository[IdempotencyRecord]):
+    def __init__(self):
+        super().__init__(IdempotencyRecord)
+
+    async def claim(self, key: str, request_hash: str, ttl_seconds: int) -> Optional[Dict[str, Any]]:
+        """Registra la petición como en proceso. Devuelve None si se reclamó, o el registro existente"""
+        now = datetime.now(timezone.utc)
+        collection = IdempotencyRecord.get_motor_collection()
+        try:
+            await collection.insert_one({
+                "key": key,
+                "request_hash": request_hash,
+                "status": "processing",
+                "response": None,
+                "created_at": now,
+                "expires_at": now + timedelta(seconds=ttl_seconds)
+            })
+            return None
+        except DuplicateKeyError:
+            existing = await collection.find_one({"key": key})
+            if existing is None:
+                # Expiró entre el insert y la lectura
+                return await self.claim(key, request_hash, ttl_seconds)
+            return existing
+
+    async def complete(self, key: str, response: Dict[str, Any]) -> None:
+        await IdempotencyRecord.get_motor_collection().update_one(
+            {"key": key},
+            {"$set": {"status": "completed", "response": response}}
+        )
+
+    async def release(self, key: str) -> None:
+        await IdempotencyRecord.get_motor_collection().delete_one({"key": key, "status": "processing"})
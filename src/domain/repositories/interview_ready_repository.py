@@ -1,17 +1,137 @@
-from typing import Dict, Optional, List
-from domain.entities.interview_ready import InterviewReady
+import logging
+from bson import ObjectId
+from pymongo import ASCENDING, DESCENDING, IndexModel, ReplaceOne, DeleteOne, UpdateOne
+from typing import Any, AsyncIterator, Dict, Optional, List, Tuple
+from domain.entities.interview_ready import InterviewReady, Question
 from domain.repositories.base_repository import BaseRepository
-from datetime import datetime
+from infrastructure.observability.tracing import traced
+from datetime import datetime, timedelta, timezone
+
+logger = logging.getLogger(__name__)
+
+# Entrevistas completadas antiguas; se leen de aquí cuando no están en interview_ready
+ARCHIVE_COLLECTION = "interview_ready_archive"
+ARCHIVE_INDEXES = [
+    IndexModel([("userId", ASCENDING), ("status", ASCENDING), ("init_at", DESCENDING)]),
+    IndexModel([("userId", ASCENDING), ("status", ASCENDING), ("updated_at", DESCENDING), ("version", ASCENDING)])
+]
+
+SUMMARY_PROJECTION = {
+    "questions": 0,
+    "actual_question": 0,
+    "previus_question": 0,
+    "feedback": 0
+}
 
 class InterviewReadyRepository(BaseRepository[InterviewReady]):
+    """Preparado para un cluster sharded con shard key userId (hashed o por rangos).
+
+    Las lecturas y escrituras de una entrevista concreta incluyen userId en el filtro
+    para ir a un solo shard; sin él (p.ej. find_by_id sin dueño, el barrido) la consulta
+    se envía a todos. Los pipelines por usuario empiezan siempre con $match por userId.
+    """
     def __init__(self):
         super().__init__(InterviewReady)
 
+    @staticmethod
+    def _key(interview_id, user_id: Optional[str] = None) -> Dict[str, Any]:
+        """Filtro de una entrevista; con el dueño incluye la shard key"""
+        key: Dict[str, Any] = {"_id": ObjectId(interview_id) if isinstance(interview_id, str) else interview_id}
+        if user_id is not None:
+            key["userId"] = user_id
+        return key
+
+    @staticmethod
+    def _version_guard(version: Optional[int]) -> Dict[str, Any]:
+        """Filtro de "sin cambios desde la lectura"; las entrevistas anteriores a `version` no tienen el campo"""
+        return {"version": version} if version is not None else {"version": {"$exists": False}}
+
+    @traced("InterviewReadyRepository.update")
     async def update(self, entity):
-        return await super().update(entity)
+        entity.updated_at = datetime.utcnow()
+        entity.version += 1
+        # $set con la shard key en el filtro en lugar de save(): dirigido a un shard y sin upsert
+        key = self._key(entity.id, entity.userId)
+        update = {"$set": entity.model_dump(exclude={"id", "revision_id"})}
+        result = await InterviewReady.get_motor_collection().update_one(key, update)
+        if result.matched_count == 0:
+            # find_by_id también lee del archivo: la escritura va al nivel donde está la entrevista
+            result = await self._archive().update_one(key, update)
+            if result.matched_count == 0:
+                raise ValueError(f"Interview {entity.id} not found")
+        return entity
     
-    async def find_by_id(self, id: str) -> Optional[InterviewReady]:
-        return await self.model_class.get(id)
+    @traced("InterviewReadyRepository.find_by_id")
+    async def find_by_id(self, id: str, user_id: Optional[str] = None) -> Optional[InterviewReady]:
+        """Con user_id la lectura va a un solo shard; sin él se consulta en todos"""
+        if not ObjectId.is_valid(id):
+            return None
+        document = await self._find_one_any_tier(self._key(id, user_id), None)
+        return InterviewReady.model_validate(document) if document is not None else None
+
+    @staticmethod
+    def _archive():
+        return InterviewReady.get_motor_collection().database[ARCHIVE_COLLECTION]
+
+    async def ensure_archive_indexes(self) -> None:
+        await self._archive().create_indexes(ARCHIVE_INDEXES)
+
+    async def _find_one_any_tier(self, query: Dict, projection: Optional[Dict]) -> Optional[Dict]:
+        document = await InterviewReady.get_motor_collection().find_one(query, projection=projection)
+        if document is None:
+            document = await self._archive().find_one(query, projection=projection)
+        return document
+
+    async def _iter_all_tiers(self, query: Dict, projection: Optional[Dict], sort_field: str,
+                              batch_size: int) -> AsyncIterator[Dict]:
+        """Recorre la colección principal y el archivo mezclando ambos cursores en orden de sort_field"""
+        cursors = [
+            collection.find(query, projection=projection).sort(sort_field, 1).batch_size(batch_size).__aiter__()
+            for collection in (InterviewReady.get_motor_collection(), self._archive())
+        ]
+        heads = [await anext(cursor, None) for cursor in cursors]
+        while any(head is not None for head in heads):
+            position = min((i for i, head in enumerate(heads) if head is not None),
+                           key=lambda i: heads[i].get(sort_field))
+            yield heads[position]
+            heads[position] = await anext(cursors[position], None)
+
+    @traced("InterviewReadyRepository.find_version")
+    async def find_version(self, interview_id: str, user_id: Optional[str] = None) -> Optional[Dict]:
+        """Solo userId, updated_at y version (lookup por _id) para responder 304 sin cargar la entrevista"""
+        if not ObjectId.is_valid(interview_id):
+            return None
+        return await self._find_one_any_tier(
+            self._key(interview_id, user_id),
+            {"_id": 0, "userId": 1, "updated_at": 1, "version": 1}
+        )
+
+    async def find_status(self, interview_id: str, user_id: Optional[str] = None) -> Optional[Dict]:
+        """Estado visible para los suscriptores (sin preguntas ni respuestas)"""
+        if not ObjectId.is_valid(interview_id):
+            return None
+        return await self._find_one_any_tier(
+            self._key(interview_id, user_id),
+            {"_id": 0, "userId": 1, "status": 1, "feedback": 1, "points_earned": 1, "end_at": 1}
+        )
+
+    @traced("InterviewReadyRepository.find_history_version")
+    async def find_history_version(self, user_id: str, status: str = "completed", include_archive: bool = False) -> Dict:
+        """Resumen del historial (total, última modificación y suma de versiones), cubierto por índice"""
+        match = {"$match": {"userId": user_id, "status": status}}
+        pipeline = [match]
+        if include_archive:
+            pipeline.append({"$unionWith": {"coll": ARCHIVE_COLLECTION, "pipeline": [match]}})
+        pipeline += [
+            {"$group": {
+                "_id": None,
+                "total": {"$sum": 1},
+                "updated_at": {"$max": "$updated_at"},
+                "version": {"$sum": "$version"}
+            }}
+        ]
+        groups = await InterviewReady.get_motor_collection().aggregate(pipeline).to_list(length=1)
+        return groups[0] if groups else {"total": 0, "updated_at": None, "version": 0}
 
     async def find_by_user_id(self, user_id: str) -> Optional[InterviewReady]:
         """Encuentra una entrevista por user_id"""
@@ -19,61 +139,334 @@ class InterviewReadyRepository(BaseRepository[InterviewReady]):
             interview = await InterviewReady.find_one(InterviewReady.userId == user_id)
             return interview
         except Exception as e:
-            print(f"Error in find_by_user_id: {e}")
+            logger.error("Error in find_by_user_id: %s", e)
             raise e
 
-    async def find_all_by_user_id(self, user_id: str, limit: int = 100, skip: int = 0,status:str="completed") -> List[Dict]:
+    async def find_all_by_user_id(self, user_id: str, limit: int = 100, skip: int = 0,status:str="completed",
+                                  include_archive: bool = False) -> List[Dict]:
 
         try:
             
-            pipeline = [
-                {
-                    "$match": {
-                        "userId": user_id,
-                        "status": status
-                        
-                    }
-                },
-                {
-                    "$project": {
-                        "questions": 0,
-                        "actual_question": 0,
-                        "previus_question": 0,
-                        "feedback": 0
-                    }
-                },
-                {
-                    "$sort": {"init_at": -1}
-                },
-                {
-                    "$skip": skip
-                },
-                {
-                    "$limit": limit
-                }
-            ]
+            pipeline = self.history_pipeline(user_id, limit, skip, status, include_archive)
             
             interviews = await InterviewReady.aggregate(pipeline).to_list()
             
             # 
             for interview in interviews:
-                if "_id" in interview:
-                    interview["id"] = str(interview["_id"])
-                    del interview["_id"]
-                
-                # Convertir fechas a string si es necesario
-                for date_field in ["init_at", "end_at", "updated_at"]:
-                    if interview.get(date_field):
-                        interview[date_field] = interview[date_field].isoformat()
+                self._serialize_summary(interview)
 
             return interviews
         except Exception as e:
-            print(f"Error in find_all_by_user_id: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error in find_all_by_user_id: %s", e)
+            raise e
+
+    @staticmethod
+    def history_pipeline(user_id: str, limit: int = 100, skip: int = 0, status: str = "completed",
+                         include_archive: bool = False) -> List[Dict]:
+        """El $match por userId va primero: con userId como shard key el pipeline corre en un solo shard"""
+        pipeline: List[Dict] = [
+            {
+                "$match": {
+                    "userId": user_id,
+                    "status": status
+                    
+                }
+            },
+            {
+                "$project": SUMMARY_PROJECTION
+            }
+        ]
+        if include_archive:
+            # El historial completo abarca las dos colecciones; se ordena y pagina sobre la unión
+            pipeline.append({"$unionWith": {"coll": ARCHIVE_COLLECTION, "pipeline": pipeline[:2]}})
+        pipeline += [
+            {
+                "$sort": {"init_at": -1}
+            },
+            {
+                "$skip": skip
+            },
+            {
+                "$limit": limit
+            }
+        ]
+        return pipeline
+
+    async def iter_all_by_user_ids(self, user_ids: List[str], limit_per_user: int = 20, status: str = "completed") -> AsyncIterator[Dict]:
+        """Recorre el historial de varios usuarios con un solo pipeline, agrupado por usuario"""
+        pipeline = [
+            {
+                "$match": {
+                    "userId": {"$in": user_ids},
+                    "status": status
+                }
+            },
+            {
+                "$project": {
+                    "questions": 0,
+                    "actual_question": 0,
+                    "previus_question": 0,
+                    "feedback": 0
+                }
+            },
+            {
+                "$group": {
+                    "_id": "$userId",
+                    "interviews": {
+                        "$topN": {
+                            "n": limit_per_user,
+                            "sortBy": {"init_at": -1},
+                            "output": "$$ROOT"
+                        }
+                    },
+                    "total": {"$sum": 1}
+                }
+            }
+        ]
+        try:
+            async for group in InterviewReady.aggregate(pipeline):
+                for interview in group["interviews"]:
+                    self._serialize_summary(interview)
+                yield {
+                    "user_id": group["_id"],
+                    "interviews": group["interviews"],
+                    "total": group["total"]
+                }
+        except Exception as e:
+            logger.error("Error in iter_all_by_user_ids: %s", e)
+            raise e
+
+    async def find_all_by_user_ids(self, user_ids: List[str], limit_per_user: int = 20, status: str = "completed") -> List[Dict]:
+        """Historial de varios usuarios agrupado por usuario"""
+        return [group async for group in self.iter_all_by_user_ids(user_ids, limit_per_user, status)]
+
+    @traced("InterviewReadyRepository.append_questions")
+    async def append_questions(self, interview_id, questions: List[Question], expected_pending: int,
+                               user_id: Optional[str] = None) -> bool:
+        """Añade un lote generado en segundo plano; False si otra ejecución añadió preguntas antes.
+
+        La precondición es el número de preguntas pendientes que vio quien generó el lote:
+        si cambió, el lote ya no continúa el set y se descarta.
+        """
+        result = await InterviewReady.get_motor_collection().update_one(
+            {**self._key(interview_id, user_id), "questions_pending": expected_pending},
+            {
+                "$push": {"questions": {"$each": [q.model_dump() for q in questions]}},
+                "$inc": {"questions_pending": -len(questions), "version": 1},
+                "$set": {"updated_at": datetime.utcnow()}
+            }
+        )
+        return result.modified_count == 1
+
+    @traced("InterviewReadyRepository.save_answer")
+    async def save_answer(self, interview: InterviewReady, question_id: int) -> InterviewReady:
+        """Guarda una respuesta sin reescribir `questions`, que puede estar recibiendo lotes en paralelo"""
+        answered = next(q for q in interview.questions if q.id == question_id)
+        interview.updated_at = datetime.utcnow()
+        interview.version += 1
+        await InterviewReady.get_motor_collection().update_one(
+            self._key(interview.id, interview.userId),
+            {"$inc": {"version": 1},
+             "$set": {
+                "questions.$[q].answer": answered.answer,
+                "questions.$[q].feedback": answered.feedback,
+                "questions.$[q].score": answered.score,
+                "actual_question": interview.actual_question.model_dump() if interview.actual_question else None,
+                "previus_question": interview.previus_question.model_dump() if interview.previus_question else None,
+                "status": interview.status,
+                "end_at": interview.end_at,
+                "updated_at": interview.updated_at,
+            }},
+            array_filters=[{"q.id": question_id}]
+        )
+        return interview
+
+    async def claim_session(self, interview_id, owner: str, lease_seconds: int,
+                            user_id: Optional[str] = None) -> bool:
+        """Toma (o renueva) la sesión activa; False si otro worker la tiene con el lease vigente"""
+        now = datetime.now(timezone.utc)
+        result = await InterviewReady.get_motor_collection().update_one(
+            {**self._key(interview_id, user_id), "$or": [
+                {"session_owner": None},
+                {"session_owner": owner},
+                {"session_lease_until": {"$lt": now}},
+            ]},
+            {"$set": {"session_owner": owner, "session_lease_until": now + timedelta(seconds=lease_seconds)}}
+        )
+        return result.matched_count == 1
+
+    async def flush_session(self, interview: InterviewReady, owner: str, release: bool = False) -> bool:
+        """Escribe la copia en memoria si este worker sigue siendo el dueño de la sesión"""
+        fields = interview.model_dump(exclude={"id", "revision_id"})
+        if release:
+            fields["session_owner"] = None
+            fields["session_lease_until"] = None
+        result = await InterviewReady.get_motor_collection().update_one(
+            {**self._key(interview.id, interview.userId), "session_owner": owner},
+            {"$set": fields}
+        )
+        return result.matched_count == 1
+
+    async def release_sessions(self, owner: str) -> int:
+        """Libera los leases de un dueño que ya no existe (proceso caído)"""
+        result = await InterviewReady.get_motor_collection().update_many(
+            {"session_owner": owner},
+            {"$set": {"session_owner": None, "session_lease_until": None}}
+        )
+        return result.modified_count
+
+    async def mark_stats_recorded(self, interview_id, user_id: Optional[str] = None) -> bool:
+        """Marca atómicamente la entrevista como sumada al rollup; False si ya lo estaba"""
+        query = {**self._key(interview_id, user_id), "stats_recorded": {"$ne": True}}
+        update = {"$set": {"stats_recorded": True}, "$inc": {"version": 1}}
+        result = await InterviewReady.get_motor_collection().update_one(query, update)
+        if result.modified_count == 0:
+            result = await self._archive().update_one(query, update)
+        return result.modified_count == 1
+
+    async def iter_completed_feedback(self, batch_size: int = 500) -> AsyncIterator[Dict]:
+        """Recorre las entrevistas con feedback ordenadas por usuario, solo con los campos del rollup"""
+        # Incluye el archivo: el rollup cuenta todo el historial
+        async for interview in self._iter_all_tiers(
+                {"status": "completed", "feedback": {"$ne": None}},
+                {"userId": 1, "type": 1, "feedback": 1},
+                "userId", batch_size):
+            yield interview
+
+    async def iter_for_export(self, init_from: Optional[datetime] = None, init_to: Optional[datetime] = None,
+                              interview_type: Optional[str] = None, status: Optional[str] = None,
+                              after_id: Optional[Any] = None, batch_size: int = 1000) -> AsyncIterator[Dict]:
+        """Cursor en orden de _id (principal y archivo) para exportar; after_id permite retomar desde un checkpoint"""
+        query: Dict[str, Any] = {}
+        if after_id is not None:
+            query["_id"] = {"$gt": after_id}
+        if init_from or init_to:
+            query["init_at"] = {}
+            if init_from:
+                query["init_at"]["$gte"] = init_from
+            if init_to:
+                query["init_at"]["$lt"] = init_to
+        if interview_type:
+            query["type"] = interview_type
+        if status:
+            query["status"] = status
+        async for interview in self._iter_all_tiers(
+                query, {"actual_question": 0, "previus_question": 0}, "_id", batch_size):
+            yield interview
+
+    async def iter_for_rescoring(self, after_id: Optional[Any] = None, completed_before: Optional[datetime] = None,
+                                 interview_type: Optional[str] = None, batch_size: int = 500) -> AsyncIterator[Dict]:
+        """Completadas con feedback (principal y archivo), en orden de _id, solo con lo necesario para rearmar el prompt"""
+        query: Dict[str, Any] = {"status": "completed", "feedback": {"$ne": None}}
+        if after_id is not None:
+            query["_id"] = {"$gt": after_id}
+        if completed_before is not None:
+            query["end_at"] = {"$lt": completed_before}
+        if interview_type:
+            query["type"] = interview_type
+        async for interview in self._iter_all_tiers(
+                query,
+                {"userId": 1, "type": 1, "user_seniority": 1, "user_specialization": 1, "questions": 1, "version": 1},
+                "_id", batch_size):
+            yield interview
+
+    async def bulk_update_feedback(self, updates: List[Dict[str, Any]]) -> Tuple[int, int]:
+        """Escribe feedback y points_earned con un bulk_write sin orden.
+
+        Cada update lleva _id, userId, version y feedback; si la entrevista cambió desde que
+        se leyó (otra versión) no se toca. Devuelve (coincidentes, modificadas).
+        """
+        now = datetime.utcnow()
+        operations = [UpdateOne(
+            {**self._key(update["_id"], update["userId"]), **self._version_guard(update["version"])},
+            {"$set": {
+                "feedback": update["feedback"],
+                "points_earned": update["feedback"]["points_earned"],
+                "updated_at": now
+            }, "$inc": {"version": 1}}
+        ) for update in updates]
+        matched = modified = 0
+        # Cada entrevista está en uno de los dos niveles; en el otro el filtro no coincide
+        for collection in (InterviewReady.get_motor_collection(), self._archive()):
+            result = await collection.bulk_write(operations, ordered=False)
+            matched += result.matched_count
+            modified += result.modified_count
+        return matched, modified
+
+    async def expire_stale(self, idle_before: datetime) -> int:
+        """Marca como expired las entrevistas en curso sin actividad desde idle_before"""
+        now = datetime.now(timezone.utc)
+        result = await InterviewReady.get_motor_collection().update_many(
+            {"status": "in_progress", "$and": [
+                {"$or": [
+                    {"updated_at": {"$lt": idle_before}},
+                    {"updated_at": None, "init_at": {"$lt": idle_before}}
+                ]},
+                # Una sesión activa en memoria (lease vigente) no está abandonada
+                {"$or": [{"session_lease_until": None}, {"session_lease_until": {"$lt": now}}]}
+            ]},
+            {"$set": {"status": "expired", "end_at": now, "updated_at": now}, "$inc": {"version": 1}}
+        )
+        return result.modified_count
+
+    async def archive_completed(self, updated_before: datetime, batch_size: int = 500) -> int:
+        """Mueve a la colección archivo, por lotes, las completadas sin cambios desde updated_before.
+
+        Primero se copia (upsert, idempotente si se interrumpe) y después se borra solo si
+        la versión no cambió mientras tanto; las que cambiaron se quedan para la siguiente pasada.
+        """
+        collection = InterviewReady.get_motor_collection()
+        archived = 0
+        after_id = None
+        while True:
+            query: Dict[str, Any] = {"status": "completed", "updated_at": {"$lt": updated_before}}
+            if after_id is not None:
+                query["_id"] = {"$gt": after_id}
+            batch = await collection.find(query).sort("_id", 1).limit(batch_size).to_list(length=batch_size)
+            if not batch:
+                return archived
+            after_id = batch[-1]["_id"]
+            await self._archive().bulk_write(
+                # El upsert en una colección sharded necesita la shard key completa en el filtro
+                [ReplaceOne(self._key(document["_id"], document["userId"]), document, upsert=True) for document in batch],
+                ordered=False
+            )
+            result = await collection.bulk_write(
+                [DeleteOne({**self._key(document["_id"], document["userId"]), **self._version_guard(document.get("version"))})
+                 for document in batch],
+                ordered=False
+            )
+            archived += result.deleted_count
+            logger.debug("Archived batch of %d interviews", result.deleted_count)
+
+    @staticmethod
+    def _serialize_summary(interview: Dict) -> Dict:
+        if "_id" in interview:
+            interview["id"] = str(interview["_id"])
+            del interview["_id"]
+
+        # Convertir fechas a string si es necesario
+        for date_field in ["init_at", "end_at", "updated_at"]:
+            if interview.get(date_field):
+                interview[date_field] = interview[date_field].isoformat()
+        return interview
+
+    async def find_recent_questions(self, user_id: str, interviews: int = 5) -> List[str]:
+        """Textos de las preguntas de las últimas entrevistas del usuario"""
+        pipeline = [
+            {"$match": {"userId": user_id}},
+            {"$sort": {"init_at": -1}},
+            {"$limit": interviews},
+            {"$project": {"_id": 0, "questions.question": 1}}
+        ]
+        try:
+            recent = await InterviewReady.aggregate(pipeline).to_list()
+            return [q["question"] for interview in recent for q in interview.get("questions", []) if q.get("question")]
+        except Exception as e:
+            logger.error("Error in find_recent_questions: %s", e)
             raise e
 
-    async def count_by_user_id(self, user_id: str) -> int:
+    async def count_by_user_id(self, user_id: str, include_archive: bool = False) -> int:
         """Cuenta el total de entrevistas completadas de un usuario"""
         try:
             # Usar InterviewReady.find() directamente
@@ -83,7 +476,9 @@ class InterviewReadyRepository(BaseRepository[InterviewReady]):
                     "status": "completed"  # Cambiar a completed para consistencia
                 }
             ).count()
+            if include_archive:
+                count += await self._archive().count_documents({"userId": user_id, "status": "completed"})
             return count
         except Exception as e:
-            print(f"Error in count_by_user_id: {e}")
+            logger.error("Error in count_by_user_id: %s", e)
             raise e
\ No newline at end of file
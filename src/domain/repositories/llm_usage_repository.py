@@ -0,0 +1,37 @@
+from typing import Optional
+from datetime import datetime, timezone
+from pymongo.errors import DuplicateKeyError
+from domain.entities.llm_usage import LLMUsage
+from domain.repositories.base_repository import BaseRepository
+
+
+class LLMUsageRepository(BaseRepository[LLMUsage]):
+    def __init__(self):
+        super().__init__(LLMUsage)
+
+    async def find_day(self, user_id: str, day: str) -> Optional[LLMUsage]:
+        return await LLMUsage.find_one(LLMUsage.userId == user_id, LLMUsage.day == day)
+
+    async def increment(self, user_id: str, day: str, operation: str, prompt_tokens: int,
+                        output_tokens: int, cached_tokens: int) -> None:
+        """Suma una llamada al total del día y al de la operación con un único $inc"""
+        query = {"userId": user_id, "day": day}
+        update = {
+            "$inc": {
+                "calls": 1,
+                "prompt_tokens": prompt_tokens,
+                "output_tokens": output_tokens,
+                "cached_tokens": cached_tokens,
+                f"operations.{operation}.calls": 1,
+                f"operations.{operation}.prompt_tokens": prompt_tokens,
+                f"operations.{operation}.output_tokens": output_tokens,
+                f"operations.{operation}.cached_tokens": cached_tokens,
+            },
+            "$set": {"updated_at": datetime.now(timezone.utc)}
+        }
+        collection = LLMUsage.get_motor_collection()
+        try:
+            await collection.update_one(query, update, upsert=True)
+        except DuplicateKeyError:
+            # Dos primeras llamadas del día a la vez: el segundo upsert ya encuentra el documento
+            await collection.update_one(query, update, upsert=True)
@@ -0,0 +1,62 @@
+from typing import Optional
+from domain.entities.precomputed_question_set import PrecomputedQuestionSet
+from domain.repositories.base_repository import BaseRepository
+
+
+class PrecomputedQuestionSetRepository(BaseRepository[PrecomputedQuestionSet]):
+    def __init__(self):
+        super().__init__(PrecomputedQuestionSet)
+
+    async def claim(self, user_id: str, seniority: str, specialization: str, interview_type: str,
+                    question_number: int) -> Optional[PrecomputedQuestionSet]:
+        """Reclama (y borra) el set más antiguo que encaje; find_one_and_delete garantiza un solo ganador"""
+        document = await PrecomputedQuestionSet.get_motor_collection().find_one_and_delete(
+            {
+                "user_id": user_id,
+                "user_seniority": seniority,
+                "user_specialization": specialization,
+                "type": interview_type,
+                "question_number": question_number
+            },
+            sort=[("created_at", 1)]
+        )
+        if document is None:
+            return None
+        return PrecomputedQuestionSet.model_validate(document)
+
+    async def has_set(self, user_id: str, seniority: str, specialization: str, interview_type: str,
+                     question_number: int) -> bool:
+        return await PrecomputedQuestionSet.get_motor_collection().count_documents(
+            {
+                "user_id": user_id,
+                "user_seniority": seniority,
+                "user_specialization": specialization,
+                "type": interview_type,
+                "question_number": question_number
+            },
+            limit=1
+        ) > 0
+
+    async def count_pending(self, user_id: str) -> int:
+        return await PrecomputedQuestionSet.get_motor_collection().count_documents({"user_id": user_id})
+
+    async def delete_other_profiles(self, user_id: str, seniority: str, specialization: str) -> int:
+        """Borra los sets generados para un perfil anterior del usuario"""
+        result = await PrecomputedQuestionSet.get_motor_collection().delete_many({
+            "user_id": user_id,
+            "$or": [
+                {"user_seniority": {"$ne": seniority}},
+                {"user_specialization": {"$ne": specialization}}
+            ]
+        })
+        return result.deleted_count
+
+    async def trim_pending(self, user_id: str, max_pending: int) -> int:
+        """Deja como mucho max_pending sets por usuario, descartando los más antiguos"""
+        collection = PrecomputedQuestionSet.get_motor_collection()
+        stale = await collection.find({"user_id": user_id}, projection={"_id": 1}) \
+            .sort("created_at", -1).skip(max_pending).to_list(length=None)
+        if not stale:
+            return 0
+        result = await collection.delete_many({"_id": {"$in": [document["_id"] for document in stale]}})
+        return result.deleted_count
@@ -0,0 +1,44 @@
+from typing import Tuple
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from domain.entities.rate_limit_bucket import RateLimitBucket
+from domain.repositories.base_repository import BaseRepository
+
+
+class RateLimitBucketRepository(BaseRepository[RateLimitBucket]):
+    def __init__(self):
+        super().__init__(RateLimitBucket)
+
+    async def take(self, key: str, capacity: float, refill_per_second: float, ttl_seconds: int) -> Tuple[bool, float]:
+        """Recarga y consume un token en una sola operación atómica; devuelve (permitido, tokens restantes)"""
+        elapsed_seconds = {"$divide": [{"$subtract": ["$$NOW", {"$ifNull": ["$updated_at", "$$NOW"]}]}, 1000]}
+        pipeline = [
+            {"$set": {
+                "tokens": {"$min": [capacity, {"$add": [
+                    {"$ifNull": ["$tokens", capacity]},
+                    {"$multiply": [elapsed_seconds, refill_per_second]}
+                ]}]},
+                "updated_at": "$$NOW",
+                "purge_at": {"$add": ["$$NOW", ttl_seconds * 1000]},
+            }},
+            {"$set": {"allowed": {"$gte": ["$tokens", 1]}}},
+            {"$set": {"tokens": {"$cond": ["$allowed", {"$subtract": ["$tokens", 1]}, "$tokens"]}}},
+        ]
+        collection = RateLimitBucket.get_motor_collection()
+        try:
+            bucket = await collection.find_one_and_update(
+                {"key": key}, pipeline, upsert=True, return_document=ReturnDocument.AFTER
+            )
+        except DuplicateKeyError:
+            # Dos upserts simultáneos del primer token: el segundo ya encuentra el documento
+            bucket = await collection.find_one_and_update(
+                {"key": key}, pipeline, return_document=ReturnDocument.AFTER
+            )
+        return bucket["allowed"], bucket["tokens"]
+
+    async def refund(self, key: str, capacity: float) -> None:
+        """Devuelve un token consumido (sin superar la capacidad)"""
+        await RateLimitBucket.get_motor_collection().update_one(
+            {"key": key},
+            [{"$set": {"tokens": {"$min": [capacity, {"$add": ["$tokens", 1]}]}}}]
+        )
@@ -0,0 +1,51 @@
+from typing import Any, Dict, Optional
+from datetime import datetime, timedelta, timezone
+from pymongo.errors import DuplicateKeyError
+from domain.entities.single_flight_lease import SingleFlightLease
+from domain.repositories.base_repository import BaseRepository
+
+
+class SingleFlightLeaseRepository(BaseRepository[SingleFlightLease]):
+    def __init__(self):
+        super().__init__(SingleFlightLease)
+
+    async def acquire(self, key: str, owner: str, lease_seconds: int) -> bool:
+        """Intenta tomar la operación; también recupera leases vencidos de workers caídos"""
+        now = datetime.now(timezone.utc)
+        collection = SingleFlightLease.get_motor_collection()
+        try:
+            await collection.insert_one({
+                "key": key,
+                "owner": owner,
+                "expires_at": now + timedelta(seconds=lease_seconds),
+                "purge_at": now + timedelta(seconds=lease_seconds * 2),
+                "done": False,
+                "result": None
+            })
+            return True
+        except DuplicateKeyError:
+            taken = await collection.find_one_and_update(
+                {"key": key, "done": False, "expires_at": {"$lt": now}},
+                {"$set": {
+                    "owner": owner,
+                    "expires_at": now + timedelta(seconds=lease_seconds),
+                    "purge_at": now + timedelta(seconds=lease_seconds * 2)
+                }}
+            )
+            return taken is not None
+
+    async def find_by_key(self, key: str) -> Optional[Dict[str, Any]]:
+        return await SingleFlightLease.get_motor_collection().find_one({"key": key})
+
+    async def complete(self, key: str, owner: str, result: Dict[str, Any], result_ttl_seconds: int) -> None:
+        await SingleFlightLease.get_motor_collection().update_one(
+            {"key": key, "owner": owner},
+            {"$set": {
+                "done": True,
+                "result": result,
+                "purge_at": datetime.now(timezone.utc) + timedelta(seconds=result_ttl_seconds)
+            }}
+        )
+
+    async def release(self, key: str, owner: str) -> None:
+        await SingleFlightLease.get_motor_collection().delete_one({"key": key, "owner": owner, "done": False})
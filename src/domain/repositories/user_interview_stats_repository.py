@@ -0,0 +1,79 @@
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime, timezone
+from pymongo import ReplaceOne
+from domain.entities.interview_ready import FeedBack
+from domain.entities.user_interview_stats import UserInterviewStats, competency_key
+from domain.repositories.base_repository import BaseRepository
+
+logger = logging.getLogger(__name__)
+
+
+class UserInterviewStatsRepository(BaseRepository[UserInterviewStats]):
+    def __init__(self):
+        super().__init__(UserInterviewStats)
+
+    async def find_by_user_id(self, user_id: str) -> Optional[UserInterviewStats]:
+        """Lectura puntual por el índice único de userId"""
+        try:
+            return await UserInterviewStats.find_one(UserInterviewStats.userId == user_id)
+        except Exception as e:
+            logger.error("Error in find_by_user_id: %s", e)
+            raise e
+
+    async def record_feedback(self, user_id: str, interview_type: str, feedback: FeedBack) -> None:
+        """Suma un feedback recién guardado al rollup del usuario con un único $inc"""
+        inc, fields = self.increments(interview_type, feedback)
+        fields["updated_at"] = datetime.now(timezone.utc)
+        try:
+            await UserInterviewStats.get_motor_collection().update_one(
+                {"userId": user_id},
+                {"$inc": inc, "$set": fields},
+                upsert=True
+            )
+        except Exception as e:
+            logger.error("Error in record_feedback: %s", e)
+            raise e
+
+    async def replace_many(self, stats: List[Dict[str, Any]]) -> None:
+        """Reemplaza (o inserta) los rollups completos de varios usuarios en un solo bulk_write"""
+        if not stats:
+            return
+        await UserInterviewStats.get_motor_collection().bulk_write(
+            [ReplaceOne({"userId": doc["userId"]}, doc, upsert=True) for doc in stats],
+            ordered=False
+        )
+
+    @staticmethod
+    def increments(interview_type: str, feedback: FeedBack) -> Tuple[Dict[str, int], Dict[str, Any]]:
+        """Rutas $inc/$set que aporta un feedback; las comparten el camino incremental y el backfill"""
+        inc: Dict[str, int] = {
+            "total_points": feedback.points_earned,
+            "interviews_completed": 1,
+            "overall_score_sum": feedback.overall_score,
+            f"interviews_by_type.{competency_key(interview_type or 'unknown')}": 1,
+        }
+        fields: Dict[str, Any] = {}
+        for competency in feedback.competency_breakdown:
+            key = competency_key(competency.name)
+            inc[f"competencies.{key}.score_sum"] = inc.get(f"competencies.{key}.score_sum", 0) + competency.score
+            inc[f"competencies.{key}.count"] = inc.get(f"competencies.{key}.count", 0) + 1
+            fields[f"competencies.{key}.name"] = competency.name
+        return inc, fields
+
+    @staticmethod
+    def apply_increments(doc: Dict[str, Any], inc: Dict[str, int], fields: Dict[str, Any]) -> Dict[str, Any]:
+        """Aplica en memoria las mismas rutas que record_feedback manda a Mongo"""
+        for path, value in inc.items():
+            *parents, leaf = path.split(".")
+            target = doc
+            for part in parents:
+                target = target.setdefault(part, {})
+            target[leaf] = target.get(leaf, 0) + value
+        for path, value in fields.items():
+            *parents, leaf = path.split(".")
+            target = doc
+            for part in parents:
+                target = target.setdefault(part, {})
+            target[leaf] = value
+        return doc
@@ -0,0 +1,78 @@
+from typing import List, Optional
+
+import numpy as np
+from pydantic import BaseModel
+
+from domain.entities.interview_ready import CompetencyBreakdown, FeedBack, Question
+
+# Rúbrica por respuesta (la misma que usaba el prompt de feedback completo)
+ANSWER_SCORES = {
+    "excellent": 90,
+    "good": 75,
+    "fair": 55,
+    "poor": 35,
+}
+FOCUS_THRESHOLD = 60
+MAX_FOCUS_QUESTIONS = 5
+
+
+def points_for(overall_score: int) -> int:
+    if overall_score >= 80:
+        return 10
+    if overall_score >= 60:
+        return 5
+    return 2
+
+
+def _round_half_up(values: np.ndarray) -> np.ndarray:
+    # np.round redondea al par (72.5 -> 72); el prompt pedía redondeo normal
+    return np.floor(values + 0.5).astype(int)
+
+
+class InterviewScore(BaseModel):
+    overall_score: int
+    competency_breakdown: List[CompetencyBreakdown]
+    points_earned: int
+    focus_questions: List[str]
+
+    def to_feedback(self, summary_feedback: str = "") -> FeedBack:
+        return FeedBack(**self.model_dump(), summary_feedback=summary_feedback)
+
+
+class ScoringEngine:
+    """Calcula localmente la puntuación de una entrevista a partir de la nota de cada respuesta.
+
+    overall_score es la media de las notas, cada competencia la media de sus preguntas,
+    points_earned sale de los umbrales ≥80 → 10, 60-79 → 5, <60 → 2 y focus_questions son
+    hasta 5 preguntas con nota < 60, de la peor a la mejor.
+    """
+
+    @staticmethod
+    def is_scorable(questions: List[Question]) -> bool:
+        answered = [q for q in questions if q.answer is not None]
+        return bool(answered) and all(q.score is not None for q in answered)
+
+    @staticmethod
+    def score(questions: List[Question]) -> Optional[InterviewScore]:
+        answered = [q for q in questions if q.answer is not None and q.score is not None]
+        if not answered:
+            return None
+        scores = np.array([q.score for q in answered], dtype=float)
+
+        # Competencias en orden de aparición
+        names, first_seen, groups = np.unique([q.competency for q in answered], return_index=True, return_inverse=True)
+        averages = np.bincount(groups, weights=scores) / np.bincount(groups)
+        order = np.argsort(first_seen)
+
+        overall = int(_round_half_up(np.array([scores.mean()]))[0])
+        weak = np.flatnonzero(scores < FOCUS_THRESHOLD)
+        weak = weak[np.argsort(scores[weak], kind="stable")][:MAX_FOCUS_QUESTIONS]
+        return InterviewScore(
+            overall_score=overall,
+            competency_breakdown=[
+                CompetencyBreakdown(name=str(names[i]), score=int(score))
+                for i, score in zip(order, _round_half_up(averages[order]))
+            ],
+            points_earned=points_for(overall),
+            focus_questions=[answered[i].question for i in weak]
+        )
@@ -0,0 +1,148 @@
+import logging
+import math
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from pydantic import BaseModel
+
+from domain.repositories.rate_limit_bucket_repository import RateLimitBucketRepository
+from infrastructure.config.app_config import config
+
+logger = logging.getLogger(__name__)
+
+GLOBAL_PREFIX = "global:"
+
+
+class RateLimitRule(BaseModel):
+    """Límites de una ruta: ritmo sostenido por minuto y ráfaga (capacidad del bucket)."""
+    user_per_minute: float = 0
+    user_burst: float = 0
+    global_per_minute: float = 0
+    global_burst: float = 0
+
+
+class TokenBucketStore(ABC):
+    @abstractmethod
+    async def take(self, key: str, capacity: float, refill_per_second: float) -> Tuple[bool, float]:
+        """Consume un token si hay; devuelve (permitido, tokens restantes)"""
+        ...
+
+    @abstractmethod
+    async def refund(self, key: str, capacity: float) -> None:
+        """Devuelve un token consumido por una petición que al final se rechazó"""
+        ...
+
+
+class InMemoryTokenBucketStore(TokenBucketStore):
+    """Buckets del proceso; con varios workers cada uno aplica el límite por su cuenta.
+
+    Los buckets globales (uno por ruta) no se expulsan nunca; los de usuario, con
+    user_id elegido por el cliente, se expulsan en orden LRU al llegar a max_buckets.
+    """
+
+    def __init__(self, max_buckets: int = 50000):
+        self.max_buckets = max_buckets
+        self._global: Dict[str, Tuple[float, float]] = {}
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    async def take(self, key: str, capacity: float, refill_per_second: float) -> Tuple[bool, float]:
+        now = time.monotonic()
+        buckets = self._global if key.startswith(GLOBAL_PREFIX) else self._buckets
+        tokens, updated = buckets.get(key, (capacity, now))
+        tokens = min(capacity, tokens + (now - updated) * refill_per_second)
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+        if buckets is self._buckets:
+            if key in self._buckets:
+                self._buckets.move_to_end(key)
+            else:
+                while len(self._buckets) >= self.max_buckets:
+                    self._buckets.popitem(last=False)
+        buckets[key] = (tokens, now)
+        return allowed, tokens
+
+    async def refund(self, key: str, capacity: float) -> None:
+        buckets = self._global if key.startswith(GLOBAL_PREFIX) else self._buckets
+        if key in buckets:
+            tokens, updated = buckets[key]
+            buckets[key] = (min(capacity, tokens + 1), updated)
+
+
+class MongoTokenBucketStore(TokenBucketStore):
+    """Buckets compartidos entre workers, actualizados con un pipeline atómico en Mongo."""
+
+    def __init__(self, repository: RateLimitBucketRepository, ttl_seconds: int = 3600):
+        self.repository = repository
+        self.ttl_seconds = ttl_seconds
+
+    async def take(self, key: str, capacity: float, refill_per_second: float) -> Tuple[bool, float]:
+        return await self.repository.take(key, capacity, refill_per_second, self.ttl_seconds)
+
+    async def refund(self, key: str, capacity: float) -> None:
+        await self.repository.refund(key, capacity)
+
+
+class RateLimiter:
+    """Token buckets por usuario y globales por ruta.
+
+    Se consulta primero el bucket del usuario: un cliente abusivo que ya está limitado
+    no consume tokens del bucket global y no afecta a los demás. Si después lo rechaza el
+    bucket global, se devuelve el token del usuario.
+    """
+
+    def __init__(self, store: TokenBucketStore, rules: Dict[str, RateLimitRule]):
+        self.store = store
+        self.rules = rules
+
+    async def check(self, route: str, user_key: str) -> Optional[float]:
+        """None si la petición puede pasar; si no, segundos hasta el próximo token"""
+        rule = self.rules.get(route)
+        if rule is None:
+            return None
+        buckets = [
+            (f"user:{route}:{user_key}", rule.user_burst, rule.user_per_minute),
+            (f"{GLOBAL_PREFIX}{route}", rule.global_burst, rule.global_per_minute),
+        ]
+        taken = []
+        for key, burst, per_minute in buckets:
+            if per_minute <= 0:
+                continue
+            refill_per_second = per_minute / 60
+            try:
+                allowed, tokens = await self.store.take(key, max(burst, 1), refill_per_second)
+            except Exception as e:
+                # Si el store compartido falla, dejar pasar: el límite protege, no debe tumbar la API
+                logger.warning("Rate limit store unavailable: %s", e)
+                return None
+            if not allowed:
+                logger.info("Rate limit exceeded", extra={"bucket": key})
+                await self._refund(taken)
+                return (1 - tokens) / refill_per_second
+            taken.append((key, max(burst, 1)))
+        return None
+
+    async def _refund(self, taken) -> None:
+        for key, capacity in taken:
+            try:
+                await self.store.refund(key, capacity)
+            except Exception as e:
+                logger.warning("Rate limit refund failed for %s: %s", key, e)
+
+
+def retry_after_header(seconds: float) -> str:
+    return str(max(1, math.ceil(seconds)))
+
+
+def create_rate_limiter() -> RateLimiter:
+    if config.rate_limit_backend == "mongo":
+        store = MongoTokenBucketStore(RateLimitBucketRepository(), config.rate_limit_bucket_ttl_seconds)
+    else:
+        store = InMemoryTokenBucketStore()
+    rules = {route: RateLimitRule(**rule) for route, rule in config.rate_limit_rules.items()}
+    return RateLimiter(store, rules)
+
+
+rate_limiter = create_rate_limiter()
@@ -0,0 +1,108 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import socket
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Optional, Type, TypeVar
+
+from pydantic import BaseModel
+
+from domain.repositories.single_flight_lease_repository import SingleFlightLeaseRepository
+from infrastructure.config.app_config import config
+
+logger = logging.getLogger(__name__)
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def single_flight_key(operation: str, *parts: Any) -> str:
+    """Hash estable de la operación y sus entradas (id de entrevista, id de pregunta, respuesta...)"""
+    payload = json.dumps([operation, *parts], ensure_ascii=False, default=str)
+    return f"{operation}:{hashlib.sha256(payload.encode('utf-8')).hexdigest()}"
+
+
+class SingleFlight:
+    """Colapsa peticiones idénticas concurrentes en una sola ejecución.
+
+    Dentro del proceso, los seguidores esperan el mismo Future que el líder. Con un
+    repositorio de leases, los workers se coordinan además con un documento en Mongo:
+    el que inserta el lease ejecuta y publica el resultado; el resto lo sondea.
+    """
+
+    def __init__(self, lease_repository: Optional[SingleFlightLeaseRepository] = None,
+                 lease_seconds: int = 120, poll_interval: float = 0.25, result_ttl_seconds: int = 30):
+        self.lease_repository = lease_repository
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.result_ttl_seconds = result_ttl_seconds
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    async def run(self, key: str, fn: Callable[[], Awaitable[M]], result_model: Type[M]) -> M:
+        existing = self._inflight.get(key)
+        if existing is not None:
+            logger.info("Joining in-flight request %s", key)
+            # shield: si este seguidor se cancela, no cancela al líder
+            return await asyncio.shield(existing)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._run_leader(key, fn, result_model)
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Evita el aviso de "exception was never retrieved" cuando no hay seguidores
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _run_leader(self, key: str, fn: Callable[[], Awaitable[M]], result_model: Type[M]) -> M:
+        if self.lease_repository is None:
+            return await fn()
+
+        waited_since = time.monotonic()
+        while True:
+            if await self.lease_repository.acquire(key, self.owner, self.lease_seconds):
+                try:
+                    result = await fn()
+                except BaseException:
+                    await self.lease_repository.release(key, self.owner)
+                    raise
+                await self.lease_repository.complete(key, self.owner, result.model_dump(mode="json"), self.result_ttl_seconds)
+                return result
+
+            # Otro worker tiene el lease: esperar su resultado
+            while True:
+                await asyncio.sleep(self.poll_interval)
+                lease = await self.lease_repository.find_by_key(key)
+                if lease is None:
+                    # El líder falló y liberó el lease; intentar tomarlo
+                    break
+                if lease.get("done"):
+                    logger.info("Reusing result of %s computed by %s", key, lease.get('owner'))
+                    return result_model.model_validate(lease["result"])
+                if time.monotonic() - waited_since > self.lease_seconds:
+                    # El lease pudo vencer (worker caído); acquire lo recupera si es así
+                    waited_since = time.monotonic()
+                    break
+
+
+def create_single_flight() -> SingleFlight:
+    return SingleFlight(
+        lease_repository=SingleFlightLeaseRepository() if config.single_flight_backend == "mongo" else None,
+        lease_seconds=config.single_flight_lease_seconds,
+        poll_interval=config.single_flight_poll_interval_ms / 1000,
+        result_ttl_seconds=config.single_flight_result_ttl_seconds,
+    )
+
+
+single_flight = create_single_flight()
@@ -1,4 +1,5 @@
 from pydantic_settings import BaseSettings
+from typing import Any, Dict, List
 from dotenv import load_dotenv
 
 
@@ -23,6 +24,175 @@ class AppConfig(BaseSettings):
     
     profile_queue_name: str = "profile_updates"
     notifications_queue_name: str = "notifications"
+    profile_dead_letter_queue_name: str = "profile_updates.dlq"
+    
+    
+    # Sets de preguntas precalculados al cambiar el perfil (worker de profile_updates)
+    precompute_enabled: bool = False
+    # (type, question_number) a precalcular por perfil, en orden de prioridad
+    precompute_targets: List[Dict[str, Any]] = [{"type": "behavioral", "question_number": 10}]
+    precompute_max_pending_per_user: int = 3
+    precompute_ttl_hours: int = 72
+    precompute_prefetch: int = 4
+    precompute_max_retries: int = 3
+    
+    
+    # Backend por defecto y por operación: gemini | local | fixture
+    # p.ej. LLM_OPERATION_BACKENDS='{"generate_feedback": "local"}'
+    llm_backend: str = "gemini"
+    llm_operation_backends: Dict[str, str] = {}
+    local_llm_base_url: str = "http://localhost:8080/v1"
+    local_llm_model: str = "local-model"
+    local_llm_api_key: str = ""
+    local_llm_timeout_seconds: float = 60.0
+    # Tope de tokens de salida por operación (GenerateContentConfig.max_output_tokens)
+    llm_max_output_tokens: Dict[str, int] = {
+        "generate_questions": 4096,
+        "generate_replacement_questions": 1024,
+        "generate_feedback": 512,
+        "generate_complete_feedback": 2048,
+        "generate_summary_feedback": 512,
+    }
+    # Operaciones que generan preguntas: tope = overhead + por_pregunta * nº de preguntas pedidas
+    # (llm_max_output_tokens se usa cuando no se conoce el número, p.ej. en trabajos batch)
+    llm_output_tokens_per_question: Dict[str, int] = {
+        "generate_questions": 300,
+        "generate_replacement_questions": 300,
+    }
+    llm_output_tokens_overhead: int = 512
+    # Presupuesto de razonamiento por operación (ThinkingConfig en Gemini); solo para modelos con thinking,
+    # los demás rechazan el campo. Se suma al tope de salida porque ambos salen del mismo max_output_tokens.
+    # 0 = sin thinking (solo Flash); vacío = no se envía. p.ej. LLM_THINKING_BUDGETS='{"generate_feedback": 256}'
+    llm_thinking_budgets: Dict[str, int] = {}
+    # Puntuación final calculada localmente (ScoringEngine); el LLM solo redacta el resumen
+    deterministic_scoring_enabled: bool = True
+    llm_usage_tracking_enabled: bool = True
+    # 0 = sin límite
+    llm_daily_token_budget_per_user: int = 0
+    
+    
+    # Trabajos batch (presentation.cli.batch_inference): provider (API batch del proveedor) | throttled
+    batch_llm_mode: str = "throttled"
+    batch_llm_backend: str = "gemini"
+    batch_chunk_size: int = 500
+    batch_concurrency: int = 4
+    batch_requests_per_minute: float = 60
+    batch_poll_interval_seconds: float = 30.0
+    batch_write_back_collections: List[str] = ["interview_ready", "interview_ready_archive", "precomputed_question_sets"]
+    
+    
+    # memory: solo dentro del proceso | mongo: también entre workers (lease en Mongo)
+    single_flight_enabled: bool = True
+    single_flight_backend: str = "memory"
+    single_flight_lease_seconds: int = 120
+    single_flight_poll_interval_ms: int = 250
+    single_flight_result_ttl_seconds: int = 30
+    
+    
+    idempotency_ttl_seconds: int = 86400
+    
+    
+    # Token buckets por ruta (nombre de la función del endpoint); memory | mongo
+    rate_limit_enabled: bool = True
+    rate_limit_backend: str = "memory"
+    rate_limit_bucket_ttl_seconds: int = 3600
+    # Cabecera con la identidad ya autenticada por el gateway (p.ej. X-User-Id); sin ella se limita por IP
+    rate_limit_identity_header: str = ""
+    # Usar el primer salto de X-Forwarded-For como IP (solo si el proxy de delante lo reescribe)
+    rate_limit_trust_forwarded_for: bool = False
+    rate_limit_rules: Dict[str, Dict[str, float]] = {
+        "generate_questions": {"user_per_minute": 5, "user_burst": 3, "global_per_minute": 300, "global_burst": 50},
+        "answer_question": {"user_per_minute": 30, "user_burst": 10, "global_per_minute": 1200, "global_burst": 200},
+        "get_question": {"user_per_minute": 10, "user_burst": 5, "global_per_minute": 600, "global_burst": 100},
+    }
+    
+    
+    # Respuestas más largas se rechazan; en los prompts se recortan a answer_prompt_max_chars
+    answer_max_chars: int = 6000
+    answer_prompt_max_chars: int = 2500
+    
+    
+    # Pre-clasificador local de respuestas vacías/mínimas; modo por tipo: off | shadow | decide
+    # p.ej. PRESCREEN_MODES='{"technical": "shadow"}'
+    prescreen_enabled: bool = True
+    prescreen_default_mode: str = "decide"
+    prescreen_modes: Dict[str, str] = {}
+    prescreen_min_words: int = 10
+    # Similitud pregunta/respuesta por debajo de la cual es off-topic; 0 = desactivado
+    # Con el embedding de hashing la similitud entre textos con vocabulario distinto es ruido: off-topic solo en shadow
+    prescreen_offtopic_threshold: float = 0.0
+    prescreen_offtopic_max_words: int = 60
+    
+    
+    # Caché de feedback por respuesta: pregunta + hash de la respuesta normalizada (por worker)
+    feedback_cache_enabled: bool = True
+    feedback_cache_max_entries: int = 20000
+    # Tier semántico: respuesta más parecida a la misma pregunta; solo se sirve por encima del umbral
+    feedback_cache_semantic_enabled: bool = False
+    feedback_cache_semantic_max_entries: int = 5000
+    feedback_cache_similarity_threshold: float = 0.95
+    feedback_cache_semantic_min_words: int = 8
+    feedback_cache_embedding_backend: str = "hashing"
+    # Fracción de aciertos que se reevalúan con el LLM en segundo plano (métrica feedback_cache_sampled)
+    feedback_cache_sample_rate: float = 0.02
+    
+    
+    # Sesiones activas en memoria con escritura diferida; requiere afinidad por entrevista entre workers
+    # write_behind: se pierde como mucho flush_interval si el proceso muere | journal: journal local con fsync
+    active_session_store_enabled: bool = False
+    active_session_mode: str = "write_behind"
+    active_session_flush_interval_ms: int = 1000
+    active_session_idle_seconds: int = 600
+    active_session_lease_seconds: int = 900
+    active_session_max_sessions: int = 5000
+    # Prefijo: cada proceso escribe en <path>.<dueño> (bloqueado mientras vive) y al arrancar reaplica los de procesos muertos
+    active_session_journal_path: str = "active_sessions.journal"
+    
+    
+    # Generación incremental: primer lote síncrono y el resto en segundo plano
+    lazy_question_generation_enabled: bool = False
+    lazy_question_min_count: int = 10
+    lazy_first_batch_size: int = 3
+    lazy_batch_size: int = 5
+    # Espera máxima por el lote en segundo plano antes de generarlo en la petición
+    lazy_wait_seconds: float = 10.0
+    lazy_poll_interval_ms: int = 250
+    
+    
+    # Entrevistas adaptativas: tamaño de lote, mínimos antes de recortar y margen de confianza
+    adaptive_batch_size: int = 3
+    adaptive_min_questions: int = 5
+    adaptive_min_per_tier: int = 2
+    adaptive_confidence_margin: float = 0.2
+    
+    
+    # Suscripciones SSE a una entrevista (un change stream por worker)
+    interview_events_max_subscribers: int = 1000
+    interview_events_queue_size: int = 16
+    interview_events_keepalive_seconds: float = 15.0
+    # Al suscribirse a una entrevista completada sin feedback, generarlo en segundo plano
+    interview_events_generate_feedback: bool = True
+    
+    
+    # Barrido periódico: expira entrevistas en curso sin actividad y archiva las completadas antiguas (0 = desactivado)
+    interview_sweeper_enabled: bool = False
+    interview_sweeper_interval_seconds: int = 900
+    interview_idle_expiry_minutes: int = 1440
+    interview_archive_after_days: int = 180
+    interview_archive_batch_size: int = 500
+    
+    
+    bulk_history_max_users: int = 200
+    bulk_history_limit_per_user: int = 20
+    bulk_history_stream_threshold: int = 25
+    
+    
+    embedding_backend: str = "hashing"
+    embedding_model: str = "text-embedding-004"
+    question_dedup_enabled: bool = True
+    question_dedup_threshold: float = 0.85
+    question_dedup_history_interviews: int = 5
+    question_dedup_max_rounds: int = 1
     
     
 
@@ -31,6 +201,23 @@ class AppConfig(BaseSettings):
   
     
     log_level: str = "INFO"
+    # Fracción de eventos verbose (extra={"verbose": True}) que se escriben
+    log_verbose_sample_rate: float = 0.1
+    
+    
+    # none | console | file | otlp
+    tracing_exporter: str = "none"
+    tracing_sample_ratio: float = 0.05
+    tracing_service_name: str = "interview_ready_service"
+    tracing_file_path: str = "traces.jsonl"
+    # Vacío = OTEL_EXPORTER_OTLP_TRACES_ENDPOINT o el default del exporter
+    tracing_otlp_endpoint: str = ""
+    
+    
+    # Compresión de respuestas: none | gzip | brotli (brotli requiere brotli-asgi; cae a gzip si el cliente no acepta br)
+    compression: str = "gzip"
+    compression_min_size: int = 1024
+    compression_level: int = 5
     
     class Config:
       
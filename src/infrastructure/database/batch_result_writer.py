@@ -0,0 +1,72 @@
+import logging
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from bson import json_util
+from pydantic import BaseModel
+from pymongo import UpdateOne
+
+from domain.entities.interview_ready import InterviewReady
+from infrastructure.external_services.interview_prompts import parse_json_response, to_feedback
+
+logger = logging.getLogger(__name__)
+
+
+class WriteBack(BaseModel):
+    """Dónde guardar el resultado de un prompt: $set de `field` en el documento que cumpla `filter`.
+
+    Como cualquier otra escritura, también actualiza updated_at e incrementa version (ETag);
+    con el parser feedback, además points_earned junto a `field`.
+
+    filter va en Extended JSON ({"_id": {"$oid": "..."}, "userId": "..."}); incluir la
+    shard key para que la escritura vaya a un solo shard.
+    """
+    collection: str
+    filter: Dict[str, Any]
+    field: str
+    # text: tal cual | json: objeto JSON de la respuesta | feedback: FeedBack completo
+    parser: str = "json"
+
+
+def parse_result(text: Optional[str], parser: str) -> Any:
+    if parser == "text":
+        return text
+    data = parse_json_response(text)
+    if data is None:
+        return None
+    if parser == "feedback":
+        return to_feedback(data).model_dump()
+    if parser == "json":
+        return data
+    raise ValueError(f"Unknown parser: {parser}")
+
+
+class BatchResultWriter:
+    """Aplica los resultados de un lote con un bulk_write por colección."""
+
+    def __init__(self, allowed_collections: List[str]):
+        self.allowed_collections = set(allowed_collections)
+
+    async def write(self, items: List[Tuple[WriteBack, Any]]) -> int:
+        operations: Dict[str, List[UpdateOne]] = defaultdict(list)
+        now = datetime.utcnow()
+        for write_back, value in items:
+            if write_back.collection not in self.allowed_collections:
+                raise ValueError(f"Write-back to collection '{write_back.collection}' is not allowed")
+            fields = {write_back.field: value, "updated_at": now}
+            if write_back.parser == "feedback" and value is not None:
+                prefix = write_back.field.rpartition(".")[0]
+                fields[f"{prefix}.points_earned" if prefix else "points_earned"] = value["points_earned"]
+            operations[write_back.collection].append(UpdateOne(
+                json_util.loads(json_util.dumps(write_back.filter)),
+                {"$set": fields, "$inc": {"version": 1}}
+            ))
+        database = InterviewReady.get_motor_collection().database
+        modified = 0
+        for collection, updates in operations.items():
+            result = await database[collection].bulk_write(updates, ordered=False)
+            modified += result.modified_count
+            logger.debug("Batch write-back to %s: %d updates, %d modified", collection, len(updates),
+                         result.modified_count)
+        return modified
@@ -0,0 +1,144 @@
+"""Un único change stream de Mongo sobre interview_ready, repartido en memoria a los suscriptores.
+
+Cada worker abre un solo cursor (filtrado en el servidor a cambios de status/feedback)
+aunque tenga cientos de clientes suscritos; los eventos se enrutan por interview_id a
+la cola de cada suscriptor. Requiere que Mongo sea un replica set (o Atlas).
+"""
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Any, Dict, Optional, Set
+
+from pymongo.errors import OperationFailure
+
+from domain.entities.interview_ready import InterviewReady
+from infrastructure.config.app_config import config
+
+logger = logging.getLogger(__name__)
+
+WATCHED_FIELDS = ("status", "feedback", "points_earned", "end_at")
+
+_PIPELINE = [
+    {"$match": {"$or": [
+        {"operationType": "replace"},
+        *({"operationType": "update", f"updateDescription.updatedFields.{field}": {"$exists": True}}
+          for field in ("status", "feedback")),
+    ]}},
+    {"$project": {
+        "operationType": 1,
+        "documentKey": 1,
+        **{f"fullDocument.{field}": 1 for field in WATCHED_FIELDS},
+        **{f"updateDescription.updatedFields.{field}": 1 for field in WATCHED_FIELDS},
+    }},
+]
+
+
+class SubscriberLimitError(Exception):
+    """Este worker ya tiene el máximo de suscripciones abiertas."""
+
+
+class InterviewSubscription:
+    def __init__(self, hub: "InterviewEventHub", interview_id: str, queue_size: int):
+        self.hub = hub
+        self.interview_id = interview_id
+        self.queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue(maxsize=queue_size)
+
+    def push(self, event: Dict[str, Any]) -> None:
+        if self.queue.full():
+            # Cliente lento: solo importa el último estado, se descarta el evento más antiguo
+            self.queue.get_nowait()
+        self.queue.put_nowait(event)
+
+    async def next(self, timeout: float) -> Optional[Dict[str, Any]]:
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+        self.hub.unsubscribe(self)
+
+
+class InterviewEventHub:
+    def __init__(self, max_subscribers: int = 1000, queue_size: int = 16, retry_seconds: float = 5.0):
+        self.max_subscribers = max_subscribers
+        self.queue_size = queue_size
+        self.retry_seconds = retry_seconds
+        self._subscriptions: Dict[str, Set[InterviewSubscription]] = defaultdict(set)
+        self._count = 0
+        self._watcher: Optional[asyncio.Task] = None
+        self._resume_token: Optional[Dict] = None
+
+    def subscribe(self, interview_id: str) -> InterviewSubscription:
+        if self._count >= self.max_subscribers:
+            raise SubscriberLimitError("Too many open interview subscriptions")
+        subscription = InterviewSubscription(self, interview_id, self.queue_size)
+        self._subscriptions[interview_id].add(subscription)
+        self._count += 1
+        if self._watcher is None or self._watcher.done():
+            self._watcher = asyncio.create_task(self._watch())
+        return subscription
+
+    def unsubscribe(self, subscription: InterviewSubscription) -> None:
+        subscribers = self._subscriptions.get(subscription.interview_id)
+        if subscribers is None or subscription not in subscribers:
+            return
+        subscribers.discard(subscription)
+        self._count -= 1
+        if not subscribers:
+            del self._subscriptions[subscription.interview_id]
+
+    async def stop(self) -> None:
+        if self._watcher is not None:
+            self._watcher.cancel()
+            self._watcher = None
+
+    def dispatch(self, change: Dict[str, Any]) -> None:
+        interview_id = str(change["documentKey"]["_id"])
+        subscribers = self._subscriptions.get(interview_id)
+        if not subscribers:
+            return
+        fields = change.get("fullDocument") or change.get("updateDescription", {}).get("updatedFields", {})
+        event = {"interview_id": interview_id, **{f: fields[f] for f in WATCHED_FIELDS if f in fields}}
+        for subscription in list(subscribers):
+            subscription.push(event)
+
+    def _resync_all(self) -> None:
+        """Tras perder eventos, cada suscriptor vuelve a leer el estado actual"""
+        for interview_id, subscribers in list(self._subscriptions.items()):
+            for subscription in list(subscribers):
+                subscription.push({"interview_id": interview_id, "resync": True})
+
+    async def _watch(self) -> None:
+        collection = InterviewReady.get_motor_collection()
+        while self._count > 0:
+            try:
+                resumed = self._resume_token is not None
+                async with collection.watch(_PIPELINE, resume_after=self._resume_token) as stream:
+                    logger.info("Interview change stream opened")
+                    if not resumed:
+                        # Lo ocurrido entre la lectura inicial del suscriptor y la apertura no llega por el stream
+                        self._resync_all()
+                    async for change in stream:
+                        self._resume_token = stream.resume_token
+                        self.dispatch(change)
+                        if self._count == 0:
+                            # Sin suscriptores se cierra el cursor; el siguiente subscribe lo reabre
+                            break
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # p.ej. Mongo standalone (sin change streams) o caída del primario
+                logger.error("Interview change stream failed, retrying in %.0fs: %s", self.retry_seconds, e)
+                if isinstance(e, OperationFailure):
+                    # Resume token inválido o fuera del oplog: se reabre desde ahora (con resync)
+                    self._resume_token = None
+                await asyncio.sleep(self.retry_seconds)
+        self._resume_token = None
+        logger.info("Interview change stream closed")
+
+
+interview_event_hub = InterviewEventHub(
+    max_subscribers=config.interview_events_max_subscribers,
+    queue_size=config.interview_events_queue_size
+)
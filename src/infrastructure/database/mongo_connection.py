@@ -3,6 +3,12 @@ from motor.motor_asyncio import AsyncIOMotorClient
 from infrastructure.config.app_config import config 
 from beanie import init_beanie
 from domain.entities.interview_ready import InterviewReady
+from domain.entities.user_interview_stats import UserInterviewStats
+from domain.entities.llm_usage import LLMUsage
+from domain.entities.single_flight_lease import SingleFlightLease
+from domain.entities.idempotency_record import IdempotencyRecord
+from domain.entities.rate_limit_bucket import RateLimitBucket
+from domain.entities.precomputed_question_set import PrecomputedQuestionSet
 
 
 logger = logging.getLogger(__name__)
@@ -19,7 +25,13 @@ class MongoConnection:
             self.client = AsyncIOMotorClient(config.mongodb_url)
             self.database = self.client[config.mongodb_db_name]
             await init_beanie(database=self.database, document_models=[
-                InterviewReady
+                InterviewReady,
+                UserInterviewStats,
+                LLMUsage,
+                SingleFlightLease,
+                IdempotencyRecord,
+                RateLimitBucket,
+                PrecomputedQuestionSet
                 
             ]
                               )
@@ -28,7 +40,7 @@ class MongoConnection:
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to connect to MongoDB: {e}")
+            self.logger.error("Failed to connect to MongoDB: %s", e)
             raise Exception(f"Database connection failed: {e}")
     
     async def disconnect(self):
@@ -43,7 +55,7 @@ class MongoConnection:
             await self.client.admin.command('ping')
             return True
         except Exception as e:
-            self.logger.error(f"Database health check failed: {e}")
+            self.logger.error("Database health check failed: %s", e)
             return False
 
 
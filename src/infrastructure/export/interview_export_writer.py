@@ -0,0 +1,110 @@
+import json
+import logging
+import os
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+EXPORT_COLUMNS = [
+    "interview_id", "user_id", "type", "status", "user_seniority", "user_specialization",
+    "init_at", "end_at", "points_earned", "overall_score", "summary_feedback",
+    "question_id", "question", "competency", "difficulty", "answer", "question_feedback",
+    "competency_score",
+]
+
+
+class InterviewExportWriter(ABC):
+    """Destino de la exportación; recibe lotes de filas ya aplanadas (una por pregunta)."""
+
+    @abstractmethod
+    def write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        ...
+
+    def close(self) -> None:
+        pass
+
+
+class NdjsonExportWriter(InterviewExportWriter):
+    def __init__(self, path: str, append: bool = False):
+        self.file = open(path, "a" if append else "w", encoding="utf-8")
+
+    def write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        for row in rows:
+            self.file.write(json.dumps(row, ensure_ascii=False, default=_json_default))
+            self.file.write("\n")
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class ParquetExportWriter(InterviewExportWriter):
+    """Escribe un archivo part-NNNNN.parquet por lote dentro de un directorio.
+
+    Cada lote es un archivo independiente, así que retomar desde un checkpoint
+    solo añade partes nuevas y la memoria queda acotada al tamaño del lote. Sin
+    `append` el directorio no puede tener partes de otra exportación.
+    """
+    def __init__(self, directory: str, append: bool = False):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as e:
+            raise ValueError("Parquet export requires the 'pyarrow' package") from e
+        self.pa = pyarrow
+        self.pq = pyarrow.parquet
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.schema = pyarrow.schema([
+            (column, pyarrow.int64() if column in ("points_earned", "overall_score", "question_id", "competency_score")
+             else pyarrow.timestamp("us", tz="UTC") if column in ("init_at", "end_at")
+             else pyarrow.string())
+            for column in EXPORT_COLUMNS
+        ])
+        existing = [name for name in os.listdir(directory) if name.endswith(".parquet")]
+        if existing and not append:
+            raise ValueError(f"El directorio {directory} ya contiene una exportación; usa --resume u otro directorio")
+        self.part = len(existing)
+
+    def write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        if not rows:
+            return
+        table = self.pa.Table.from_pylist(rows, schema=self.schema)
+        path = os.path.join(self.directory, f"part-{self.part:05d}.parquet")
+        self.pq.write_table(table, path, compression="zstd")
+        self.part += 1
+
+
+def create_export_writer(export_format: str, output: str, append: bool = False) -> InterviewExportWriter:
+    if export_format == "ndjson":
+        return NdjsonExportWriter(output, append=append)
+    if export_format == "parquet":
+        return ParquetExportWriter(output, append=append)
+    raise ValueError(f"Formato de exportación no soportado: {export_format}")
+
+
+def read_checkpoint(path: str) -> Optional[str]:
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return f.read().strip() or None
+
+
+def write_checkpoint(path: str, last_id: str) -> None:
+    # Reemplazo atómico para no dejar un checkpoint a medio escribir
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(last_id)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
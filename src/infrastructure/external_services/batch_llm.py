@@ -0,0 +1,160 @@
+"""Ejecución por lotes de prompts fuera del camino interactivo.
+
+Los trabajos masivos (regenerar contenido, precalcular, reprocesar) usan su propio
+cliente y su propio límite de concurrencia, nunca la instancia compartida de
+get_interview_llm ni el presupuesto por usuario:
+
+- provider: la interfaz batch del proveedor (Gemini Batch API), más barata y sin
+  consumir la cuota online; el lote se completa en minutos u horas.
+- throttled: llamadas normales a un backend propio con concurrencia y ritmo acotados.
+"""
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from infrastructure.config.app_config import config
+from infrastructure.external_services.interview_llm import InterviewLLM
+
+logger = logging.getLogger(__name__)
+
+
+class BatchRequest(BaseModel):
+    custom_id: str
+    operation: str
+    prompt: str
+
+
+class BatchResult(BaseModel):
+    custom_id: str
+    text: Optional[str] = None
+    error: Optional[str] = None
+    prompt_tokens: int = 0
+    output_tokens: int = 0
+
+
+class BatchExecutor(ABC):
+    """submit devuelve un identificador que se guarda en el checkpoint; collect espera y devuelve
+    los resultados en el mismo orden. Tras un reinicio se puede llamar a collect con ese identificador."""
+
+    @abstractmethod
+    async def submit(self, requests: List[BatchRequest]) -> str:
+        ...
+
+    @abstractmethod
+    async def collect(self, handle: str, requests: List[BatchRequest]) -> List[BatchResult]:
+        ...
+
+
+class ThrottledBatchExecutor(BatchExecutor):
+    def __init__(self, backend: InterviewLLM, concurrency: int = 4, requests_per_minute: float = 60):
+        self.backend = backend
+        self.concurrency = concurrency
+        self.min_interval = 60 / requests_per_minute if requests_per_minute > 0 else 0
+        self._next_slot = 0.0
+        self._pace_lock = asyncio.Lock()
+
+    async def submit(self, requests: List[BatchRequest]) -> str:
+        # Nada que enviar por adelantado: el lote se ejecuta en collect
+        return "throttled"
+
+    async def collect(self, handle: str, requests: List[BatchRequest]) -> List[BatchResult]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run(request: BatchRequest) -> BatchResult:
+            async with semaphore:
+                await self._pace()
+                try:
+                    completion = await self.backend.complete(
+                        request.prompt, request.operation, config.llm_max_output_tokens.get(request.operation)
+                    )
+                    return BatchResult(custom_id=request.custom_id, text=completion.text,
+                                       prompt_tokens=completion.prompt_tokens, output_tokens=completion.output_tokens)
+                except Exception as e:
+                    return BatchResult(custom_id=request.custom_id, error=str(e))
+
+        return list(await asyncio.gather(*(run(request) for request in requests)))
+
+    async def _pace(self) -> None:
+        if not self.min_interval:
+            return
+        async with self._pace_lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.min_interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class GeminiBatchExecutor(BatchExecutor):
+    TERMINAL_STATES = {"JOB_STATE_SUCCEEDED", "JOB_STATE_FAILED", "JOB_STATE_CANCELLED", "JOB_STATE_EXPIRED"}
+
+    def __init__(self, poll_interval: float = 30.0):
+        from google import genai
+        # Cliente propio: no comparte conexiones con el servicio interactivo
+        self.client = genai.Client(api_key=config.gemini_api_key)
+        self.model_name = config.gemini_model
+        self.poll_interval = poll_interval
+
+    async def submit(self, requests: List[BatchRequest]) -> str:
+        from infrastructure.external_services.gemini_service import generation_config_fields
+        inlined = []
+        for request in requests:
+            fields = generation_config_fields(request.operation, config.llm_max_output_tokens.get(request.operation))
+            inlined.append({
+                "contents": [{"role": "user", "parts": [{"text": request.prompt}]}],
+                **({"config": fields} if fields else {}),
+            })
+        job = await asyncio.to_thread(
+            self.client.batches.create,
+            model=self.model_name,
+            src=inlined,
+            config={"display_name": f"interview-ready-{requests[0].custom_id}"}
+        )
+        logger.info("Submitted Gemini batch %s with %d requests", job.name, len(requests))
+        return job.name
+
+    async def collect(self, handle: str, requests: List[BatchRequest]) -> List[BatchResult]:
+        while True:
+            job = await asyncio.to_thread(self.client.batches.get, name=handle)
+            state = getattr(job.state, "name", str(job.state))
+            if state in self.TERMINAL_STATES:
+                break
+            logger.debug("Gemini batch %s is %s", handle, state)
+            await asyncio.sleep(self.poll_interval)
+        if state != "JOB_STATE_SUCCEEDED":
+            return [BatchResult(custom_id=request.custom_id, error=f"batch {state}") for request in requests]
+
+        results = []
+        for request, inlined in zip(requests, job.dest.inlined_responses):
+            if inlined.error:
+                results.append(BatchResult(custom_id=request.custom_id, error=str(inlined.error)))
+                continue
+            usage = inlined.response.usage_metadata
+            results.append(BatchResult(
+                custom_id=request.custom_id,
+                text=inlined.response.text,
+                prompt_tokens=(usage.prompt_token_count or 0) if usage else 0,
+                output_tokens=(usage.candidates_token_count or 0) if usage else 0,
+            ))
+        return results
+
+
+def create_batch_executor(mode: Optional[str] = None) -> BatchExecutor:
+    mode = mode or config.batch_llm_mode
+    if mode == "provider":
+        if config.batch_llm_backend != "gemini":
+            raise ValueError(f"Backend '{config.batch_llm_backend}' has no batch interface; use mode 'throttled'")
+        return GeminiBatchExecutor(poll_interval=config.batch_poll_interval_seconds)
+    if mode == "throttled":
+        from infrastructure.external_services.llm_router import create_backend
+        # Instancia nueva y sin usage_tracker: ni comparte cliente ni consume el presupuesto de los usuarios
+        return ThrottledBatchExecutor(
+            create_backend(config.batch_llm_backend),
+            concurrency=config.batch_concurrency,
+            requests_per_minute=config.batch_requests_per_minute
+        )
+    raise ValueError(f"Unknown batch mode: {mode}")
@@ -0,0 +1,78 @@
+import asyncio
+import logging
+import re
+import zlib
+from abc import ABC, abstractmethod
+from typing import List
+
+import numpy as np
+from google import genai
+
+from infrastructure.config.app_config import config
+from infrastructure.similarity.vector_index import normalize_rows
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+class EmbeddingService(ABC):
+    dimension: int
+
+    @abstractmethod
+    async def embed(self, texts: List[str]) -> np.ndarray:
+        """Devuelve una matriz (len(texts), dimension) con filas normalizadas"""
+        ...
+
+
+class HashingEmbeddingService(EmbeddingService):
+    """Embedding local sin modelo: palabras y trigramas de caracteres proyectados con el hashing trick.
+
+    Detecta reformulaciones cercanas (mismo vocabulario, orden distinto) sin coste de red.
+    """
+    def __init__(self, dimension: int = 512):
+        self.dimension = dimension
+
+    async def embed(self, texts: List[str]) -> np.ndarray:
+        matrix = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            indices, signs = self._features(text)
+            if indices:
+                np.add.at(matrix[row], indices, signs)
+        return normalize_rows(matrix)
+
+    def _features(self, text: str):
+        indices, signs = [], []
+        for token in _TOKEN_RE.findall(text.lower()):
+            grams = [token] + [token[i:i + 3] for i in range(max(len(token) - 2, 0))]
+            for gram in grams:
+                h = zlib.crc32(gram.encode("utf-8"))
+                indices.append(h % self.dimension)
+                signs.append(1.0 if h & 0x80000000 else -1.0)
+        return indices, signs
+
+
+class GeminiEmbeddingService(EmbeddingService):
+    def __init__(self, model_name: str = None):
+        self.client = genai.Client(api_key=config.gemini_api_key)
+        self.model_name = model_name or config.embedding_model
+        self.dimension = 768
+
+    async def embed(self, texts: List[str]) -> np.ndarray:
+        if not texts:
+            return np.empty((0, self.dimension), dtype=np.float32)
+        response = await asyncio.to_thread(
+            self.client.models.embed_content,
+            model=self.model_name,
+            contents=texts,
+        )
+        return normalize_rows(np.array([embedding.values for embedding in response.embeddings], dtype=np.float32))
+
+
+def create_embedding_service(backend: str = None) -> EmbeddingService:
+    backend = backend or config.embedding_backend
+    if backend == "gemini":
+        return GeminiEmbeddingService()
+    if backend == "hashing":
+        return HashingEmbeddingService()
+    raise ValueError(f"Unknown embedding backend: {backend}")
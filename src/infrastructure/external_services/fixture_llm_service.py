@@ -0,0 +1,91 @@
+import hashlib
+import json
+from typing import Any, Dict, List, Optional
+
+from domain.entities.interview_ready import CompetencyBreakdown, FeedBack, Question
+from infrastructure.external_services.interview_llm import InterviewLLM, LLMCompletion
+from infrastructure.external_services.interview_prompts import INTERVIEW_TYPES, difficulty_plan
+
+
+class FixtureLLMService(InterviewLLM):
+    """Backend determinista sin red para pruebas de carga y desarrollo local.
+
+    Las respuestas dependen solo de la entrada, así que dos corridas iguales
+    producen exactamente los mismos documentos.
+    """
+    name = "fixture"
+
+    async def complete(self, prompt: str, operation: str, max_output_tokens: Optional[int] = None) -> LLMCompletion:
+        return LLMCompletion(
+            text=json.dumps({"operation": operation, "digest": hashlib.sha1(prompt.encode("utf-8")).hexdigest()}),
+            prompt_tokens=len(prompt) // 4,
+        )
+
+    async def generate_questions(self, seniority: str, specialization: str, num_questions: int = 5,
+                                 interview_type: str = "behavioral",
+                                 user_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        competencies = INTERVIEW_TYPES.get(interview_type, INTERVIEW_TYPES["behavioral"])["examples"].split(", ")
+        difficulties = difficulty_plan(num_questions)
+        return {"questions": [{
+            "id": i + 1,
+            "question": f"[{interview_type}/{seniority}/{specialization}] Describe a situation where you showed "
+                        f"{competencies[i % len(competencies)]} ({difficulties[i]} #{i + 1}).",
+            "competency": competencies[i % len(competencies)],
+            "difficulty": difficulties[i],
+        } for i in range(num_questions)]}
+
+    async def generate_replacement_questions(self, seniority: str, specialization: str,
+                                             slots: List[Dict[str, Any]], avoid: List[str],
+                                             interview_type: str = "behavioral",
+                                             user_id: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+        return [{
+            **slot,
+            "question": f"[{interview_type}/{seniority}/{specialization}] Walk me through another example of "
+                        f"{slot.get('competency')} (replacement for #{slot.get('id')}).",
+        } for slot in slots]
+
+    async def generate_feedback(self, question: str, user_response: str, seniority: str,
+                                specialization: str, interview_type: str = "behavioral",
+                                user_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        words = len(user_response.split())
+        if words <= 10:
+            return {"feedback": "Take your time to think of a specific example and walk through the situation, "
+                                "your actions and the result.", "good_question": False,
+                    "score": fixture_score(user_response)}
+        return {"feedback": f"You gave a {words}-word answer. Consider adding measurable results.", "good_question": True,
+                "score": fixture_score(user_response)}
+
+    async def generate_complete_feedback(self, questions: List[Question], seniority: str, specialization: str,
+                                         interview_type: str = "behavioral",
+                                         user_id: Optional[str] = None) -> Optional[FeedBack]:
+        scores = {q.id: fixture_score(q.answer) for q in questions}
+        overall = round(sum(scores.values()) / len(scores)) if scores else 0
+        by_competency: Dict[str, List[int]] = {}
+        for q in questions:
+            by_competency.setdefault(q.competency, []).append(scores[q.id])
+        return FeedBack(
+            overall_score=overall,
+            competency_breakdown=[CompetencyBreakdown(name=name, score=round(sum(values) / len(values)))
+                                  for name, values in by_competency.items()],
+            points_earned=10 if overall >= 80 else 5 if overall >= 60 else 2,
+            focus_questions=[q.question for q in questions if scores[q.id] < 60][:5],
+            summary_feedback=f"Fixture feedback for a {seniority} {specialization} {interview_type} interview."
+        )
+
+    async def generate_summary_feedback(self, questions: List[Question], seniority: str, specialization: str,
+                                        interview_type: str, overall_score: int,
+                                        competency_breakdown: List[Dict[str, Any]], focus_questions: List[str],
+                                        user_id: Optional[str] = None) -> Optional[str]:
+        return f"Fixture feedback for a {seniority} {specialization} {interview_type} interview " \
+               f"(overall {overall_score}, {len(focus_questions)} questions to improve)."
+
+
+def fixture_score(answer: Optional[str]) -> int:
+    words = len((answer or "").split())
+    if words <= 10:
+        return 35
+    if words <= 40:
+        return 55
+    if words <= 120:
+        return 75
+    return 90
@@ -0,0 +1,176 @@
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+from domain.entities.interview_ready import FeedBack, Question
+from infrastructure.config.app_config import config
+from infrastructure.observability.tracing import tracer
+from infrastructure.external_services.interview_prompts import (
+    build_complete_feedback_prompt,
+    build_feedback_prompt,
+    build_questions_prompt,
+    build_replacement_questions_prompt,
+    build_summary_feedback_prompt,
+    parse_json_response,
+    to_feedback,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def output_token_cap(operation: str, items: int = 0) -> Optional[int]:
+    """Tope de tokens de salida; en las operaciones que generan preguntas escala con cuántas se piden"""
+    per_question = config.llm_output_tokens_per_question.get(operation)
+    if per_question and items:
+        return config.llm_output_tokens_overhead + per_question * items
+    return config.llm_max_output_tokens.get(operation)
+
+
+class LLMBudgetExceededError(Exception):
+    """El usuario agotó su presupuesto diario de tokens; la llamada no se hace."""
+
+
+class LLMCompletion(BaseModel):
+    text: Optional[str] = None
+    prompt_tokens: int = 0
+    output_tokens: int = 0
+    cached_tokens: int = 0
+
+
+class InterviewLLM(ABC):
+    """Puerto hacia el modelo de lenguaje usado por los casos de uso.
+
+    Las operaciones de entrevista arman el prompt y parsean el JSON; cada backend
+    solo implementa `complete`, que recibe el prompt, el nombre de la operación y
+    el tope de tokens de salida configurado para ella.
+    """
+    name: str = "llm"
+    # Lo asigna get_interview_llm; sin tracker no se contabiliza ni se limita
+    usage_tracker = None
+
+    async def connect(self):
+        pass
+
+    async def health_check(self) -> bool:
+        return True
+
+    @abstractmethod
+    async def complete(self, prompt: str, operation: str, max_output_tokens: Optional[int] = None) -> LLMCompletion:
+        ...
+
+    async def _run(self, prompt: str, operation: str, user_id: Optional[str], items: int = 0) -> Optional[str]:
+        with tracer.start_as_current_span(f"InterviewLLM.{operation}") as span:
+            span.set_attribute("llm.backend", self.name)
+            span.set_attribute("llm.operation", operation)
+            if self.usage_tracker:
+                await self.usage_tracker.check_budget(user_id)
+            completion = await self.complete(prompt, operation, output_token_cap(operation, items))
+            span.set_attribute("llm.prompt_tokens", completion.prompt_tokens)
+            span.set_attribute("llm.output_tokens", completion.output_tokens)
+            if self.usage_tracker:
+                await self.usage_tracker.record(user_id, operation, self.name, completion)
+            return completion.text
+
+    async def generate_questions(self, seniority: str, specialization: str, num_questions: int = 5,
+                                 interview_type: str = "behavioral",
+                                 user_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        try:
+            text = await self._run(
+                build_questions_prompt(seniority, specialization, num_questions, interview_type),
+                "generate_questions",
+                user_id,
+                items=num_questions
+            )
+            questions_data = parse_json_response(text)
+            if questions_data is None:
+                logger.warning("No content generated for %s interview", interview_type)
+                return None
+            logger.info("Generated %d %s questions", len(questions_data.get("questions", [])), interview_type)
+            logger.debug("Generated questions data: %s", questions_data, extra={"verbose": True})
+            return questions_data
+        except LLMBudgetExceededError:
+            raise
+        except Exception as e:
+            logger.error("Error generating %s questions: %s", interview_type, e)
+            return None
+
+    async def generate_replacement_questions(self, seniority: str, specialization: str,
+                                             slots: List[Dict[str, Any]], avoid: List[str],
+                                             interview_type: str = "behavioral",
+                                             user_id: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+        """Regenera solo las preguntas indicadas en `slots` (id, competency, difficulty) evitando `avoid`"""
+        if not slots:
+            return []
+        try:
+            text = await self._run(
+                build_replacement_questions_prompt(seniority, specialization, slots, avoid, interview_type),
+                "generate_replacement_questions",
+                user_id,
+                items=len(slots)
+            )
+            data = parse_json_response(text)
+            return data.get("questions", []) if data else None
+        except LLMBudgetExceededError:
+            raise
+        except Exception as e:
+            logger.error("Error generating replacement questions: %s", e)
+            return None
+
+    async def generate_feedback(self, question: str, user_response: str, seniority: str,
+                                specialization: str, interview_type: str = "behavioral",
+                                user_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        try:
+            text = await self._run(
+                build_feedback_prompt(question, user_response, seniority, specialization, interview_type),
+                "generate_feedback",
+                user_id
+            )
+            return parse_json_response(text)
+        except LLMBudgetExceededError:
+            raise
+        except Exception as e:
+            logger.error("Error generating feedback: %s", e)
+            return None
+
+    async def generate_complete_feedback(self, questions: List[Question], seniority: str, specialization: str,
+                                         interview_type: str = "behavioral",
+                                         user_id: Optional[str] = None) -> Optional[FeedBack]:
+        try:
+            text = await self._run(
+                build_complete_feedback_prompt(questions, seniority, specialization, interview_type),
+                "generate_complete_feedback",
+                user_id
+            )
+            feedback_complete = parse_json_response(text)
+            if feedback_complete is None:
+                return None
+            logger.debug("Generated complete feedback for %s interview: %s", interview_type, feedback_complete,
+                         extra={"verbose": True})
+            return to_feedback(feedback_complete)
+        except LLMBudgetExceededError:
+            raise
+        except Exception as e:
+            logger.error("Error generating complete feedback: %s", e)
+            return None
+
+    async def generate_summary_feedback(self, questions: List[Question], seniority: str, specialization: str,
+                                        interview_type: str, overall_score: int,
+                                        competency_breakdown: List[Dict[str, Any]], focus_questions: List[str],
+                                        user_id: Optional[str] = None) -> Optional[str]:
+        """Solo el texto de summary_feedback; las puntuaciones ya vienen calculadas"""
+        try:
+            text = await self._run(
+                build_summary_feedback_prompt(questions, seniority, specialization, interview_type,
+                                              overall_score, competency_breakdown, focus_questions),
+                "generate_summary_feedback",
+                user_id
+            )
+            data = parse_json_response(text)
+            return data.get("summary_feedback") if data else None
+        except LLMBudgetExceededError:
+            raise
+        except Exception as e:
+            logger.error("Error generating summary feedback: %s", e)
+            return None
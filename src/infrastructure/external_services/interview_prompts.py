@@ -0,0 +1,430 @@
+"""Prompts y parseo compartidos por todos los backends de InterviewLLM."""
+import json
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from domain.entities.interview_ready import FeedBack, Question
+from infrastructure.config.app_config import config
+
+logger = logging.getLogger(__name__)
+
+
+INTERVIEW_TYPES = {
+    "behavioral": {
+        "description": "Quick Behavioral or Introduction Questions",
+        "focus": "STAR method behavioral questions focusing on past experiences, teamwork, and problem-solving situations",
+        "examples": "leadership, collaboration, conflict resolution, adaptability"
+    },
+    "structured": {
+        "description": "Structured Interview Responses",
+        "focus": "Structured behavioral questions with clear STAR framework, emphasizing measurable outcomes and specific methodologies",
+        "examples": "project management, process improvement, decision-making, stakeholder management"
+    },
+    "technical": {
+        "description": "Role-Specific or Technical Questions",
+        "focus": "Technical and role-specific challenges combining behavioral aspects with technical problem-solving",
+        "examples": "technical leadership, architecture decisions, code review, system design"
+    },
+    "simulation": {
+        "description": "Full Interview Simulation",
+        "focus": "Comprehensive interview simulation covering behavioral, technical, and leadership scenarios with high complexity",
+        "examples": "crisis management, strategic planning, cross-functional leadership, business impact"
+    }
+}
+
+FEEDBACK_CRITERIA = {
+    "behavioral": {
+        "focus": "past experiences, specific situations and measurable results",
+        "key_aspects": "situation clarity, actions taken, results achieved"
+    },
+    "structured": {
+        "focus": "structured methodology, clear processes and frameworks",
+        "key_aspects": "systematic thinking, stakeholder consideration, result measurement"
+    },
+    "technical": {
+        "focus": "technical depth, trade-offs and architecture decisions",
+        "key_aspects": "technical accuracy, scalability, best practices"
+    },
+    "simulation": {
+        "focus": "comprehensive analysis, stakeholder management and strategic thinking",
+        "key_aspects": "complexity handling, leadership, business impact"
+    }
+}
+
+SCORING_CRITERIA = {
+    "behavioral": {
+        "description": "behavioral interview with STAR method focus",
+        "key_competencies": "leadership, collaboration, conflict resolution, adaptability",
+        "scoring_focus": "situation clarity, action specificity, measurable results"
+    },
+    "structured": {
+        "description": "structured interview with systematic approach",
+        "key_competencies": "project management, process improvement, decision-making, stakeholder management",
+        "scoring_focus": "methodology application, process thinking, outcome measurement"
+    },
+    "technical": {
+        "description": "technical interview with role-specific challenges",
+        "key_competencies": "technical leadership, architecture decisions, code review, system design",
+        "scoring_focus": "technical depth, trade-offs consideration, best practices"
+    },
+    "simulation": {
+        "description": "comprehensive interview simulation",
+        "key_competencies": "crisis management, strategic planning, cross-functional leadership, business impact",
+        "scoring_focus": "complexity handling, stakeholder management, strategic thinking"
+    }
+}
+
+
+def clip_answer(answer: Optional[str], max_chars: Optional[int] = None) -> Optional[str]:
+    """Recorta respuestas largas antes de armar el prompt (la respuesta completa se guarda igual)"""
+    max_chars = max_chars or config.answer_prompt_max_chars
+    if not answer or len(answer) <= max_chars:
+        return answer
+    clipped = answer[:max_chars]
+    # Cortar en el último espacio para no partir palabras
+    if " " in clipped[-200:]:
+        clipped = clipped[:clipped.rindex(" ")]
+    return f"{clipped} [...truncated]"
+
+
+# Misma distribución que pide el prompt de generate_questions (easy, medium, hard)
+DIFFICULTY_DISTRIBUTION = {
+    5: (2, 2, 1),
+    10: (3, 4, 3),
+    15: (4, 6, 5),
+    30: (8, 12, 10),
+}
+DIFFICULTY_TIERS = ("easy", "medium", "hard")
+
+
+def difficulty_counts(num_questions: int) -> Tuple[int, int, int]:
+    return DIFFICULTY_DISTRIBUTION.get(
+        num_questions,
+        (round(num_questions * 0.3), num_questions - 2 * round(num_questions * 0.3), round(num_questions * 0.3))
+    )
+
+
+def difficulty_plan(num_questions: int) -> List[str]:
+    easy, medium, hard = difficulty_counts(num_questions)
+    return ["easy"] * easy + ["medium"] * medium + ["hard"] * hard
+
+
+def build_questions_prompt(seniority: str, specialization: str, num_questions: int, interview_type: str) -> str:
+    interview_config = INTERVIEW_TYPES.get(interview_type, INTERVIEW_TYPES["behavioral"])
+    return f"""
+                You are a senior Human Resources professional who has run 1,000+ technical interviews for global tech companies.
+
+                OBJECTIVE
+                Generate exactly {num_questions} interview questions for a {interview_config['description']} session that follow the STAR method (Situation, Task, Action, Result).
+
+                INTERVIEW TYPE: {interview_type.upper()}
+                FOCUS: {interview_config['focus']}
+
+                CANDIDATE CONTEXT
+                - Seniority level: {seniority}
+                - Specialization: {specialization}
+                - Industry: Technology
+                - Interview Type: {interview_config['description']}
+
+                DESIGN RULES
+                1. STAR focus – Each question must invite a STAR-structured answer.
+                2. Interview type alignment – Questions must match the {interview_type} interview style:
+                • behavioral = personal experiences, soft skills, team dynamics
+                • structured = process-oriented, methodical approaches, clear frameworks  
+                • technical = technical challenges, system design, code/architecture decisions
+                • simulation = complex scenarios, multiple stakeholders, business impact
+                3. Progressive difficulty –  
+                • easy = straightforward, single team, clear outcome  
+                • medium = cross-team, partial ambiguity, measurable impact  
+                • hard = open-ended, high ambiguity, high stakes (production outage, business risk)
+                4. Embed realistic, contemporary tech settings (e.g., cloud-native microservices, AI-driven products, agile at scale).  
+                5. No generic fillers or duplicate wording across questions.  
+                6. Target core competencies: {interview_config['examples']}
+                7. Limit each `question` field to ≤ 45 words.
+
+                DIFFICULTY DISTRIBUTION
+                - {num_questions} questions total
+                - If 5 questions: 2 easy, 2 medium, 1 hard
+                - If 10 questions: 3 easy, 4 medium, 3 hard  
+                - If 15 questions: 4 easy, 6 medium, 5 hard
+                - If 30 questions: 8 easy, 12 medium, 10 hard
+
+                OUTPUT FORMAT  
+                Return only valid JSON:
+
+                {{
+                "questions": [
+                    {{
+                    "id": 1,
+                    "question": "...",
+                    "competency": "e.g., {interview_config['examples'].split(', ')[0]}",
+                    "difficulty": "easy|medium|hard"
+                    }}
+                ]
+                }}
+
+                Think through the steps silently; print only the JSON. No extra text.
+                """
+
+
+def build_replacement_questions_prompt(seniority: str, specialization: str, slots: List[Dict[str, Any]],
+                                       avoid: List[str], interview_type: str) -> str:
+    slots_json = json.dumps(slots, ensure_ascii=False)
+    avoid_json = json.dumps(avoid, ensure_ascii=False)
+    return f"""You are a senior Human Resources professional writing {interview_type} interview questions that follow the STAR method.
+
+CANDIDATE CONTEXT
+- Seniority level: {seniority}
+- Specialization: {specialization}
+
+TASK
+Write exactly one new question for each slot below, keeping its id, competency and difficulty.
+Each new question must be clearly different in topic and wording from every question in AVOID.
+Limit each `question` field to ≤ 45 words.
+
+SLOTS
+{slots_json}
+
+AVOID
+{avoid_json}
+
+Return only valid JSON:
+{{"questions": [{{"id": 1, "question": "...", "competency": "...", "difficulty": "easy|medium|hard"}}]}}"""
+
+
+def build_feedback_prompt(question: str, user_response: str, seniority: str, specialization: str,
+                          interview_type: str) -> str:
+    criteria = FEEDBACK_CRITERIA.get(interview_type, FEEDBACK_CRITERIA["behavioral"])
+    user_response = clip_answer(user_response)
+    return f"""You are an experienced interview mentor who provides constructive feedback to help professionals improve their interview performance.
+
+OBJECTIVE
+Analyze the candidate's response and provide specific, actionable feedback (≤80 words) in a personal and encouraging tone.
+
+CONTEXT
+Question: {question}
+Candidate's response: {user_response}
+Candidate level: {seniority} 
+Specialization: {specialization}
+Interview type: {interview_type}
+
+EVALUATION CRITERIA for {interview_type} interviews:
+Primary focus: {criteria['focus']}
+Key evaluation aspects: {criteria['key_aspects']}
+
+RESPONSE QUALITY ASSESSMENT
+First, evaluate the response quality:
+- COHERENT: Response directly addresses the question with relevant content
+- PARTIALLY COHERENT: Response somewhat relates to question but lacks focus or clarity
+- INCOHERENT: Response is off-topic, unclear, or doesn't address the question
+- EMPTY/MINIMAL: Very short response (≤10 words) or just says "I don't know"
+
+FEEDBACK STRATEGY by Response Type:
+
+FOR COHERENT RESPONSES:
+- Acknowledge specific strengths in their answer
+- Suggest 1-2 concrete improvements (more details, metrics, structure)
+- Use encouraging tone: "You demonstrated...", "Consider adding..."
+
+FOR PARTIALLY COHERENT RESPONSES:
+- Acknowledge any relevant points they made
+- Guide them to focus more directly on the question
+- Suggest structure improvements: "Your experience with X is valuable. To strengthen this, focus on..."
+
+FOR INCOHERENT/OFF-TOPIC RESPONSES:
+- Gently redirect without being harsh
+- Provide clear guidance on what the question is asking
+- Suggest approach: "This question is looking for an example of [specific situation]. Consider sharing..."
+
+FOR EMPTY/MINIMAL RESPONSES:
+- Encourage them to elaborate
+- Provide framework guidance
+- Be supportive: "Take your time to think of a specific example where you..."
+
+SENIORITY-ADJUSTED EXPECTATIONS:
+- Junior: Focus on learning mindset, basic examples, potential
+- Mid: Expect some structured thinking, relevant examples  
+- Senior: Expect clear structure, measurable impact, leadership examples
+- Lead/Principal: Expect strategic thinking, organizational impact, complex scenarios
+
+GOOD RESPONSE CRITERIA
+Determine if this is a "good" response based on:
+- COHERENT responses that address the question directly = true
+- PARTIALLY COHERENT responses with relevant content but lacking structure = true
+- INCOHERENT or OFF-TOPIC responses = false
+- EMPTY/MINIMAL responses = false
+
+FEEDBACK REQUIREMENTS:
+1. Always maintain an encouraging, supportive tone
+2. Provide specific, actionable suggestions
+3. Keep feedback concise (≤80 words)
+4. Focus on 1-2 key improvement areas
+5. When possible, acknowledge something positive first
+
+ANSWER SCORE
+Grade the response once, using exactly one of these values:
+- 90: Excellent (clear STAR structure, specific examples, measurable impact)
+- 75: Good (good structure, relevant examples, some metrics)
+- 55: Fair (basic structure, general examples, limited specifics)
+- 35: Poor (lacks structure, vague examples, no measurable results, or EMPTY/MINIMAL/OFF-TOPIC)
+
+CRITICAL: Return ONLY valid JSON with this exact structure:
+
+{{
+  "feedback": "Your specific, encouraging feedback here",
+  "good_question": true,
+  "score": 75
+}}
+
+The "good_question" field should be:
+- true: if the response is COHERENT or PARTIALLY COHERENT (shows effort and relevance)
+- false: if the response is INCOHERENT, OFF-TOPIC, or EMPTY/MINIMAL
+
+Do not include markdown formatting, code blocks, or any text outside the JSON. Analyze the response quality internally and provide appropriate feedback based on the assessment."""
+
+
+def build_complete_feedback_prompt(questions: List[Question], seniority: str, specialization: str,
+                                   interview_type: str) -> str:
+    criteria = SCORING_CRITERIA.get(interview_type, SCORING_CRITERIA["behavioral"])
+    questions_data = []
+    for q in questions:
+        questions_data.append({
+            "id": q.id,
+            "question": q.question,
+            "answer": clip_answer(getattr(q, 'answer', '')),
+            "feedback": getattr(q, 'feedback', ''),
+            "competency": q.competency,
+            "difficulty": q.difficulty
+        })
+
+    questions_json = json.dumps(questions_data, ensure_ascii=False)
+    return f"""You are an experienced interview mentor providing comprehensive feedback for a {criteria['description']}.
+
+        OBJECTIVE
+        Analyze the complete interview session and provide actionable insights with a personal, encouraging tone.
+
+        CONTEXT
+        Candidate level: {seniority}
+        Candidate specialization: {specialization}
+        Interview type: {interview_type}
+        Key competencies evaluated: {criteria['key_competencies']}
+        Scoring focus: {criteria['scoring_focus']}
+
+        SESSION DATA
+        {questions_json}
+
+        SCORING METHODOLOGY
+        1. **Answer Quality Assessment** (per question):
+        • Excellent response → 90 points (clear STAR structure, specific examples, measurable impact)
+        • Good response → 75 points (good structure, relevant examples, some metrics)
+        • Fair response → 55 points (basic structure, general examples, limited specifics)
+        • Poor response → 35 points (lacks structure, vague examples, no measurable results)
+
+        2. **Overall Score**: Average of all individual answer scores (rounded to nearest integer)
+
+        3. **Competency Scores**: Average score per competency group
+
+        4. **Points Earned** (based on overall performance):
+        • ≥80 → 10 points (excellent performance)
+        • 60-79 → 5 points (good performance) 
+        • <60 → 2 points (needs improvement)
+
+        5. **Focus Areas**: Identify up to 5 questions with scores <60 for improvement
+
+        FEEDBACK TONE
+        - Use encouraging, personal language ("You demonstrated...", "Consider strengthening...")
+        - Adjust expectations for {seniority} level
+        - Focus on specific, actionable improvements
+        - Highlight strengths while addressing growth areas
+
+        OUTPUT FORMAT
+        Return ONLY valid JSON (no markdown, no comments):
+
+        {{
+        "overall_score": 0,
+        "competency_breakdown": [
+            {{
+            "name": "competency_name",
+            "score": 0
+            }}
+        ],
+        "points_earned": 0,
+        "focus_questions": ["question text for improvement"],
+        "summary_feedback": "Personal, encouraging summary with specific recommendations"
+        }}
+
+        Analyze internally and return only the JSON."""
+
+
+def build_summary_feedback_prompt(questions: List[Question], seniority: str, specialization: str,
+                                  interview_type: str, overall_score: int,
+                                  competency_breakdown: List[Dict[str, Any]], focus_questions: List[str]) -> str:
+    criteria = SCORING_CRITERIA.get(interview_type, SCORING_CRITERIA["behavioral"])
+    questions_json = json.dumps([{
+        "question": q.question,
+        "competency": q.competency,
+        "score": q.score,
+        "feedback": q.feedback,
+    } for q in questions], ensure_ascii=False)
+    return f"""You are an experienced interview mentor writing the closing summary for a {criteria['description']}.
+
+CONTEXT
+Candidate level: {seniority}
+Candidate specialization: {specialization}
+Interview type: {interview_type}
+Scoring focus: {criteria['scoring_focus']}
+
+RESULTS (already computed, do not change them)
+Overall score: {overall_score}
+Competency scores: {json.dumps(competency_breakdown, ensure_ascii=False)}
+Questions to improve: {json.dumps(focus_questions, ensure_ascii=False)}
+
+PER-QUESTION RESULTS
+{questions_json}
+
+TASK
+Write a personal, encouraging summary (≤120 words) for a {seniority} candidate: highlight strengths,
+name the main growth areas and give 2-3 specific recommendations.
+
+Return ONLY valid JSON:
+{{"summary_feedback": "..."}}"""
+
+
+def parse_score(value: Any) -> Optional[int]:
+    """Nota por respuesta devuelta por el modelo, acotada a 0-100; None si no es un número"""
+    try:
+        return max(0, min(100, int(round(float(value)))))
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_json_response(text: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Quita las cercas ```json que a veces añade el modelo y parsea el JSON"""
+    if not text:
+        return None
+    json_text = text.strip()
+    if json_text.startswith('```json'):
+        json_text = json_text[7:-3]
+    elif json_text.startswith('```'):
+        json_text = json_text[3:-3]
+    try:
+        return json.loads(json_text)
+    except json.JSONDecodeError as e:
+        logger.error("Error parsing JSON response: %s", e)
+        logger.debug("Response text: %s", text, extra={"verbose": True})
+        return None
+
+
+def to_feedback(feedback_complete: Dict[str, Any]) -> FeedBack:
+    return FeedBack(
+        overall_score=feedback_complete.get("overall_score", 0),
+        competency_breakdown=[
+            {
+                "name": item["name"],
+                "score": item["score"]
+            } for item in feedback_complete.get("competency_breakdown", [])
+        ],
+        points_earned=feedback_complete.get("points_earned", 0),
+        focus_questions=feedback_complete.get("focus_questions", []),
+        summary_feedback=feedback_complete.get("summary_feedback", "")
+    )
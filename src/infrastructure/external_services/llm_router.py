@@ -0,0 +1,112 @@
+import logging
+from typing import Any, Dict, List, Optional
+
+from domain.entities.interview_ready import FeedBack, Question
+from infrastructure.config.app_config import config
+from infrastructure.external_services.interview_llm import InterviewLLM, LLMCompletion
+
+logger = logging.getLogger(__name__)
+
+
+class RoutedInterviewLLM(InterviewLLM):
+    """Envía cada operación al backend configurado para ella (o al backend por defecto)."""
+    name = "router"
+
+    def __init__(self, backends: Dict[str, InterviewLLM], default: str, operations: Dict[str, str] = None):
+        if default not in backends:
+            raise ValueError(f"Default LLM backend '{default}' is not configured")
+        self.backends = backends
+        self.default = default
+        self.operations = operations or {}
+
+    def backend_for(self, operation: str) -> InterviewLLM:
+        return self.backends[self.operations.get(operation, self.default)]
+
+    async def connect(self):
+        for backend in self.backends.values():
+            await backend.connect()
+
+    async def health_check(self) -> bool:
+        return all([await backend.health_check() for backend in self.backends.values()])
+
+    async def complete(self, prompt: str, operation: str, max_output_tokens: Optional[int] = None) -> LLMCompletion:
+        return await self.backend_for(operation).complete(prompt, operation, max_output_tokens)
+
+    async def generate_questions(self, seniority: str, specialization: str, num_questions: int = 5,
+                                 interview_type: str = "behavioral",
+                                 user_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        return await self.backend_for("generate_questions").generate_questions(
+            seniority=seniority, specialization=specialization,
+            num_questions=num_questions, interview_type=interview_type, user_id=user_id
+        )
+
+    async def generate_replacement_questions(self, seniority: str, specialization: str,
+                                             slots: List[Dict[str, Any]], avoid: List[str],
+                                             interview_type: str = "behavioral",
+                                             user_id: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+        return await self.backend_for("generate_replacement_questions").generate_replacement_questions(
+            seniority=seniority, specialization=specialization,
+            slots=slots, avoid=avoid, interview_type=interview_type, user_id=user_id
+        )
+
+    async def generate_feedback(self, question: str, user_response: str, seniority: str,
+                                specialization: str, interview_type: str = "behavioral",
+                                user_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        return await self.backend_for("generate_feedback").generate_feedback(
+            question=question, user_response=user_response, seniority=seniority,
+            specialization=specialization, interview_type=interview_type, user_id=user_id
+        )
+
+    async def generate_complete_feedback(self, questions: List[Question], seniority: str, specialization: str,
+                                         interview_type: str = "behavioral",
+                                         user_id: Optional[str] = None) -> Optional[FeedBack]:
+        return await self.backend_for("generate_complete_feedback").generate_complete_feedback(
+            questions=questions, seniority=seniority,
+            specialization=specialization, interview_type=interview_type, user_id=user_id
+        )
+
+    async def generate_summary_feedback(self, questions: List[Question], seniority: str, specialization: str,
+                                        interview_type: str, overall_score: int,
+                                        competency_breakdown: List[Dict[str, Any]], focus_questions: List[str],
+                                        user_id: Optional[str] = None) -> Optional[str]:
+        return await self.backend_for("generate_summary_feedback").generate_summary_feedback(
+            questions=questions, seniority=seniority, specialization=specialization,
+            interview_type=interview_type, overall_score=overall_score,
+            competency_breakdown=competency_breakdown, focus_questions=focus_questions, user_id=user_id
+        )
+
+
+def create_backend(name: str) -> InterviewLLM:
+    if name == "gemini":
+        from infrastructure.external_services.gemini_service import GeminiService
+        return GeminiService()
+    if name == "local":
+        from infrastructure.external_services.local_llm_service import LocalLLMService
+        return LocalLLMService()
+    if name == "fixture":
+        from infrastructure.external_services.fixture_llm_service import FixtureLLMService
+        return FixtureLLMService()
+    raise ValueError(f"Unknown LLM backend: {name}")
+
+
+_interview_llm: Optional[InterviewLLM] = None
+
+
+def get_interview_llm() -> InterviewLLM:
+    """Instancia compartida por proceso: evita crear cliente y health check en cada petición"""
+    global _interview_llm
+    if _interview_llm is None:
+        names = {config.llm_backend, *config.llm_operation_backends.values()}
+        backends = {name: create_backend(name) for name in names}
+        if config.llm_usage_tracking_enabled:
+            from domain.repositories.llm_usage_repository import LLMUsageRepository
+            from infrastructure.external_services.llm_usage_tracker import LLMUsageTracker
+            tracker = LLMUsageTracker(LLMUsageRepository())
+            for backend in backends.values():
+                backend.usage_tracker = tracker
+        if len(backends) == 1:
+            _interview_llm = backends[config.llm_backend]
+        else:
+            _interview_llm = RoutedInterviewLLM(backends, config.llm_backend, config.llm_operation_backends)
+        logger.info("LLM backends: default=%s, per operation=%s", config.llm_backend, config.llm_operation_backends)
+    return _interview_llm
@@ -0,0 +1,49 @@
+import logging
+from datetime import datetime, timezone
+from typing import Optional
+
+from domain.repositories.llm_usage_repository import LLMUsageRepository
+from infrastructure.config.app_config import config
+from infrastructure.external_services.interview_llm import LLMBudgetExceededError, LLMCompletion
+
+logger = logging.getLogger(__name__)
+
+
+class LLMUsageTracker:
+    """Contabiliza tokens por usuario/operación y aplica el presupuesto diario antes de cada llamada."""
+
+    def __init__(self, llm_usage_repository: LLMUsageRepository, daily_token_budget: int = None):
+        self.llm_usage_repository = llm_usage_repository
+        self.daily_token_budget = config.llm_daily_token_budget_per_user if daily_token_budget is None else daily_token_budget
+
+    @staticmethod
+    def today() -> str:
+        return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+    async def check_budget(self, user_id: Optional[str]) -> None:
+        # Sin usuario (jobs internos) o sin presupuesto configurado no hay límite
+        if not user_id or self.daily_token_budget <= 0:
+            return
+        usage = await self.llm_usage_repository.find_day(user_id, self.today())
+        if usage and usage.prompt_tokens + usage.output_tokens >= self.daily_token_budget:
+            raise LLMBudgetExceededError(f"Daily LLM token budget exceeded for user {user_id}")
+
+    async def record(self, user_id: Optional[str], operation: str, backend: str, completion: LLMCompletion) -> None:
+        logger.info(
+            "llm usage backend=%s operation=%s user=%s prompt=%d output=%d cached=%d",
+            backend, operation, user_id, completion.prompt_tokens, completion.output_tokens, completion.cached_tokens
+        )
+        if not user_id:
+            return
+        try:
+            await self.llm_usage_repository.increment(
+                user_id=user_id,
+                day=self.today(),
+                operation=operation,
+                prompt_tokens=completion.prompt_tokens,
+                output_tokens=completion.output_tokens,
+                cached_tokens=completion.cached_tokens
+            )
+        except Exception as e:
+            # La contabilidad nunca debe tumbar la petición del usuario
+            logger.error("Error recording LLM usage: %s", e)
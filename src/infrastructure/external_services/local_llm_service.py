@@ -0,0 +1,55 @@
+import logging
+from typing import Optional
+
+import httpx
+
+from infrastructure.config.app_config import config
+from infrastructure.external_services.interview_llm import InterviewLLM, LLMCompletion
+
+logger = logging.getLogger(__name__)
+
+
+class LocalLLMService(InterviewLLM):
+    """Backend para servidores con API compatible con OpenAI (llama.cpp server, vLLM, Ollama...)."""
+    name = "local"
+
+    def __init__(self, base_url: str = None, model_name: str = None, api_key: str = None, timeout: float = None):
+        self.base_url = (base_url or config.local_llm_base_url).rstrip("/")
+        self.model_name = model_name or config.local_llm_model
+        headers = {}
+        if api_key or config.local_llm_api_key:
+            headers["Authorization"] = f"Bearer {api_key or config.local_llm_api_key}"
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=headers,
+            timeout=timeout or config.local_llm_timeout_seconds,
+        )
+
+    async def health_check(self) -> bool:
+        try:
+            response = await self.client.get("/models")
+            return response.status_code == 200
+        except Exception as e:
+            logger.info("Local LLM health check failed: %s", e)
+            return False
+
+    async def complete(self, prompt: str, operation: str, max_output_tokens: Optional[int] = None) -> LLMCompletion:
+        payload = {
+            "model": self.model_name,
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": 0.2,
+            "response_format": {"type": "json_object"},
+        }
+        if max_output_tokens:
+            payload["max_tokens"] = max_output_tokens
+        response = await self.client.post("/chat/completions", json=payload)
+        response.raise_for_status()
+        body = response.json()
+        choices = body.get("choices") or []
+        usage = body.get("usage") or {}
+        return LLMCompletion(
+            text=choices[0].get("message", {}).get("content") if choices else None,
+            prompt_tokens=usage.get("prompt_tokens", 0),
+            output_tokens=usage.get("completion_tokens", 0),
+            cached_tokens=(usage.get("prompt_tokens_details") or {}).get("cached_tokens", 0),
+        )
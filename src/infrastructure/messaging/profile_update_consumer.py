@@ -0,0 +1,102 @@
+import asyncio
+import json
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import aio_pika
+from aio_pika import DeliveryMode, Message
+from aio_pika.abc import AbstractChannel, AbstractConnection, AbstractIncomingMessage, AbstractQueue
+
+from infrastructure.config.app_config import config
+
+logger = logging.getLogger(__name__)
+
+RETRY_HEADER = "x-retries"
+
+
+class PoisonMessageError(Exception):
+    """Mensaje que nunca se podrá procesar (JSON inválido, campos que faltan); va directo a la DLQ."""
+
+
+class ProfileUpdateConsumer:
+    """Consumidor de la cola profile_updates.
+
+    La concurrencia la limita el prefetch: RabbitMQ no entrega más de `prefetch` mensajes
+    sin ack a este worker. Un fallo se reintenta republicando el mensaje hasta
+    `max_retries` veces; después (o si es un PoisonMessageError) se rechaza sin requeue y
+    el broker lo mueve a la dead-letter queue.
+    """
+
+    def __init__(self, handler: Callable[[Dict[str, Any]], Awaitable[None]], queue_name: str,
+                 dead_letter_queue_name: str, prefetch: int = 4, max_retries: int = 3,
+                 rabbitmq_url: Optional[str] = None):
+        self.handler = handler
+        self.queue_name = queue_name
+        self.dead_letter_queue_name = dead_letter_queue_name
+        self.prefetch = prefetch
+        self.max_retries = max_retries
+        self.rabbitmq_url = rabbitmq_url or config.rabbitmq_url
+        self.connection: Optional[AbstractConnection] = None
+        self.channel: Optional[AbstractChannel] = None
+        self.queue: Optional[AbstractQueue] = None
+        self._consumer_tag: Optional[str] = None
+
+    async def start(self) -> None:
+        self.connection = await aio_pika.connect_robust(self.rabbitmq_url, heartbeat=600)
+        self.channel = await self.connection.channel()
+        await self.channel.set_qos(prefetch_count=self.prefetch)
+        await self.channel.declare_queue(self.dead_letter_queue_name, durable=True)
+        # Si la cola ya existía sin estos argumentos RabbitMQ rechaza la declaración (PRECONDITION_FAILED)
+        self.queue = await self.channel.declare_queue(
+            self.queue_name,
+            durable=True,
+            arguments={
+                "x-dead-letter-exchange": "",
+                "x-dead-letter-routing-key": self.dead_letter_queue_name
+            }
+        )
+        self._consumer_tag = await self.queue.consume(self._on_message)
+        logger.info("Consuming '%s' (prefetch %d, DLQ '%s')", self.queue_name, self.prefetch,
+                    self.dead_letter_queue_name)
+
+    async def stop(self) -> None:
+        # Los mensajes sin ack vuelven a la cola al cerrar el canal
+        if self.queue is not None and self._consumer_tag is not None:
+            await self.queue.cancel(self._consumer_tag)
+            self._consumer_tag = None
+        if self.connection is not None and not self.connection.is_closed:
+            await self.connection.close()
+        logger.info("Consumer of '%s' stopped", self.queue_name)
+
+    async def _on_message(self, message: AbstractIncomingMessage) -> None:
+        retries = int((message.headers or {}).get(RETRY_HEADER, 0))
+        try:
+            try:
+                payload = json.loads(message.body)
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                raise PoisonMessageError(f"Invalid JSON: {e}") from e
+            await self.handler(payload)
+            await message.ack()
+        except PoisonMessageError as pe:
+            logger.warning("Dead-lettering poison message from '%s': %s", self.queue_name, pe)
+            await message.reject(requeue=False)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if retries >= self.max_retries:
+                logger.error("Message from '%s' failed %d times, dead-lettering: %s", self.queue_name, retries + 1, e)
+                await message.reject(requeue=False)
+                return
+            logger.warning("Message from '%s' failed (retry %d/%d): %s", self.queue_name, retries + 1,
+                           self.max_retries, e)
+            # Se republica al final de la cola con el contador para no bloquear los demás mensajes
+            await self.channel.default_exchange.publish(
+                Message(
+                    message.body,
+                    delivery_mode=DeliveryMode.PERSISTENT,
+                    content_type=message.content_type,
+                    headers={**(message.headers or {}), RETRY_HEADER: retries + 1}
+                ),
+                routing_key=self.queue_name
+            )
+            await message.ack()
@@ -8,6 +8,7 @@ import aio_pika
 from aio_pika import Message, DeliveryMode
 from aio_pika.abc import AbstractConnection, AbstractChannel
 from infrastructure.config.app_config import config
+from infrastructure.observability.tracing import inject_trace_context, traced
 logger = logging.getLogger(__name__)
 
 class RabbitMQProducer:
@@ -34,11 +35,11 @@ class RabbitMQProducer:
                 logger.info("RabbitMQ Producer conectado exitosamente")
                 return
             except Exception as e:
-                logger.error(f"Intento {attempt + 1} fallido: {e}")
+                logger.error("Intento %s fallido: %s", attempt + 1, e)
                 if attempt < self.retry_count - 1:
                     await asyncio.sleep(self.retry_delay)
                 else:
-                    logger.error(f" Error conectando a RabbitMQ después de {self.retry_count} intentos")
+                    logger.error(" Error conectando a RabbitMQ después de %s intentos", self.retry_count)
                     raise
 
     async def disconnect(self):
@@ -49,7 +50,7 @@ class RabbitMQProducer:
             self.is_connected = False
             logger.info(" RabbitMQ Producer desconectado")
         except Exception as e:
-            logger.error(f"Error desconectando RabbitMQ: {e}")
+            logger.error("Error desconectando RabbitMQ: %s", e)
 
     async def ensure_connection(self):
         
@@ -60,9 +61,10 @@ class RabbitMQProducer:
         
         await self.ensure_connection()
         queue = await self.channel.declare_queue(queue_name, durable=durable)
-        logger.info(f"Cola '{queue_name}' declarada")
+        logger.debug("Cola '%s' declarada", queue_name)
         return queue
 
+    @traced("RabbitMQProducer.publish_message")
     async def publish_message(
         self,
         message: Dict[str, Any],
@@ -106,19 +108,18 @@ class RabbitMQProducer:
                     delivery_mode=DeliveryMode.PERSISTENT,
                     content_type="application/json",
                     priority=priority,
-                    headers={
+                    # traceparent permite al consumidor continuar la misma traza
+                    headers=inject_trace_context({
                         "source": "interview_ready_service",
                         "message_type": message.get("event_type", "unknown")
-                    }
+                    })
                 ),
                 routing_key=routing_key or queue_name
             )
-            print(f"Mensaje publicado a cola '{queue_name}': {message.get('event_type', 'unknown')}")
-
-            logger.info(f"Mensaje publicado a cola '{queue_name}': {message.get('event_type', 'unknown')}")
+            logger.info("Mensaje publicado a cola '%s': %s", queue_name, message.get('event_type', 'unknown'))
 
         except Exception as e:
-            logger.error(f"Error publicando mensaje a {queue_name}: {e}")
+            logger.error("Error publicando mensaje a %s: %s", queue_name, e)
             raise
 
     async def health_check(self) -> bool:
@@ -0,0 +1,106 @@
+"""Logging estructurado (JSON) que no bloquea el event loop.
+
+Los handlers de la app solo encolan el LogRecord; el formateo a JSON y la
+escritura a stdout ocurren en el hilo del QueueListener. Los mensajes usan
+formato perezoso (logger.info("... %s", valor)), así que un nivel desactivado
+no cuesta ni el formateo.
+"""
+import contextvars
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import sys
+from datetime import datetime, timezone
+from typing import Optional
+
+from infrastructure.config.app_config import config
+from infrastructure.observability.tracing import current_trace_id
+
+request_id_var: contextvars.ContextVar[str] = contextvars.ContextVar("request_id", default="-")
+
+# Atributos estándar de LogRecord; el resto se considera "extra" y va al JSON
+_RESERVED = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime", "request_id", "verbose"}
+
+
+class RequestIdFilter(logging.Filter):
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get()
+        trace_id = current_trace_id()
+        if trace_id:
+            record.trace_id = trace_id
+        return True
+
+
+class VerboseSamplingFilter(logging.Filter):
+    """Deja pasar solo una fracción de los eventos marcados con extra={"verbose": True}."""
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if getattr(record, "verbose", False):
+            return self.rate >= 1 or random.random() < self.rate
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+            "request_id": getattr(record, "request_id", "-"),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED and not key.startswith("_"):
+                payload[key] = value
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler que no formatea en el hilo que loguea.
+
+    El QueueHandler estándar llama a format() en prepare() para poder serializar
+    el record; con una cola en memoria no hace falta y el coste pasa al listener.
+    """
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def setup_logging() -> None:
+    """Configura el root logger una sola vez por proceso."""
+    global _listener
+    if _listener is not None:
+        return
+    log_queue: queue.Queue = queue.Queue(-1)
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(JsonFormatter())
+
+    queue_handler = DeferredQueueHandler(log_queue)
+    # Los filtros corren en el hilo del request: ahí está el contextvar del request id
+    queue_handler.addFilter(RequestIdFilter())
+    queue_handler.addFilter(VerboseSamplingFilter(config.log_verbose_sample_rate))
+
+    root = logging.getLogger()
+    root.handlers = [queue_handler]
+    root.setLevel(config.log_level.upper())
+
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+
+
+def shutdown_logging() -> None:
+    """Vacía la cola y detiene el listener (llamar al apagar la app)."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -0,0 +1,29 @@
+"""Contadores en memoria del proceso, expuestos en GET /metrics.
+
+Cada worker lleva los suyos; para agregados entre workers se suman los snapshots.
+"""
+from collections import Counter
+from typing import Dict, List
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._counters: Counter = Counter()
+
+    def increment(self, name: str, value: int = 1, **labels: str) -> None:
+        self._counters[(name, tuple(sorted(labels.items())))] += value
+
+    def value(self, name: str, **labels: str) -> int:
+        return self._counters[(name, tuple(sorted(labels.items())))]
+
+    def snapshot(self) -> List[Dict]:
+        return [
+            {"name": name, "labels": dict(labels), "value": value}
+            for (name, labels), value in sorted(self._counters.items())
+        ]
+
+    def reset(self) -> None:
+        self._counters.clear()
+
+
+metrics = MetricsRegistry()
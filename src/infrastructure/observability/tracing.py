@@ -0,0 +1,111 @@
+"""Trazas OpenTelemetry de los límites lentos del servicio.
+
+Se generan spans para:
+- HTTP, con FastAPIInstrumentor.
+- Comandos de Mongo, con PymongoInstrumentor.
+- Los métodos del repositorio, la llamada al LLM y la publicación en RabbitMQ,
+  con `traced`/`tracer`.
+
+Mientras no se llame a setup_tracing, la API de OpenTelemetry usa un proveedor
+no-op y los spans no cuestan casi nada.
+"""
+import functools
+import logging
+import os
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+from opentelemetry import propagate, trace
+
+from infrastructure.config.app_config import config
+
+logger = logging.getLogger(__name__)
+
+# Proxy: empieza a exportar en cuanto setup_tracing registra el proveedor real
+tracer = trace.get_tracer("interview_ready_service")
+
+T = TypeVar("T")
+
+_provider = None
+
+
+def traced(name: str, **attributes: Any) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Envuelve una corrutina en un span con el nombre y atributos dados."""
+    def decorator(fn: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs) -> T:
+            with tracer.start_as_current_span(name, attributes=attributes):
+                return await fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def inject_trace_context(headers: Dict[str, Any]) -> Dict[str, Any]:
+    """Añade traceparent/tracestate del span actual a las cabeceras de un mensaje."""
+    propagate.inject(headers)
+    return headers
+
+
+def _create_exporter():
+    exporter = config.tracing_exporter
+    if exporter == "console":
+        from opentelemetry.sdk.trace.export import ConsoleSpanExporter
+        return ConsoleSpanExporter()
+    if exporter == "file":
+        from opentelemetry.sdk.trace.export import ConsoleSpanExporter
+        # Un span JSON por línea, para poder procesarlo con jq
+        return ConsoleSpanExporter(
+            out=open(config.tracing_file_path, "a", encoding="utf-8"),
+            formatter=lambda span: span.to_json(indent=None) + os.linesep
+        )
+    if exporter == "otlp":
+        try:
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        except ImportError as e:
+            raise ValueError("OTLP tracing requires the 'opentelemetry-exporter-otlp-proto-http' package") from e
+        return OTLPSpanExporter(endpoint=config.tracing_otlp_endpoint or None)
+    raise ValueError(f"Unknown tracing exporter: {exporter}")
+
+
+def setup_tracing(app=None) -> None:
+    """Registra el proveedor de trazas e instrumenta FastAPI y pymongo.
+
+    No hace nada si TRACING_EXPORTER es "none".
+    """
+    global _provider
+    if _provider is not None or config.tracing_exporter == "none":
+        return
+
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+    # ParentBased respeta la decisión de muestreo de quien nos llama
+    _provider = TracerProvider(
+        resource=Resource.create({"service.name": config.tracing_service_name}),
+        sampler=ParentBased(TraceIdRatioBased(config.tracing_sample_ratio))
+    )
+    _provider.add_span_processor(BatchSpanProcessor(_create_exporter()))
+    trace.set_tracer_provider(_provider)
+
+    from opentelemetry.instrumentation.pymongo import PymongoInstrumentor
+    PymongoInstrumentor().instrument()
+    if app is not None:
+        from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+        FastAPIInstrumentor.instrument_app(app)
+
+    logger.info("Tracing enabled with %s exporter (sample ratio %s)",
+                config.tracing_exporter, config.tracing_sample_ratio)
+
+
+def shutdown_tracing() -> None:
+    """Exporta los spans pendientes (llamar al apagar la app)."""
+    global _provider
+    if _provider is not None:
+        _provider.shutdown()
+        _provider = None
+
+
+def current_trace_id() -> Optional[str]:
+    context = trace.get_current_span().get_span_context()
+    return format(context.trace_id, "032x") if context.is_valid else None
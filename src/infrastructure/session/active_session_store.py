@@ -0,0 +1,271 @@
+"""Sesiones activas en memoria con escritura diferida (write-behind) a Mongo.
+
+Durante una entrevista en curso solo su dueño la modifica, así que cada paso de
+respuesta puede leer y escribir la copia en memoria del worker. Un flusher en
+segundo plano la persiste cada `flush_interval` (ventana de pérdida acotada) o, en
+modo journal, cada paso se anexa antes a un journal local que se reaplica al
+arrancar. Completar la entrevista fuerza la escritura.
+
+Requiere enrutado con afinidad por entrevista (p.ej. hash del id del path en el
+balanceador). Como salvaguarda, cada sesión toma un lease en Mongo: otro worker no
+la carga mientras el lease esté vigente y un flush sin lease no escribe nada.
+"""
+import asyncio
+import fcntl
+import glob
+import logging
+import os
+import socket
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterator, Optional, Set, Tuple
+
+from domain.entities.interview_ready import InterviewReady
+from domain.repositories.interview_ready_repository import InterviewReadyRepository
+from infrastructure.config.app_config import config
+
+logger = logging.getLogger(__name__)
+
+
+class SessionOwnedElsewhereError(Exception):
+    """La entrevista está activa en otro worker; el cliente debe reintentar (o el balanceador re-enrutar)."""
+
+
+class SessionJournal:
+    """Journal local de snapshots (una línea JSON por paso), con fsync antes de responder.
+
+    Cada proceso escribe en su propio fichero (`<path>.<owner>`, con un id único por arranque)
+    y lo mantiene bloqueado (flock) mientras vive. Al arrancar, cualquier journal que se pueda
+    bloquear es de un proceso muerto (aunque el nuevo proceso reutilice su pid) y se reaplica.
+    """
+
+    def __init__(self, path: str):
+        self.base_path = path
+        self.path: Optional[str] = None
+        self._file = None
+
+    def open(self, owner: str) -> None:
+        self.path = f"{self.base_path}.{owner}"
+        self._file = open(self.path, "a", encoding="utf-8")
+        fcntl.flock(self._file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+    def append(self, interview: InterviewReady) -> None:
+        self._file.write(interview.model_dump_json() + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    @staticmethod
+    def read_latest(path: str) -> Dict[str, InterviewReady]:
+        latest: Dict[str, InterviewReady] = {}
+        with open(path, encoding="utf-8") as journal:
+            for line in journal:
+                try:
+                    interview = InterviewReady.model_validate_json(line)
+                except ValueError:
+                    # Última línea a medio escribir si el proceso murió durante el append
+                    continue
+                latest[str(interview.id)] = interview
+        return latest
+
+    def truncate(self) -> None:
+        self._file.truncate(0)
+
+    def close(self, remove: bool = True) -> None:
+        """Suelta el bloqueo; sin `remove` el fichero queda para que lo reaplique el siguiente arranque"""
+        if self._file is not None:
+            self._file.close()
+            if remove:
+                os.remove(self.path)
+            self._file = None
+
+    def orphans(self) -> Iterator[Tuple[str, str]]:
+        """(owner, path) de los journals de procesos muertos, bloqueados mientras se reaplican; se borran al seguir"""
+        prefix = f"{self.base_path}."
+        for path in glob.glob(f"{glob.escape(self.base_path)}.*"):
+            if path == self.path:
+                continue
+            try:
+                orphan = open(path, "a", encoding="utf-8")
+            except FileNotFoundError:
+                continue
+            with orphan:
+                try:
+                    fcntl.flock(orphan.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    # Lo tiene un proceso vivo
+                    continue
+                try:
+                    if os.stat(path).st_ino != os.fstat(orphan.fileno()).st_ino:
+                        continue
+                except FileNotFoundError:
+                    # Otro proceso lo reaplicó y lo borró mientras tanto
+                    continue
+                yield path[len(prefix):], path
+                os.remove(path)
+
+
+class ActiveSessionStore:
+    def __init__(self, repository: InterviewReadyRepository, mode: str = "write_behind",
+                 flush_interval: float = 1.0, idle_seconds: int = 600, lease_seconds: int = 900,
+                 max_sessions: int = 5000, journal: Optional[SessionJournal] = None):
+        if mode not in ("write_behind", "journal"):
+            raise ValueError(f"Unknown active session mode: {mode}")
+        self.repository = repository
+        self.mode = mode
+        self.flush_interval = flush_interval
+        self.idle_seconds = idle_seconds
+        self.lease_seconds = lease_seconds
+        self.max_sessions = max_sessions
+        self.journal = journal
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        if self.journal is not None:
+            self.journal.open(self.owner)
+        self._sessions: "OrderedDict[str, InterviewReady]" = OrderedDict()
+        self._last_access: Dict[str, float] = {}
+        self._dirty: Set[str] = set()
+        self._flusher: Optional[asyncio.Task] = None
+
+    async def get(self, interview_id: str, user_id: Optional[str] = None) -> Optional[InterviewReady]:
+        """Copia de la sesión (cargándola y tomando el lease si no estaba en memoria)"""
+        interview = self._sessions.get(interview_id)
+        if interview is not None and user_id is not None and interview.userId != user_id:
+            return None
+        if interview is None:
+            interview = await self.repository.find_by_id(interview_id, user_id)
+            # Con lotes pendientes en segundo plano la entrevista sigue en Mongo (ver save_answer)
+            if interview is None or interview.status != "in_progress" or interview.questions_pending > 0:
+                return interview
+            if not await self.repository.claim_session(interview.id, self.owner, self.lease_seconds,
+                                                     interview.userId):
+                raise SessionOwnedElsewhereError(f"Interview {interview_id} is active on another worker")
+            interview.session_owner = self.owner
+            interview.session_lease_until = datetime.now(timezone.utc) + timedelta(seconds=self.lease_seconds)
+            await self._admit(interview_id, interview)
+        self._touch(interview_id)
+        # Copia: si el paso falla a medias, la sesión en memoria no queda modificada
+        return interview.model_copy(deep=True)
+
+    def is_active(self, interview_id: str) -> bool:
+        return interview_id in self._sessions
+
+    async def put(self, interview: InterviewReady) -> InterviewReady:
+        interview_id = str(interview.id)
+        interview.updated_at = datetime.utcnow()
+        interview.version += 1
+        if interview.status != "in_progress":
+            # Completar fuerza la escritura y libera la sesión; si no se pudo escribir, el paso falla
+            flushed = await self._flush(interview_id, interview, release=True)
+            self._drop(interview_id)
+            if not flushed:
+                raise SessionOwnedElsewhereError(f"Interview {interview_id} lost its session lease")
+            return interview
+        if self.journal is not None:
+            self.journal.append(interview)
+        self._sessions[interview_id] = interview
+        self._touch(interview_id)
+        self._dirty.add(interview_id)
+        self._ensure_flusher()
+        return interview
+
+    async def flush_all(self, release: bool = False) -> None:
+        for interview_id in list(self._dirty if not release else self._sessions):
+            interview = self._sessions.get(interview_id)
+            if interview is not None:
+                await self._flush(interview_id, interview, release=release)
+        if release:
+            self._sessions.clear()
+            self._last_access.clear()
+        if self.journal is not None and not self._dirty:
+            self.journal.truncate()
+
+    async def replay_journal(self) -> None:
+        """Al arrancar: persiste los pasos del journal que no llegaron a Mongo"""
+        if self.journal is None:
+            return
+        for owner, path in self.journal.orphans():
+            latest = self.journal.read_latest(path)
+            for interview in latest.values():
+                # El lease del proceso anterior ya no sirve; se reescribe sin dueño
+                if not await self.repository.flush_session(interview, owner, release=True):
+                    logger.warning("Journal entry for %s skipped: session taken by another worker", interview.id)
+            # Sesiones que el proceso muerto tenía cargadas sin pasos pendientes: liberar su lease
+            released = await self.repository.release_sessions(owner)
+            if latest or released:
+                logger.info("Replayed %d active sessions from journal %s, released %d leases",
+                            len(latest), path, released)
+
+    async def shutdown(self) -> None:
+        if self._flusher is not None:
+            self._flusher.cancel()
+            self._flusher = None
+        await self.flush_all(release=True)
+        if self.journal is not None:
+            # Si quedan pasos sin escribir, el journal se conserva y lo reaplica el siguiente arranque
+            self.journal.close(remove=not self._dirty)
+
+    async def _admit(self, interview_id: str, interview: InterviewReady) -> None:
+        while len(self._sessions) >= self.max_sessions:
+            oldest_id, oldest = next(iter(self._sessions.items()))
+            await self._flush(oldest_id, oldest, release=True)
+            self._drop(oldest_id)
+        self._sessions[interview_id] = interview
+
+    async def _flush(self, interview_id: str, interview: InterviewReady, release: bool = False) -> bool:
+        interview.session_lease_until = datetime.now(timezone.utc) + timedelta(seconds=self.lease_seconds)
+        # Antes del await: un put durante la escritura vuelve a marcar la sesión (copia más nueva)
+        self._dirty.discard(interview_id)
+        try:
+            flushed = await self.repository.flush_session(interview, self.owner, release=release)
+        except Exception:
+            if interview_id in self._sessions:
+                self._dirty.add(interview_id)
+            raise
+        if not flushed:
+            logger.error("Lost session lease for %s; in-memory changes discarded", interview_id)
+            self._drop(interview_id)
+        return flushed
+
+    def _drop(self, interview_id: str) -> None:
+        self._sessions.pop(interview_id, None)
+        self._last_access.pop(interview_id, None)
+        self._dirty.discard(interview_id)
+
+    def _touch(self, interview_id: str) -> None:
+        self._last_access[interview_id] = time.monotonic()
+        self._sessions.move_to_end(interview_id)
+
+    def _ensure_flusher(self) -> None:
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush_all()
+                now = time.monotonic()
+                for interview_id, last_access in list(self._last_access.items()):
+                    if now - last_access > self.idle_seconds and interview_id in self._sessions:
+                        await self._flush(interview_id, self._sessions[interview_id], release=True)
+                        self._drop(interview_id)
+            except Exception as e:
+                logger.error("Active session flush failed: %s", e)
+
+
+def create_active_session_store() -> Optional[ActiveSessionStore]:
+    if not config.active_session_store_enabled:
+        return None
+    return ActiveSessionStore(
+        repository=InterviewReadyRepository(),
+        mode=config.active_session_mode,
+        flush_interval=config.active_session_flush_interval_ms / 1000,
+        idle_seconds=config.active_session_idle_seconds,
+        lease_seconds=config.active_session_lease_seconds,
+        max_sessions=config.active_session_max_sessions,
+        journal=SessionJournal(config.active_session_journal_path) if config.active_session_mode == "journal" else None,
+    )
+
+
+active_session_store = create_active_session_store()
@@ -0,0 +1,28 @@
+from typing import Optional
+
+from domain.entities.interview_ready import InterviewReady
+from domain.repositories.interview_ready_repository import InterviewReadyRepository
+from infrastructure.observability.tracing import traced
+from infrastructure.session.active_session_store import ActiveSessionStore
+
+
+class ActiveSessionInterviewReadyRepository(InterviewReadyRepository):
+    """InterviewReadyRepository que sirve las entrevistas en curso desde el ActiveSessionStore.
+
+    Lo usa el paso de respuesta: lee y escribe la sesión en memoria y deja que el store
+    la persista en segundo plano (o al completarse).
+    """
+
+    def __init__(self, store: ActiveSessionStore):
+        super().__init__()
+        self.store = store
+
+    @traced("ActiveSessionInterviewReadyRepository.find_by_id")
+    async def find_by_id(self, id: str, user_id: Optional[str] = None) -> Optional[InterviewReady]:
+        return await self.store.get(id, user_id)
+
+    @traced("ActiveSessionInterviewReadyRepository.update")
+    async def update(self, entity):
+        if self.store.is_active(str(entity.id)):
+            return await self.store.put(entity)
+        return await super().update(entity)
@@ -0,0 +1,105 @@
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if vectors.ndim == 1:
+        vectors = vectors.reshape(1, -1)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+class VectorIndex:
+    """Índice en memoria de vectores normalizados con búsqueda por similitud coseno (fuerza bruta).
+
+    Pensado para cientos o pocos miles de vectores: una multiplicación de matrices
+    es más rápida que cualquier estructura aproximada a ese tamaño.
+    """
+    def __init__(self, dimension: int, vectors: Optional[np.ndarray] = None):
+        self.dimension = dimension
+        self.vectors = np.empty((0, dimension), dtype=np.float32)
+        if vectors is not None and len(vectors):
+            self.add(vectors)
+
+    def __len__(self) -> int:
+        return self.vectors.shape[0]
+
+    def add(self, vectors: np.ndarray) -> None:
+        self.vectors = np.vstack([self.vectors, normalize_rows(vectors)])
+
+    def max_similarity(self, queries: np.ndarray) -> np.ndarray:
+        """Para cada consulta, la mayor similitud coseno contra el índice (0 si está vacío)"""
+        queries = normalize_rows(queries)
+        if not len(self):
+            return np.zeros(queries.shape[0], dtype=np.float32)
+        return (queries @ self.vectors.T).max(axis=1)
+
+    def search(self, query: np.ndarray, k: int = 1) -> List[Tuple[int, float]]:
+        if not len(self):
+            return []
+        scores = self.vectors @ normalize_rows(query)[0]
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(int(i), float(scores[i])) for i in top]
+
+
+class LRUVectorIndex:
+    """Índice en memoria de capacidad fija con claves, grupos y expulsión LRU.
+
+    La búsqueda solo compara contra vectores del mismo grupo; cuando está lleno, añadir
+    reemplaza la entrada usada hace más tiempo (un acierto en search cuenta como uso).
+    """
+    def __init__(self, dimension: int, capacity: int):
+        self.dimension = dimension
+        self.capacity = capacity
+        self.vectors = np.zeros((capacity, dimension), dtype=np.float32)
+        self.groups = np.full(capacity, -1, dtype=np.int64)
+        self.last_used = np.zeros(capacity, dtype=np.int64)
+        self._keys: List[Optional[str]] = [None] * capacity
+        self._slots: Dict[str, int] = {}
+        self._tick = 0
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def add(self, key: str, vector: np.ndarray, group: int) -> Optional[str]:
+        """Añade (o reemplaza) `key`; devuelve la clave expulsada, si la hubo"""
+        evicted = None
+        slot = self._slots.get(key)
+        if slot is None:
+            # Los huecos libres tienen last_used 0, así que se ocupan antes de expulsar a nadie
+            slot = int(self.last_used.argmin())
+            evicted = self._keys[slot]
+            if evicted is not None:
+                del self._slots[evicted]
+        self.vectors[slot] = normalize_rows(vector)[0]
+        self.groups[slot] = group
+        self._keys[slot] = key
+        self._slots[key] = slot
+        self._use(slot)
+        return evicted
+
+    def remove(self, key: str) -> None:
+        slot = self._slots.pop(key, None)
+        if slot is not None:
+            self._keys[slot] = None
+            self.groups[slot] = -1
+            self.last_used[slot] = 0
+
+    def search(self, query: np.ndarray, group: int) -> Optional[Tuple[str, float]]:
+        """Vecino más cercano dentro del grupo: (clave, similitud coseno)"""
+        candidates = np.flatnonzero(self.groups == group)
+        if not len(candidates):
+            return None
+        scores = self.vectors[candidates] @ normalize_rows(query)[0]
+        best = int(scores.argmax())
+        slot = int(candidates[best])
+        self._use(slot)
+        return self._keys[slot], float(scores[best])
+
+    def _use(self, slot: int) -> None:
+        self._tick += 1
+        self.last_used[slot] = self._tick
@@ -2,15 +2,47 @@ from fastapi import FastAPI
 from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 from presentation.api.interview_ready_controller import interview_router
+from presentation.api.compression import setup_compression
+from presentation.api.request_id import RequestIdMiddleware
 
 from infrastructure.database.mongo_connection import mongo_connection
+from infrastructure.observability.logging_setup import setup_logging, shutdown_logging
+from infrastructure.observability.tracing import setup_tracing, shutdown_tracing
+from infrastructure.observability.metrics import metrics
+from infrastructure.session.active_session_store import active_session_store
+from infrastructure.database.interview_event_hub import interview_event_hub
+from infrastructure.config.app_config import config
+from application.services.interview_sweeper import InterviewSweeper
+from domain.repositories.interview_ready_repository import InterviewReadyRepository
+from domain.repositories.single_flight_lease_repository import SingleFlightLeaseRepository
 load_dotenv()
+setup_logging()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await mongo_connection.connect()
+    if active_session_store is not None:
+        await active_session_store.replay_journal()
+    sweeper = None
+    if config.interview_sweeper_enabled:
+        sweeper = InterviewSweeper(
+            interview_ready_repository=InterviewReadyRepository(),
+            lease_repository=SingleFlightLeaseRepository(),
+            idle_minutes=config.interview_idle_expiry_minutes,
+            archive_after_days=config.interview_archive_after_days,
+            batch_size=config.interview_archive_batch_size,
+            interval_seconds=config.interview_sweeper_interval_seconds
+        )
+        sweeper.start()
     yield
+    if sweeper is not None:
+        await sweeper.stop()
+    await interview_event_hub.stop()
+    if active_session_store is not None:
+        await active_session_store.shutdown()
     await mongo_connection.disconnect()
+    shutdown_tracing()
+    shutdown_logging()
 
 
 app = FastAPI(
@@ -20,6 +52,12 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+setup_tracing(app)
+setup_compression(app)
+
+
+app.add_middleware(RequestIdMiddleware)
+
 
 app.include_router(
     router=interview_router,
@@ -32,6 +70,13 @@ async def read_root():
     return {"message": "Welcome to the Interview Ready Service API"}
 
 
+@app.get("/metrics", tags=["Root"])
+async def read_metrics():
+    """Contadores de este worker (p.ej. prescreen_hits / prescreen_screened = hit rate del pre-clasificador,
+    feedback_cache_hits / feedback_cache_lookups = hit rate de la caché de feedback)"""
+    return {"counters": metrics.snapshot()}
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("main:app", host="0.0.0.0", port=8003, reload=True)
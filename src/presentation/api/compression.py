@@ -0,0 +1,27 @@
+import logging
+
+from fastapi import FastAPI
+from starlette.middleware.gzip import GZipMiddleware
+
+from infrastructure.config.app_config import config
+
+logger = logging.getLogger(__name__)
+
+
+def setup_compression(app: FastAPI) -> None:
+    """Comprime las respuestas mayores que compression_min_size según Accept-Encoding"""
+    if config.compression == "none":
+        return
+    if config.compression == "brotli":
+        try:
+            from brotli_asgi import BrotliMiddleware
+        except ImportError as e:
+            raise ValueError("Brotli compression requires the 'brotli-asgi' package") from e
+        app.add_middleware(BrotliMiddleware, quality=config.compression_level,
+                           minimum_size=config.compression_min_size, gzip_fallback=True)
+    elif config.compression == "gzip":
+        app.add_middleware(GZipMiddleware, minimum_size=config.compression_min_size,
+                           compresslevel=config.compression_level)
+    else:
+        raise ValueError(f"Unknown compression: {config.compression}")
+    logger.info("Response compression enabled: %s (min %d bytes)", config.compression, config.compression_min_size)
@@ -1,56 +1,209 @@
 
-from fastapi import APIRouter, HTTPException,status
+import asyncio
+import json
+import logging
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response, status
+from typing import Optional, Set
+from fastapi.responses import StreamingResponse
 
 from application.dto.create_interview_ready_dto import CreateInterviewReadyDTO
 from application.use_cases.create_interview_ready_use_case import CreateInterviewReadyUseCase
 
 from domain.repositories.interview_ready_repository import InterviewReadyRepository
 from application.dto.create_interview_response_dto import CreateInterviewResponseDTO
+from application.dto.answer_question_dto import AnswerQuestionDTO
 from application.dto.get_interview_ready_feedback_dto import GetInterviewReadyFeedBackDto
 from application.use_cases.generate_interview_feedback_use_case import GenerateInterviewFeedbackUseCase
 from application.use_cases.response_interview_ready_use_case import ResponseInterviewReadyUseCase
 from application.use_cases.get_interview_ready_use_case import GetInterviewReadyUseCase
 from application.use_cases.get_interview_ready_by_id_use_case import GetInterviewReadyByIdUseCase
-from infrastructure.external_services.gemini_service import GeminiService
+from application.use_cases.get_bulk_interview_ready_use_case import GetBulkInterviewReadyUseCase
+from application.dto.get_interview_ready_dto import GetBulkInterviewReadyDto, GetBulkInterviewReadyRequestDto
+from infrastructure.config.app_config import config
+from application.use_cases.get_user_interview_stats_use_case import GetUserInterviewStatsUseCase
+from application.dto.get_user_interview_stats_dto import GetUserInterviewStatsDto
+from domain.repositories.user_interview_stats_repository import UserInterviewStatsRepository
+from application.services.question_deduplicator import QuestionDeduplicator
+from application.services.question_batch_generator import QuestionBatchGenerator
+from application.services.adaptive_interview_service import AdaptiveInterviewService
+from application.services.lazy_question_service import LazyQuestionService
+from application.services.answer_prescreener import AnswerPrescreener
+from application.services.feedback_cache import FeedbackCache
+from infrastructure.external_services.embedding_service import create_embedding_service
+from infrastructure.external_services.llm_router import get_interview_llm
+from infrastructure.external_services.interview_llm import LLMBudgetExceededError
+from infrastructure.concurrency.single_flight import single_flight
+from application.services.idempotency_service import (
+    IdempotencyKeyInUseError,
+    IdempotencyKeyMismatchError,
+    IdempotencyService,
+)
+from domain.repositories.idempotency_record_repository import IdempotencyRecordRepository
+from domain.repositories.precomputed_question_set_repository import PrecomputedQuestionSetRepository
 from domain.entities.interview_ready import InterviewReady
+from domain.services.scoring_engine import ScoringEngine
 from infrastructure.messaging.rabbitmq_producer import rabbitmq_producer
-interview_router = APIRouter(prefix="/interview",tags=["questions"])
+from presentation.api.rate_limit import enforce_rate_limit
+from presentation.api.conditional import etag_matches, not_modified, set_etag
+from infrastructure.session.active_session_store import SessionOwnedElsewhereError, active_session_store
+from infrastructure.database.interview_event_hub import SubscriberLimitError, WATCHED_FIELDS, interview_event_hub
+from infrastructure.session.session_interview_repository import ActiveSessionInterviewReadyRepository
+
+logger = logging.getLogger(__name__)
+_background_tasks: Set[asyncio.Task] = set()
+# Estados finales que nunca tendrán feedback: el stream SSE se cierra al verlos
+_STREAM_END_STATUSES = {"expired"}
+# Compartida por todas las peticiones del worker
+_feedback_cache = FeedbackCache(
+    max_entries=config.feedback_cache_max_entries,
+    semantic=config.feedback_cache_semantic_enabled,
+    semantic_max_entries=config.feedback_cache_semantic_max_entries,
+    similarity_threshold=config.feedback_cache_similarity_threshold,
+    semantic_min_words=config.feedback_cache_semantic_min_words,
+    sample_rate=config.feedback_cache_sample_rate,
+    embedding_service=create_embedding_service(config.feedback_cache_embedding_backend)
+    if config.feedback_cache_semantic_enabled else None
+) if config.feedback_cache_enabled else None
+interview_router = APIRouter(prefix="/interview",tags=["questions"], dependencies=[Depends(enforce_rate_limit)])
+
+
+def _adaptive_interview_service(interview_llm) -> AdaptiveInterviewService:
+    return AdaptiveInterviewService(
+        batch_generator=QuestionBatchGenerator(interview_llm),
+        batch_size=config.adaptive_batch_size,
+        min_questions=config.adaptive_min_questions,
+        min_per_tier=config.adaptive_min_per_tier,
+        confidence_margin=config.adaptive_confidence_margin
+    )
+
+
+def _lazy_question_service(interview_ready_repository, interview_llm) -> Optional[LazyQuestionService]:
+    if not config.lazy_question_generation_enabled:
+        return None
+    return LazyQuestionService(
+        interview_ready_repository=interview_ready_repository,
+        batch_generator=QuestionBatchGenerator(interview_llm),
+        first_batch_size=config.lazy_first_batch_size,
+        batch_size=config.lazy_batch_size,
+        wait_seconds=config.lazy_wait_seconds,
+        poll_interval=config.lazy_poll_interval_ms / 1000
+    )
+
+
+def _generate_interview_feedback_use_case() -> GenerateInterviewFeedbackUseCase:
+    return GenerateInterviewFeedbackUseCase(
+        interview_ready_repository=InterviewReadyRepository(),
+        interview_llm=get_interview_llm(),
+        rabbitmq_producer=rabbitmq_producer,
+        user_interview_stats_repository=UserInterviewStatsRepository(),
+        single_flight=single_flight if config.single_flight_enabled else None,
+        scoring_engine=ScoringEngine() if config.deterministic_scoring_enabled else None
+    )
+
+
+async def _generate_feedback_in_background(interview_id: str, user_id: str) -> bool:
+    try:
+        await _generate_interview_feedback_use_case().execute(interview_id, user_id)
+        return True
+    except Exception as e:
+        # El stream se cierra con un evento error; el cliente puede reintentar con GET /questions/feedback/{id}
+        logger.error("Background feedback generation failed for %s: %s", interview_id, e)
+        return False
 
 
 @interview_router.post("/questions/generate", status_code=status.HTTP_201_CREATED,summary="Generate Interview Questions",
                        description="Generates a set of interview questions based on user seniority and specialization.",response_model=CreateInterviewResponseDTO)
-async def generate_questions(dto: CreateInterviewReadyDTO):
+async def generate_questions(dto: CreateInterviewReadyDTO,
+                             idempotency_key: Optional[str] = Header(default=None, alias="Idempotency-Key")):
     try:
-        gemini_service = GeminiService()
+        interview_llm = get_interview_llm()
         interview_ready_repository = InterviewReadyRepository()
+        question_deduplicator = None
+        if config.question_dedup_enabled:
+            question_deduplicator = QuestionDeduplicator(
+                interview_ready_repository=interview_ready_repository,
+                interview_llm=interview_llm,
+                embedding_service=create_embedding_service(),
+                threshold=config.question_dedup_threshold,
+                history_interviews=config.question_dedup_history_interviews,
+                max_rounds=config.question_dedup_max_rounds
+            )
         create_interview_ready_use_case = CreateInterviewReadyUseCase(
             interview_ready_repository=interview_ready_repository,
-            gemini_service=gemini_service
+            interview_llm=interview_llm,
+            question_deduplicator=question_deduplicator,
+            adaptive_interview_service=_adaptive_interview_service(interview_llm),
+            lazy_question_service=_lazy_question_service(interview_ready_repository, interview_llm),
+            lazy_min_count=config.lazy_question_min_count,
+            precomputed_question_set_repository=PrecomputedQuestionSetRepository() if config.precompute_enabled else None
+        )
+        idempotency_service = IdempotencyService(IdempotencyRecordRepository(), config.idempotency_ttl_seconds)
+        questions_data = await idempotency_service.run(
+            scope=f"generate:{dto.user_id}",
+            idempotency_key=idempotency_key,
+            request=dto.model_dump(mode="json"),
+            fn=lambda: create_interview_ready_use_case.execute(dto),
+            result_model=CreateInterviewResponseDTO
         )
-        questions_data = await create_interview_ready_use_case.execute(dto)
         if not questions_data:
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to generate questions")
 
         return questions_data
+    except IdempotencyKeyInUseError as ie:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(ie), headers={"Retry-After": "1"})
+    except IdempotencyKeyMismatchError as me:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(me))
+    except LLMBudgetExceededError as be:
+        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=str(be))
     except ValueError as ve:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(ve))
 @interview_router.post("/questions/response/{id}", status_code=status.HTTP_200_OK,
                        summary="Submit User Response to Interview Question",
-                       description="Submits the user's response to the current interview question and retrieves the next question.",
+                       description="Submits the user's response (JSON body) to the current interview question and retrieves the next question.",
                        response_model=CreateInterviewResponseDTO)
-async def answer_question(id:str,user_response:str,user_id:str):
+async def answer_question(id:str,dto:AnswerQuestionDTO,
+                          idempotency_key: Optional[str] = Header(default=None, alias="Idempotency-Key")):
     try:
-        gemini_service = GeminiService()
+        interview_llm = get_interview_llm()
         interview_ready_repository = InterviewReadyRepository()
+        if active_session_store is not None:
+            # Paso de respuesta contra la sesión en memoria; Mongo se actualiza en segundo plano
+            interview_ready_repository = ActiveSessionInterviewReadyRepository(active_session_store)
         response_interview_ready_use_case = ResponseInterviewReadyUseCase(
             interview_ready_repository=interview_ready_repository,
-            gemini_service=gemini_service
+            interview_llm=interview_llm,
+            single_flight=single_flight if config.single_flight_enabled else None,
+            adaptive_interview_service=_adaptive_interview_service(interview_llm),
+            lazy_question_service=_lazy_question_service(interview_ready_repository, interview_llm),
+            answer_prescreener=AnswerPrescreener(
+                modes=config.prescreen_modes,
+                default_mode=config.prescreen_default_mode,
+                min_words=config.prescreen_min_words,
+                offtopic_threshold=config.prescreen_offtopic_threshold,
+                offtopic_max_words=config.prescreen_offtopic_max_words
+            ) if config.prescreen_enabled else None,
+            feedback_cache=_feedback_cache
+        )
+        idempotency_service = IdempotencyService(IdempotencyRecordRepository(), config.idempotency_ttl_seconds)
+        response = await idempotency_service.run(
+            scope=f"response:{dto.user_id}:{id}",
+            idempotency_key=idempotency_key,
+            request=dto.model_dump(mode="json"),
+            fn=lambda: response_interview_ready_use_case.execute(id, dto.user_response, dto.user_id),
+            result_model=CreateInterviewResponseDTO
         )
-        response = await response_interview_ready_use_case.execute(id, user_response, user_id)
 
         if not response:
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to generate feedback")
         return response
+    except IdempotencyKeyInUseError as ie:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(ie), headers={"Retry-After": "1"})
+    except IdempotencyKeyMismatchError as me:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(me))
+    except SessionOwnedElsewhereError as se:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(se), headers={"Retry-After": "1"})
+    except LLMBudgetExceededError as be:
+        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=str(be))
     except ValueError as ve:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(ve))
     
@@ -59,15 +212,7 @@ async def answer_question(id:str,user_response:str,user_id:str):
                       description="Get a feedback after the interview finish")
 async def get_question(id:str,user_id:str):
     try:
-        
-        gemini_service = GeminiService()
-
-        interview_ready_repository = InterviewReadyRepository()
-        generate_interview_feedback_use_case = GenerateInterviewFeedbackUseCase(
-            interview_ready_repository=interview_ready_repository,
-            gemini_service=gemini_service,
-            rabbitmq_producer=rabbitmq_producer
-        )
+        generate_interview_feedback_use_case = _generate_interview_feedback_use_case()
         feedback = await generate_interview_feedback_use_case.execute(id,user_id)
         
         if not feedback:
@@ -75,15 +220,80 @@ async def get_question(id:str,user_id:str):
         
         
         return feedback
+    except LLMBudgetExceededError as be:
+        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=str(be))
     except ValueError as ve:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(ve))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
+@interview_router.get("/questions/events/{id}", summary="Subscribe to Interview Updates",
+                      description="Server-Sent Events stream with the interview status, points and feedback. "
+                                  "Sends the current state first and then every change; closes once feedback is available, "
+                                  "the interview expires or feedback generation fails.")
+async def subscribe_interview_events(id: str, user_id: str, request: Request):
+    try:
+        subscription = interview_event_hub.subscribe(id)
+    except SubscriberLimitError as se:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(se), headers={"Retry-After": "5"})
+
+    interview_ready_repository = InterviewReadyRepository()
+    try:
+        # Suscrito antes de leer: ningún cambio posterior a esta lectura se pierde
+        snapshot = await interview_ready_repository.find_status(id, user_id)
+        if not snapshot:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Interview not found")
+    except Exception:
+        subscription.close()
+        raise
+
+    generation = None
+    if config.interview_events_generate_feedback and snapshot.get("status") == "completed" \
+            and snapshot.get("feedback") is None:
+        generation = asyncio.create_task(_generate_feedback_in_background(id, user_id))
+        _background_tasks.add(generation)
+        generation.add_done_callback(_background_tasks.discard)
+
+    async def event_stream():
+        state = {field: snapshot.get(field) for field in WATCHED_FIELDS}
+        try:
+            yield _sse_event(id, state)
+            while state.get("feedback") is None and state.get("status") not in _STREAM_END_STATUSES:
+                event = await subscription.next(config.interview_events_keepalive_seconds)
+                if await request.is_disconnected():
+                    break
+                if event is None:
+                    if generation is not None and generation.done() and not generation.result():
+                        yield _sse_error(id, "Feedback generation failed; retry with GET /interview/questions/feedback/{id}")
+                        break
+                    yield ": keepalive\n\n"
+                    continue
+                if event.get("resync"):
+                    event = await interview_ready_repository.find_status(id, user_id) or {}
+                changes = {field: event[field] for field in WATCHED_FIELDS if field in event and event[field] != state.get(field)}
+                if changes:
+                    state.update(changes)
+                    yield _sse_event(id, state)
+        finally:
+            subscription.close()
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
+def _sse_event(interview_id: str, state: dict) -> str:
+    return "event: interview\ndata: " + json.dumps({"interview_id": interview_id, **state}, default=str) + "\n\n"
+
+
+def _sse_error(interview_id: str, detail: str) -> str:
+    return "event: error\ndata: " + json.dumps({"interview_id": interview_id, "detail": detail}) + "\n\n"
+
+
 @interview_router.get("/history/{user_id}", status_code=status.HTTP_200_OK,
                       summary="Get Interview History",
-                      description="Retrieves the interview history for a specific user.")
-async def get_interview_history(user_id: str):
+                      description="Retrieves the interview history for a specific user. "
+                                  "`include_archive=true` also returns interviews moved to the archive.")
+async def get_interview_history(user_id: str, request: Request, response: Response, include_archive: bool = False):
     try:
         
         interview_ready_repository = InterviewReadyRepository()
@@ -91,30 +301,86 @@ async def get_interview_history(user_id: str):
             interview_ready_repository=interview_ready_repository
         )
 
+        etag = await get_interview_ready_use_case.etag(user_id=user_id, include_archive=include_archive)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+
         history = await get_interview_ready_use_case.execute(
-            user_id=user_id
+            user_id=user_id,
+            include_archive=include_archive
         )
-        print(f"Retrieved interview history for user {user_id}: {history}")
+        logger.debug("Retrieved %d interviews of history for user %s", len(history.interviews), user_id)
 
         if not history:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No interview history found")
 
+        set_etag(response, etag)
         return history
     except ValueError as ve:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(ve))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
+@interview_router.get("/stats/{user_id}", status_code=status.HTTP_200_OK,
+                      summary="Get User Interview Statistics",
+                      description="Returns precomputed totals for a user: points, completed interviews by type and average scores.",
+                      response_model=GetUserInterviewStatsDto)
+async def get_user_interview_stats(user_id: str):
+    try:
+        user_interview_stats_repository = UserInterviewStatsRepository()
+        get_user_interview_stats_use_case = GetUserInterviewStatsUseCase(
+            user_interview_stats_repository=user_interview_stats_repository
+        )
+        return await get_user_interview_stats_use_case.execute(user_id=user_id)
+    except ValueError as ve:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(ve))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+@interview_router.post("/history/bulk", status_code=status.HTTP_200_OK,
+                       summary="Get Interview History for Many Users",
+                       description="Retrieves the interview history of several users in a single query, grouped by user. "
+                                   "Large batches (or `Accept: application/x-ndjson`) are streamed as NDJSON, one user per line.",
+                       response_model=GetBulkInterviewReadyDto)
+async def get_bulk_interview_history(dto: GetBulkInterviewReadyRequestDto, request: Request):
+    try:
+        interview_ready_repository = InterviewReadyRepository()
+        get_bulk_interview_ready_use_case = GetBulkInterviewReadyUseCase(
+            interview_ready_repository=interview_ready_repository
+        )
+
+        wants_ndjson = "application/x-ndjson" in request.headers.get("accept", "")
+        if wants_ndjson or len(dto.user_ids) > config.bulk_history_stream_threshold:
+            # Validar antes de empezar a enviar el cuerpo
+            get_bulk_interview_ready_use_case.resolve_limit(dto)
+
+            async def ndjson_lines():
+                async for user_history in get_bulk_interview_ready_use_case.stream(dto):
+                    yield user_history.model_dump_json() + "\n"
+
+            return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+        return await get_bulk_interview_ready_use_case.execute(dto)
+    except ValueError as ve:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(ve))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
 @interview_router.get("/history/{user_id}/{interview_id}", status_code=status.HTTP_200_OK,
                       summary="Get Interview by ID",
                       response_model=InterviewReady)
-async def get_interview_by_id(user_id: str, interview_id: str):
+async def get_interview_by_id(user_id: str, interview_id: str, request: Request, response: Response):
     try:
         interview_ready_repository = InterviewReadyRepository()
         get_interview_ready_by_id_use_case = GetInterviewReadyByIdUseCase(
             interview_ready_repository=interview_ready_repository
         )
 
+        if request.headers.get("if-none-match"):
+            etag = await get_interview_ready_by_id_use_case.etag(user_id=user_id, interview_id=interview_id)
+            if etag and etag_matches(request, etag):
+                return not_modified(etag)
+
         interview = await get_interview_ready_by_id_use_case.execute(
             user_id=user_id,
             interview_id=interview_id
@@ -123,8 +389,7 @@ async def get_interview_by_id(user_id: str, interview_id: str):
         if not interview:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Interview not found")
 
-
-
+        set_etag(response, get_interview_ready_by_id_use_case.etag_for(interview.version, interview.updated_at))
         return interview
     except ValueError as ve:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(ve))
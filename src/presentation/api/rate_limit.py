@@ -0,0 +1,38 @@
+from fastapi import HTTPException, Request, status
+
+from infrastructure.concurrency.rate_limiter import rate_limiter, retry_after_header
+from infrastructure.config.app_config import config
+
+
+def _user_key(request: Request) -> str:
+    """Identidad autenticada (cabecera que pone el gateway tras validar el token) o, si no hay, la IP.
+
+    Nunca el user_id del cuerpo o la query: lo elige el cliente y rotarlo saltaría el límite.
+    """
+    if config.rate_limit_identity_header:
+        identity = request.headers.get(config.rate_limit_identity_header)
+        if identity:
+            return f"user:{identity}"
+    if config.rate_limit_trust_forwarded_for:
+        # Solo detrás de un proxy propio: el primer salto es el cliente real
+        forwarded = request.headers.get("x-forwarded-for", "").split(",")[0].strip()
+        if forwarded:
+            return f"ip:{forwarded}"
+    return f"ip:{request.client.host if request.client else 'unknown'}"
+
+
+async def enforce_rate_limit(request: Request) -> None:
+    """Dependencia del interview_router: corta con 429 antes de tocar Mongo o el LLM"""
+    if not config.rate_limit_enabled:
+        return
+    route = request.scope.get("route")
+    route_name = getattr(route, "name", None)
+    if route_name not in rate_limiter.rules:
+        return
+    retry_after = await rate_limiter.check(route_name, _user_key(request))
+    if retry_after is not None:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests, please retry later",
+            headers={"Retry-After": retry_after_header(retry_after)}
+        )
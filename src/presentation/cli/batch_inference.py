@@ -0,0 +1,63 @@
+"""Ejecuta un fichero de prompts (JSONL) en modo batch, fuera de la capacidad interactiva.
+
+Cada línea: {"custom_id": "...", "operation": "generate_complete_feedback", "prompt": "...",
+             "write_back": {"collection": "interview_ready",
+                            "filter": {"_id": {"$oid": "..."}, "userId": "..."},
+                            "field": "feedback", "parser": "feedback"}}
+
+Uso (con PYTHONPATH=src):
+    python -m presentation.cli.batch_inference jobs/regenerate.jsonl --mode provider
+    python -m presentation.cli.batch_inference jobs/regenerate.jsonl --mode throttled --no-write-back
+Relanzar el mismo comando reanuda desde el checkpoint.
+"""
+import argparse
+import asyncio
+import logging
+
+from dotenv import load_dotenv
+
+from application.services.batch_inference_job import BatchInferenceJob
+from infrastructure.config.app_config import config
+from infrastructure.database.batch_result_writer import BatchResultWriter
+from infrastructure.database.mongo_connection import mongo_connection
+from infrastructure.external_services.batch_llm import create_batch_executor
+
+logger = logging.getLogger(__name__)
+
+
+async def main(job_path: str, mode: str, output_path: str, checkpoint_path: str, chunk_size: int, write_back: bool):
+    await mongo_connection.connect()
+    try:
+        job = BatchInferenceJob(
+            executor=create_batch_executor(mode),
+            writer=BatchResultWriter(config.batch_write_back_collections) if write_back else None,
+            checkpoint_path=checkpoint_path,
+            output_path=output_path,
+            chunk_size=chunk_size
+        )
+        checkpoint = await job.run(job_path)
+        logger.info("Batch job finished: %s", checkpoint.model_dump())
+    finally:
+        await mongo_connection.disconnect()
+
+
+if __name__ == "__main__":
+    load_dotenv()
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Run a JSONL file of LLM prompts as an offline batch job")
+    parser.add_argument("job", help="JSONL job file")
+    parser.add_argument("--mode", choices=["provider", "throttled"], default=config.batch_llm_mode,
+                        help="provider: the provider's batch API; throttled: rate-limited direct calls")
+    parser.add_argument("--output", default=None, help="Results JSONL (default: <job>.results.jsonl)")
+    parser.add_argument("--checkpoint", default=None, help="Checkpoint file (default: <job>.checkpoint.json)")
+    parser.add_argument("--chunk-size", type=int, default=config.batch_chunk_size, help="Prompts per submitted batch")
+    parser.add_argument("--no-write-back", action="store_true", help="Only write the results file")
+    args = parser.parse_args()
+    asyncio.run(main(
+        args.job,
+        args.mode,
+        args.output or f"{args.job}.results.jsonl",
+        args.checkpoint or f"{args.job}.checkpoint.json",
+        args.chunk_size,
+        not args.no_write_back
+    ))
@@ -0,0 +1,82 @@
+"""Exportación masiva de interview_ready a NDJSON o Parquet (una fila por pregunta).
+
+Uso (con PYTHONPATH=src):
+    python -m presentation.cli.export_interviews --format ndjson --output interviews.ndjson \
+        --from 2025-01-01 --to 2025-02-01 --status completed
+    python -m presentation.cli.export_interviews --format parquet --output export_dir --resume
+
+El último _id exportado se guarda en <output>.checkpoint después de cada lote; con
+--resume la exportación continúa desde ahí. Un corte entre la escritura de un lote
+y su checkpoint puede repetir ese lote en NDJSON (entrega al menos una vez).
+Sin --resume, una exportación Parquet a un directorio que ya tiene partes se rechaza.
+"""
+import argparse
+import asyncio
+import logging
+from datetime import datetime, timezone
+
+from bson import ObjectId
+from dotenv import load_dotenv
+
+from application.use_cases.export_interviews_use_case import ExportInterviewsUseCase
+from domain.entities.interview_ready import INTERVIEW_STATUSES
+from domain.repositories.interview_ready_repository import InterviewReadyRepository
+from infrastructure.database.mongo_connection import mongo_connection
+from infrastructure.export.interview_export_writer import (
+    create_export_writer,
+    read_checkpoint,
+    write_checkpoint,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def parse_date(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+async def main(args):
+    checkpoint_path = args.checkpoint or f"{args.output.rstrip('/')}.checkpoint"
+    after_id = None
+    if args.resume:
+        last_id = read_checkpoint(checkpoint_path)
+        if last_id:
+            after_id = ObjectId(last_id)
+            logger.info("Resuming export after _id %s", last_id)
+
+    writer = create_export_writer(args.format, args.output, append=after_id is not None)
+    await mongo_connection.connect()
+    try:
+        use_case = ExportInterviewsUseCase(
+            interview_ready_repository=InterviewReadyRepository(),
+            writer=writer
+        )
+        result = await use_case.execute(
+            init_from=parse_date(args.date_from) if args.date_from else None,
+            init_to=parse_date(args.date_to) if args.date_to else None,
+            interview_type=args.type,
+            status=args.status,
+            after_id=after_id,
+            batch_size=args.batch_size,
+            on_checkpoint=lambda last: write_checkpoint(checkpoint_path, last)
+        )
+        logger.info("Export finished: %s", result)
+    finally:
+        await mongo_connection.disconnect()
+
+
+if __name__ == "__main__":
+    load_dotenv()
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Stream the interview_ready collection to NDJSON or Parquet")
+    parser.add_argument("--format", choices=["ndjson", "parquet"], default="ndjson")
+    parser.add_argument("--output", required=True, help="NDJSON file or Parquet directory")
+    parser.add_argument("--from", dest="date_from", help="init_at lower bound (inclusive), ISO date")
+    parser.add_argument("--to", dest="date_to", help="init_at upper bound (exclusive), ISO date")
+    parser.add_argument("--type", choices=["behavioral", "structured", "technical", "simulation"])
+    parser.add_argument("--status", choices=INTERVIEW_STATUSES)
+    parser.add_argument("--batch-size", type=int, default=1000, help="Interviews per cursor batch and per write")
+    parser.add_argument("--checkpoint", help="Checkpoint file (default: <output>.checkpoint)")
+    parser.add_argument("--resume", action="store_true", help="Continue after the last checkpointed _id")
+    asyncio.run(main(parser.parse_args()))
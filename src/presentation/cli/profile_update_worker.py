@@ -0,0 +1,73 @@
+"""Worker de la cola profile_updates: precalcula sets de preguntas para el nuevo perfil.
+
+Uso (con PYTHONPATH=src):
+    python -m presentation.cli.profile_update_worker
+"""
+import asyncio
+import logging
+import signal
+from typing import Any, Dict
+
+from dotenv import load_dotenv
+from pydantic import ValidationError
+
+from application.dto.profile_update_message_dto import ProfileUpdateMessageDto
+from application.use_cases.precompute_interview_questions_use_case import PrecomputeInterviewQuestionsUseCase
+from domain.repositories.precomputed_question_set_repository import PrecomputedQuestionSetRepository
+from infrastructure.config.app_config import config
+from infrastructure.database.mongo_connection import mongo_connection
+from infrastructure.external_services.interview_llm import LLMBudgetExceededError
+from infrastructure.external_services.llm_router import get_interview_llm
+from infrastructure.messaging.profile_update_consumer import PoisonMessageError, ProfileUpdateConsumer
+from infrastructure.observability.logging_setup import setup_logging, shutdown_logging
+
+logger = logging.getLogger(__name__)
+
+
+async def main():
+    await mongo_connection.connect()
+    use_case = PrecomputeInterviewQuestionsUseCase(
+        precomputed_question_set_repository=PrecomputedQuestionSetRepository(),
+        interview_llm=get_interview_llm(),
+        targets=config.precompute_targets,
+        max_pending=config.precompute_max_pending_per_user,
+        ttl_hours=config.precompute_ttl_hours
+    )
+
+    async def handle(payload: Dict[str, Any]) -> None:
+        try:
+            profile = ProfileUpdateMessageDto.model_validate(payload)
+        except ValidationError as ve:
+            raise PoisonMessageError(str(ve)) from ve
+        try:
+            await use_case.execute(profile)
+        except LLMBudgetExceededError as be:
+            # Sin presupuesto hoy: el usuario generará su entrevista bajo demanda
+            logger.info("Precompute skipped: %s", be, extra={"user_id": profile.user_id})
+
+    consumer = ProfileUpdateConsumer(
+        handler=handle,
+        queue_name=config.profile_queue_name,
+        dead_letter_queue_name=config.profile_dead_letter_queue_name,
+        prefetch=config.precompute_prefetch,
+        max_retries=config.precompute_max_retries
+    )
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+    try:
+        await consumer.start()
+        await stop.wait()
+    finally:
+        await consumer.stop()
+        await mongo_connection.disconnect()
+
+
+if __name__ == "__main__":
+    load_dotenv()
+    setup_logging()
+    try:
+        asyncio.run(main())
+    finally:
+        shutdown_logging()
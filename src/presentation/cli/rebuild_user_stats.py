@@ -0,0 +1,39 @@
+"""Backfill de user_interview_stats.
+
+Uso (con PYTHONPATH=src):
+    python -m presentation.cli.rebuild_user_stats --batch-size 500
+"""
+import argparse
+import asyncio
+import logging
+
+from dotenv import load_dotenv
+
+from application.use_cases.rebuild_user_interview_stats_use_case import RebuildUserInterviewStatsUseCase
+from domain.repositories.interview_ready_repository import InterviewReadyRepository
+from domain.repositories.user_interview_stats_repository import UserInterviewStatsRepository
+from infrastructure.database.mongo_connection import mongo_connection
+
+logger = logging.getLogger(__name__)
+
+
+async def main(batch_size: int):
+    await mongo_connection.connect()
+    try:
+        use_case = RebuildUserInterviewStatsUseCase(
+            interview_ready_repository=InterviewReadyRepository(),
+            user_interview_stats_repository=UserInterviewStatsRepository()
+        )
+        result = await use_case.execute(batch_size=batch_size)
+        logger.info("user_interview_stats rebuilt: %s", result)
+    finally:
+        await mongo_connection.disconnect()
+
+
+if __name__ == "__main__":
+    load_dotenv()
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Rebuild the user_interview_stats rollup from interview history")
+    parser.add_argument("--batch-size", type=int, default=500, help="Users per bulk write and cursor batch size")
+    args = parser.parse_args()
+    asyncio.run(main(args.batch_size))
@@ -0,0 +1,64 @@
+"""Recalcula el feedback histórico con la rúbrica actual.
+
+Uso (con PYTHONPATH=src):
+    python -m presentation.cli.rescore_interviews --dry-run --limit 200
+    python -m presentation.cli.rescore_interviews --concurrency 16 --workers 4
+Relanzar el mismo comando reanuda desde el checkpoint. Después conviene reconstruir el
+rollup de estadísticas (presentation.cli.rebuild_user_stats), que suma las notas antiguas.
+"""
+import argparse
+import asyncio
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from dotenv import load_dotenv
+
+from application.use_cases.rescore_interviews_use_case import RescoreInterviewsUseCase
+from domain.repositories.interview_ready_repository import InterviewReadyRepository
+from domain.services.scoring_engine import ScoringEngine
+from infrastructure.config.app_config import config
+from infrastructure.database.mongo_connection import mongo_connection
+from infrastructure.external_services.llm_router import create_backend
+
+logger = logging.getLogger(__name__)
+
+
+async def main(args):
+    await mongo_connection.connect()
+    try:
+        with ProcessPoolExecutor(max_workers=args.workers) as parse_pool:
+            use_case = RescoreInterviewsUseCase(
+                interview_ready_repository=InterviewReadyRepository(),
+                # Backend propio, como los trabajos batch: no compite con el servicio interactivo
+                interview_llm=create_backend(config.batch_llm_backend),
+                parse_executor=parse_pool,
+                concurrency=args.concurrency,
+                batch_size=args.batch_size,
+                checkpoint_path=args.checkpoint,
+                dry_run=args.dry_run,
+                scoring_engine=ScoringEngine() if config.deterministic_scoring_enabled else None
+            )
+            report = await use_case.execute(
+                completed_before=datetime.fromisoformat(args.completed_before) if args.completed_before else None,
+                interview_type=args.type,
+                limit=args.limit
+            )
+        logger.info("Rescoring %s: %s", "dry run" if args.dry_run else "finished", report.model_dump())
+    finally:
+        await mongo_connection.disconnect()
+
+
+if __name__ == "__main__":
+    load_dotenv()
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Regenerate feedback and points of completed interviews")
+    parser.add_argument("--concurrency", type=int, default=config.batch_concurrency, help="Concurrent LLM calls")
+    parser.add_argument("--workers", type=int, default=2, help="Processes that parse and validate results")
+    parser.add_argument("--batch-size", type=int, default=200, help="Interviews per bulk write and checkpoint")
+    parser.add_argument("--checkpoint", default="rescore.checkpoint.json", help="Checkpoint file")
+    parser.add_argument("--completed-before", default=None, help="Only interviews completed before this ISO date")
+    parser.add_argument("--type", default=None, help="Only this interview type")
+    parser.add_argument("--limit", type=int, default=None, help="Stop after this many interviews")
+    parser.add_argument("--dry-run", action="store_true", help="Call the LLM and parse, but write nothing; report throughput")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,108 @@
+"""Compara consultas dirigidas a un shard frente a las que se envían a todos.
+
+Contra un mongos (ver docker-compose.sharded.yml). Para cada consulta del repositorio
+usa explain para contar los shards a los que va y mide la latencia media.
+
+Uso (con PYTHONPATH=src):
+    python -m presentation.cli.shard_query_benchmark --seed-users 200 --samples 50
+"""
+import argparse
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+from dotenv import load_dotenv
+
+from domain.entities.interview_ready import InterviewReady, Question
+from domain.repositories.interview_ready_repository import InterviewReadyRepository
+from infrastructure.database.mongo_connection import mongo_connection
+
+logger = logging.getLogger(__name__)
+
+
+def shards_targeted(explain: Dict[str, Any]) -> int:
+    # aggregate en mongos: {"shards": {nombre: plan}}; find: queryPlanner.winningPlan.shards = [...]
+    if isinstance(explain.get("shards"), dict):
+        return len(explain["shards"])
+    plan = explain.get("queryPlanner", {}).get("winningPlan", {})
+    if isinstance(plan.get("shards"), list):
+        return len(plan["shards"])
+    # Replica set sin sharding
+    return 1
+
+
+async def seed(users: int, per_user: int) -> None:
+    now = datetime.now(timezone.utc)
+    documents = []
+    for u in range(users):
+        for i in range(per_user):
+            documents.append(InterviewReady(
+                userId=f"bench-user-{u}",
+                type="behavioral",
+                user_seniority="mid",
+                user_specialization="backend",
+                questions=[Question(id=1, question="Tell me about a conflict", competency="teamwork")],
+                question_number=5,
+                status="completed",
+                init_at=now - timedelta(days=i),
+                updated_at=now - timedelta(days=i),
+            ))
+    await InterviewReady.insert_many(documents)
+    logger.info("Seeded %d interviews", len(documents))
+
+
+async def measure(name: str, explain_cmd: Dict[str, Any], run, samples: int, results: List[Dict]) -> None:
+    database = InterviewReady.get_motor_collection().database
+    explain = await database.command("explain", explain_cmd, verbosity="queryPlanner")
+    started = time.perf_counter()
+    for _ in range(samples):
+        await run()
+    elapsed_ms = (time.perf_counter() - started) * 1000 / samples
+    results.append({"query": name, "shards": shards_targeted(explain), "avg_ms": round(elapsed_ms, 2)})
+
+
+async def main(seed_users: int, per_user: int, samples: int):
+    await mongo_connection.connect()
+    try:
+        if seed_users:
+            await seed(seed_users, per_user)
+        collection = InterviewReady.get_motor_collection()
+        sample = await collection.aggregate([
+            {"$match": {"userId": {"$regex": "^bench-user-"}}},
+            {"$sample": {"size": 1}},
+            {"$project": {"userId": 1}}
+        ]).to_list(length=1)
+        if not sample:
+            raise SystemExit("No benchmark data; run with --seed-users")
+        interview_id, user_id = sample[0]["_id"], sample[0]["userId"]
+        repository = InterviewReadyRepository()
+        name = collection.name
+        history = repository.history_pipeline(user_id, limit=20)
+        results: List[Dict] = []
+
+        await measure("find_by_id (broadcast)", {"find": name, "filter": {"_id": interview_id}},
+                      lambda: repository.find_by_id(str(interview_id)), samples, results)
+        await measure("find_by_id + userId (targeted)", {"find": name, "filter": {"_id": interview_id, "userId": user_id}},
+                      lambda: repository.find_by_id(str(interview_id), user_id), samples, results)
+        await measure("history aggregation", {"aggregate": name, "pipeline": history, "cursor": {}},
+                      lambda: repository.find_all_by_user_id(user_id, limit=20), samples, results)
+        await measure("completed scan (broadcast)", {"find": name, "filter": {"status": "completed"}, "limit": 20},
+                      lambda: collection.find({"status": "completed"}).limit(20).to_list(length=20), samples, results)
+
+        for row in results:
+            logger.info("%-36s shards=%-3d avg_ms=%s", row["query"], row["shards"], row["avg_ms"])
+    finally:
+        await mongo_connection.disconnect()
+
+
+if __name__ == "__main__":
+    load_dotenv()
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Targeted vs broadcast query benchmark for a sharded cluster")
+    parser.add_argument("--seed-users", type=int, default=0, help="Insert interviews for this many synthetic users first")
+    parser.add_argument("--per-user", type=int, default=10, help="Interviews per synthetic user")
+    parser.add_argument("--samples", type=int, default=50, help="Executions per query for the latency average")
+    args = parser.parse_args()
+    asyncio.run(main(args.seed_users, args.per_user, args.samples))
@@ -0,0 +1,50 @@
+"""Pasada manual del barrido: expira entrevistas abandonadas y archiva las completadas antiguas.
+
+Uso (con PYTHONPATH=src):
+    python -m presentation.cli.sweep_interviews --archive-after-days 180 --idle-minutes 1440
+"""
+import argparse
+import asyncio
+import logging
+
+from dotenv import load_dotenv
+
+from application.services.interview_sweeper import InterviewSweeper
+from domain.repositories.interview_ready_repository import InterviewReadyRepository
+from domain.repositories.single_flight_lease_repository import SingleFlightLeaseRepository
+from infrastructure.config.app_config import config
+from infrastructure.database.mongo_connection import mongo_connection
+
+logger = logging.getLogger(__name__)
+
+
+async def main(idle_minutes: int, archive_after_days: int, batch_size: int):
+    await mongo_connection.connect()
+    try:
+        interview_ready_repository = InterviewReadyRepository()
+        await interview_ready_repository.ensure_archive_indexes()
+        sweeper = InterviewSweeper(
+            interview_ready_repository=interview_ready_repository,
+            lease_repository=SingleFlightLeaseRepository(),
+            idle_minutes=idle_minutes,
+            archive_after_days=archive_after_days,
+            batch_size=batch_size
+        )
+        result = await sweeper.run_once()
+        logger.info("Sweep result: %s", result)
+    finally:
+        await mongo_connection.disconnect()
+
+
+if __name__ == "__main__":
+    load_dotenv()
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Expire abandoned interviews and archive old completed ones")
+    parser.add_argument("--idle-minutes", type=int, default=config.interview_idle_expiry_minutes,
+                        help="Expire in-progress interviews idle for this long (0 = skip)")
+    parser.add_argument("--archive-after-days", type=int, default=config.interview_archive_after_days,
+                        help="Archive completed interviews unchanged for this many days (0 = skip)")
+    parser.add_argument("--batch-size", type=int, default=config.interview_archive_batch_size,
+                        help="Interviews per bulk write")
+    args = parser.parse_args()
+    asyncio.run(main(args.idle_minutes, args.archive_after_days, args.batch_size))